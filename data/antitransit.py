@@ -1,9 +1,257 @@
-from skyfield import almanac
-from math import pi
+"""Meridian, anti-meridian and horizon crossings from one hour-angle pass.
 
-def _antitransit_ha(latitude, declination, altitude_radians):
+Skyfield's find_transits, find_risings and find_settings (and a separate
+antitransit search) each sample the target over the whole window and then
+refine their own candidates, so asking for several event types repeats the
+same ephemeris evaluations. find_meridian_events samples the target once,
+brackets every requested event type from the same hour angles and refines all
+candidates together, so each Newton step is a single evaluation whatever the
+number of event types. Only public Skyfield APIs are used: positions are
+rotated into the ITRS with the truncated IAU 2000B nutation that Skyfield's
+own almanac searches use, built from skyfield.nutationlib rather than through
+Time's full IAU 2000A nutation.
+
+The search follows Skyfield's: samples 0.8 days apart, bracketing by how far
+the sky must turn to bring the target to each event's hour angle, then three
+Newton steps on the hour angle. Risings and settings then get Skyfield's
+final step for targets that barely graze the horizon at high latitude: a
+curve through the altitude and its rate at the last two times is solved for
+the horizon crossing.
+
+Usage:
+    events = find_meridian_events(observer, moon, t0, t1)
+    transits, antitransits = events['transit'], events['antitransit']
+    times = find_antitransits(observer, sun, t0, t1)
+"""
+
+import operator
+from functools import reduce
+from math import pi, tau
+from typing import Callable, Dict, Optional, Sequence, Tuple
+import numpy as np
+from skyfield.almanac import build_horizon_function
+from skyfield.constants import ASEC2RAD
+from skyfield.framelib import ICRS_to_J2000
+from skyfield.functions import mxm, mxmxm, rot_z
+from skyfield.nutationlib import (build_nutation_matrix, equation_of_the_equinoxes_complimentary_terms,
+                                  iau2000b_radians, mean_obliquity)
+from skyfield.precessionlib import compute_precession
+from skyfield.units import Distance
+
+SAMPLE_DAYS = 0.8
+_MICROSECOND_DAYS = 1e-6 / 86400
+# Step for the finite-difference altitude rate of the final horizon step
+_RATE_STEP_DAYS = 1.0 / 86400
+# The horizon step may not move an event further than this from the last two Newton times
+_CLIP_LOWER = -1.0
+_CLIP_UPPER = 2.0
+HORIZON_EVENTS = ('rise', 'set')
+
+def transit_ha(latitude, declination, altitude_radians):
+    """Return hour angle for transit (meridian crossing)."""
+    return np.zeros_like(declination)
+
+def antitransit_ha(latitude, declination, altitude_radians):
     """Return hour angle for antitransit (opposite meridian crossing)."""
-    return pi
+    return np.full_like(declination, pi)
+
+def setting_ha(latitude, declination, altitude_radians):
+    """Return hour angle at which a target at this declination sets."""
+    numerator = np.sin(altitude_radians) - np.sin(latitude) * np.sin(declination)
+    denominator = np.cos(latitude) * np.cos(declination)
+    return np.arccos(np.clip(numerator / denominator, -1.0, 1.0))
+
+def rising_ha(latitude, declination, altitude_radians):
+    """Return hour angle at which a target at this declination rises."""
+    return -setting_ha(latitude, declination, altitude_radians)
+
+# Event type -> hour angle the search drives the target to
+EVENT_HOUR_ANGLES = {
+    'transit': transit_ha,
+    'antitransit': antitransit_ha,
+    'rise': rising_ha,
+    'set': setting_ha,
+}
+MERIDIAN_EVENTS = ('transit', 'antitransit')
+
+def _altitude(latitude, ha, dec):
+    """Return altitude in radians of a target at this hour angle and declination."""
+    return np.arcsin(np.sin(latitude) * np.sin(dec) + np.cos(latitude) * np.cos(dec) * np.cos(ha))
+
+def _intersection(y0, y1, v0, v1):
+    """Return x at which a curve reaches y = 0, given y0, v0 at x = 0 and y1, v1 at x = 1.
+    
+    The same quadratic solution as skyfield.almanac uses for its final
+    rising and setting step.
+    """
+    sign = 1 - 2 * (y0 > y1)
+    a, b, c = y1 - y0 - v0, v0, y0
+    discriminant = np.maximum(b * b - 4 * a * c, 0.0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        x = -2 * c / (b + sign * np.sqrt(discriminant))
+    return np.where(c == 0.0, 0.0, x)
+
+def itrs_rotation(t) -> np.ndarray:
+    """ICRS to ITRS rotation matrices, shape (3, 3, ...), with IAU 2000B nutation.
+    
+    The same matrix as skyfield.framelib.itrs.rotation_at(t), except that the
+    nutation angles come from the truncated IAU 2000B series, which is over ten
+    times cheaper to evaluate than the IAU 2000A series Time uses by default.
+    """
+    d_psi, d_eps = iau2000b_radians(t)
+    mean_epsilon = mean_obliquity(t.tdb) * ASEC2RAD
+    nutation = build_nutation_matrix(mean_epsilon, mean_epsilon + d_eps, d_psi)
+    equation_of_equinoxes = d_psi * np.cos(mean_epsilon) + equation_of_the_equinoxes_complimentary_terms(t.tt)
+    gast = (t.gmst + equation_of_equinoxes / tau * 24.0) % 24.0
+    rotation = mxm(rot_z(-gast * tau / 24.0), mxmxm(nutation, compute_precession(t.tdb), ICRS_to_J2000))
+    if t.ts.polar_motion_table is not None:
+        rotation = mxm(t.polar_motion_matrix(), rotation)
+    return rotation
+
+def geocentric_itrs(earth, target, t) -> np.ndarray:
+    """Geocentric apparent position of a target rotated into ITRS, in au, shape (3, ...)."""
+    apparent = earth.at(t).observe(target).apparent(())
+    return np.einsum('ij...,j...->i...', itrs_rotation(t), apparent.position.au)
+
+def topocentric_hadec(v: np.ndarray, longitude) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Hour angle, declination (radians) and distance (au) of topocentric ITRS vectors (3, ...)."""
+    distance = np.linalg.norm(v, axis=0)
+    return longitude - np.arctan2(v[1], v[0]), np.arcsin(v[2] / distance), distance
+
+def solve_hour_angle_events(start_time, end_time, hadec: Callable, latitude: np.ndarray,
+                            event_types: Sequence[str]) -> Dict[str, Tuple[np.ndarray, object]]:
+    """Find hour-angle events of a target for one or more observers.
+    
+    Args:
+        start_time: Skyfield Time at which the search starts
+        end_time: Skyfield Time at which the search ends
+        hadec: Callable (t, track) returning (hour angle, declination, horizon
+               altitude) in radians. With track None, t is the sample grid and
+               the arrays have shape (n_tracks, len(t)); otherwise track is an
+               observer index per entry of t and the arrays match t.
+        latitude: Observer latitude in radians per track, shape (n_tracks,)
+        event_types: Names from EVENT_HOUR_ANGLES
+        
+    Returns:
+        Dict of event type -> (track index per event, Time of each event)
+    """
+    ts = start_time.ts
+    # Days since start_time, so the microsecond minimum step survives float64
+    def at_days(days):
+        return ts.tt_jd(start_time.whole, start_time.tt_fraction + days)
+    
+    latitude = np.asarray(latitude, dtype=np.float64).reshape(-1)
+    span = end_time.tt - start_time.tt
+    days = np.linspace(0.0, span, int(np.ceil(span / SAMPLE_DAYS)) + 1)
+    ha, dec, altitude = hadec(at_days(days), None)
+    ha = np.reshape(ha, (len(latitude), len(days)))
+    dec = np.reshape(dec, ha.shape)
+    altitude = np.broadcast_to(altitude, ha.shape)
+    
+    # Bracket every event type from the same samples: keep the last sample
+    # before the sky has turned the target past each desired hour angle
+    tracks, kinds, old_ha, old_days, event_days = [], [], [], [], []
+    for kind, event_type in enumerate(event_types):
+        desired = EVENT_HOUR_ANGLES[event_type](latitude[:, None], dec, altitude)
+        difference = (desired - ha) % tau
+        track, i = np.nonzero(np.diff(difference, axis=1) > 0.0)
+        a = difference[track, i]
+        b = tau - difference[track, i + 1]
+        tracks.append(track)
+        kinds.append(np.full(len(i), kind))
+        old_ha.append(ha[track, i])
+        old_days.append(days[i])
+        event_days.append((b * days[i] + a * days[i + 1]) / (a + b))
+    track, kind, old_ha, old_days, event_days = map(np.concatenate, (tracks, kinds, old_ha, old_days, event_days))
+    
+    # Newton steps on the hour angle, refining all candidates in one evaluation
+    if len(event_days):
+        wrap = lambda radians: radians % tau
+        for step in 0, 1, 2:
+            ha, dec, altitude = hadec(at_days(event_days), track)
+            altitude = np.broadcast_to(altitude, np.shape(ha))
+            desired = np.empty_like(ha)
+            for k, event_type in enumerate(event_types):
+                mask = kind == k
+                desired[mask] = EVENT_HOUR_ANGLES[event_type](latitude[track[mask]], dec[mask], altitude[mask])
+            ha_adjustment = (desired - ha + pi) % tau - pi
+            # After two steps keep the same rate, in case the step gets too small to measure
+            if step < 2:
+                ha_per_day = wrap(ha - old_ha) / (event_days - old_days)
+            old_ha, old_days = ha, event_days
+            timebump = ha_adjustment / ha_per_day
+            timebump[timebump == 0.0] = _MICROSECOND_DAYS
+            event_days = event_days + timebump
+            wrap = lambda radians: (radians + pi) % tau - pi
+        
+        # Where a target barely grazes the horizon the hour-angle steps can stall
+        # between two solutions, so solve the altitude curve through the last two
+        # times for the crossing, as find_risings and find_settings do
+        horizon_kinds = [k for k, event_type in enumerate(event_types) if event_type in HORIZON_EVENTS]
+        graze = np.nonzero(np.isin(kind, horizon_kinds))[0]
+        if len(graze):
+            n = len(graze)
+            days0, days1 = old_days[graze], event_days[graze]
+            y0 = _altitude(latitude[track[graze]], ha[graze], dec[graze]) - altitude[graze]
+            ha_step, dec_step, altitude_step = hadec(
+                at_days(np.concatenate((days1, days0 + _RATE_STEP_DAYS, days1 + _RATE_STEP_DAYS))),
+                np.tile(track[graze], 3)
+            )
+            y = _altitude(latitude[np.tile(track[graze], 3)], ha_step, dec_step) - np.broadcast_to(altitude_step, np.shape(ha_step))
+            y1, y0_step, y1_step = y[:n], y[n:2 * n], y[2 * n:]
+            day_diff = days1 - days0
+            offset = _intersection(
+                y0, y1,
+                (y0_step - y0) / _RATE_STEP_DAYS * day_diff,
+                (y1_step - y1) / _RATE_STEP_DAYS * day_diff,
+            )
+            event_days[graze] = days0 + np.clip(offset, _CLIP_LOWER, _CLIP_UPPER) * day_diff
+    
+    results = {}
+    for k, event_type in enumerate(event_types):
+        mask = kind == k
+        results[event_type] = (track[mask], at_days(event_days[mask]))
+    return results
+
+def find_meridian_events(observer, target, start_time, end_time,
+                         event_types: Sequence[str] = MERIDIAN_EVENTS,
+                         horizon_degrees: Optional[float] = None) -> Dict[str, object]:
+    """
+    Returns times of several hour-angle events of a target from one search.
+    
+    Args:
+        observer: Earth + topocentric location (a wgs84 GeographicPosition)
+        target: Body from the ephemeris
+        start_time: Skyfield Time at which the search starts
+        end_time: Skyfield Time at which the search ends
+        event_types: Any of 'transit', 'antitransit', 'rise', 'set'
+        horizon_degrees: Horizon altitude for rise/set (default: the body's
+                         apparent horizon including refraction and radius)
+    
+    Returns:
+        Dict of event type -> Time array of events in time order
+    
+    Example usage:
+    ts = load.timescale()
+    t0 = ts.utc(2023, 1, 1)
+    t1 = ts.utc(2023, 1, 8)
+    events = find_meridian_events(observer, moon, t0, t1, ('transit', 'antitransit', 'rise', 'set'))
+    """
+    # Split the observer into the Earth and the site on its surface
+    site = observer.vector_functions[-1]
+    earth = reduce(operator.add, observer.vector_functions[:-1])
+    site_xyz = site.itrs_xyz.au[:, None]
+    if horizon_degrees is None:
+        horizon = build_horizon_function(target)
+    else:
+        horizon = lambda distance: horizon_degrees / 360.0 * tau
+    
+    def hadec(t, track):
+        ha, dec, distance = topocentric_hadec(geocentric_itrs(earth, target, t) - site_xyz, site.longitude.radians)
+        return ha, dec, horizon(Distance(au=distance))
+    
+    found = solve_hour_angle_events(start_time, end_time, hadec, np.array([site.latitude.radians]), event_types)
+    return {event_type: times for event_type, (_, times) in found.items()}
 
 def find_antitransits(observer, target, start_time, end_time):
     """
@@ -15,5 +263,4 @@ def find_antitransits(observer, target, start_time, end_time):
     t1 = ts.utc(2023, 1, 8)
     times = find_antitransits(observer, sun, t0, t1)
     """
-    times, _ = almanac._find(observer, target, start_time, end_time, 0.0, _antitransit_ha)
-    return times
+    return find_meridian_events(observer, target, start_time, end_time, ('antitransit',))['antitransit']
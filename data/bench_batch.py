@@ -0,0 +1,80 @@
+"""Scaling benchmark for solar_to_lunisolar_batch.
+
+Times live-path (use_table=False) batches of consecutive days of increasing
+size and checks that the cost per date does not grow with the batch size, i.e.
+that a batch scales linearly. Each batch covers its own range of years, so
+every size starts with a cold anchor cache and pays for its ephemeris windows.
+
+Usage:
+    python bench_batch.py
+    python bench_batch.py --sizes 365 730 1460 2920 --slack 1.5
+
+Exits with status 1 if the per-date cost of any batch exceeds slack times the
+per-date cost of the smallest batch.
+"""
+
+import argparse
+import sys
+import time
+from datetime import date, timedelta
+from typing import List, Tuple
+from lunisolar_v2 import solar_to_lunisolar_batch
+from search_cache import get_search_cache
+
+
+def build_batch(start: date, days: int) -> List[Tuple[str, str]]:
+    """(date_str, time_str) inputs for consecutive days at noon."""
+    return [((start + timedelta(days=i)).strftime('%Y-%m-%d'), '12:00') for i in range(days)]
+
+
+def time_batch(batch: List[Tuple[str, str]], timezone_name: str) -> float:
+    """Wall time in seconds of one live-path batch conversion."""
+    started = time.perf_counter()
+    results = solar_to_lunisolar_batch(batch, timezone_name, use_table=False)
+    elapsed = time.perf_counter() - started
+    if len(results) != len(batch):
+        raise RuntimeError(f"Expected {len(batch)} results, got {len(results)}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark solar_to_lunisolar_batch scaling.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=[365, 730, 1460, 2920],
+                        help='Batch sizes in days, smallest first (default: 365 730 1460 2920)')
+    parser.add_argument('--start-year', type=int, default=1950,
+                        help='First year of the first batch (default: 1950)')
+    parser.add_argument('--tz', type=str, default='Asia/Shanghai',
+                        help='IANA timezone name (default: Asia/Shanghai)')
+    parser.add_argument('--slack', type=float, default=1.5,
+                        help='Allowed growth of the per-date cost over the smallest batch (default: 1.5)')
+    parser.add_argument('--search-cache', action='store_true',
+                        help='Keep the on-disk search cache enabled (default: disabled)')
+    args = parser.parse_args()
+
+    sizes = sorted(args.sizes)
+    get_search_cache().enabled = args.search_cache
+
+    # Load the ephemeris and build the converter outside the timed batches
+    time_batch(build_batch(date(args.start_year - 3, 6, 1), 1), args.tz)
+
+    # Start each batch two years after the previous one ends so no anchor is shared
+    start = date(args.start_year, 1, 1)
+    per_date = []
+    print(f"{'dates':>8} {'seconds':>10} {'ms/date':>10}")
+    for size in sizes:
+        elapsed = time_batch(build_batch(start, size), args.tz)
+        per_date.append(elapsed / size)
+        print(f"{size:>8} {elapsed:>10.3f} {1000 * elapsed / size:>10.3f}")
+        start = date(start.year + size // 365 + 2, 1, 1)
+
+    limit = args.slack * per_date[0]
+    failed = [size for size, cost in zip(sizes, per_date) if cost > limit]
+    if failed:
+        print(f"Not linear: per-date cost of batch size(s) {failed} exceeds "
+              f"{args.slack} x {1000 * per_date[0]:.3f} ms")
+        sys.exit(1)
+    print(f"Linear: per-date cost stays within {args.slack} x the smallest batch")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,241 @@
+"""Compact binary event series.
+
+The JSON output is one small file per series and year, which consumers have
+to parse file by file. This module writes the same new moon, full moon and
+solar term series as one binary file per series that can be memory-mapped
+and read without parsing.
+
+File layout (all little-endian):
+    header      32 bytes
+                  magic       4s   b'LSB1'
+                  version     u16  1
+                  flags       u16  bit 0 set when a uint8 value column follows
+                  first_year  i32  UTC year of the first index entry
+                  year_count  u32  number of years in the index
+                  count       u32  number of events
+                  reserved    12 bytes of zeros
+    year index  u32[year_count + 1]  position of each year's first event;
+                                     the last entry equals count
+    offsets     u32[count]  seconds since January 1 00:00 UTC of the event's year
+    values      u8[count]   optional per-event value (solar term index)
+
+Year-relative offsets fit in 32 bits for any range, so 200 years of new moons
+take about 10 KB.
+
+Usage:
+    from binary_series import BinarySeries
+    series = BinarySeries('output/bin/solar_terms.bin')
+    timestamps = series.timestamps(2025)   # int64 Unix seconds
+    terms = series.values(2025)            # uint8 term indices
+"""
+
+import os
+import struct
+import tempfile
+from typing import Dict, Optional, Sequence, Tuple
+import numpy as np
+from utils import read_year_chunks
+
+MAGIC = b'LSB1'
+FORMAT_VERSION = 1
+FLAG_VALUES = 0x1
+_HEADER = struct.Struct('<4sHHiII12x')
+HEADER_SIZE = _HEADER.size
+
+# Series written by export_json_series: (file stem, JSON subdirectory, has values)
+SERIES = (
+    ('new_moons', 'new_moons', False),
+    ('full_moons', 'full_moons', False),
+    ('solar_terms', 'solar_terms', True),
+)
+
+
+def year_start_epochs(first_year: int, year_count: int) -> np.ndarray:
+    """Unix timestamps of January 1 00:00 UTC for consecutive years."""
+    years = np.arange(first_year - 1970, first_year - 1970 + year_count)
+    return years.astype('datetime64[Y]').astype('datetime64[s]').astype(np.int64)
+
+
+def write_binary_series(path: str, timestamps: Sequence[int], values: Optional[Sequence[int]] = None) -> int:
+    """Write an event series to a binary file.
+
+    Args:
+        path: Output file path
+        timestamps: Unix timestamps of the events
+        values: Optional per-event value in 0..255 (e.g. solar term index)
+
+    Returns:
+        Number of events written
+    """
+    timestamps = np.asarray(timestamps, dtype=np.int64)
+    order = np.argsort(timestamps, kind='stable')
+    timestamps = timestamps[order]
+    if values is not None:
+        values = np.asarray(values, dtype=np.int64)[order]
+        if len(values) != len(timestamps):
+            raise ValueError("timestamps and values must have the same length")
+        if len(values) and (values.min() < 0 or values.max() > 255):
+            raise ValueError("values must fit in an unsigned byte")
+
+    if len(timestamps):
+        event_years = timestamps.astype('datetime64[s]').astype('datetime64[Y]').astype(np.int64) + 1970
+        first_year = int(event_years[0])
+        year_count = int(event_years[-1]) - first_year + 1
+    else:
+        event_years = np.zeros(0, dtype=np.int64)
+        first_year, year_count = 1970, 0
+
+    starts = year_start_epochs(first_year, year_count)
+    year_index = np.searchsorted(event_years, np.arange(first_year, first_year + year_count + 1)).astype('<u4')
+    offsets = (timestamps - starts[event_years - first_year]).astype('<u4')
+
+    flags = FLAG_VALUES if values is not None else 0
+    header = _HEADER.pack(MAGIC, FORMAT_VERSION, flags, first_year, year_count, len(timestamps))
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(header)
+            f.write(year_index.tobytes())
+            f.write(offsets.tobytes())
+            if values is not None:
+                f.write(values.astype(np.uint8).tobytes())
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return len(timestamps)
+
+
+class BinarySeries:
+    """Memory-mapped reader for files written by write_binary_series()."""
+
+    def __init__(self, path: str):
+        """
+        Open a binary series file.
+
+        Args:
+            path: File written by write_binary_series()
+
+        Raises:
+            ValueError: If the file is not a supported binary series
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            header = f.read(HEADER_SIZE)
+        if len(header) != HEADER_SIZE:
+            raise ValueError(f"{path}: truncated header")
+        magic, version, flags, first_year, year_count, count = _HEADER.unpack(header)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path}: not a version {FORMAT_VERSION} binary series")
+
+        self.first_year = first_year
+        self.year_count = year_count
+        self.count = count
+        index_offset = HEADER_SIZE
+        data_offset = index_offset + 4 * (year_count + 1)
+        self.year_index = np.memmap(path, dtype='<u4', mode='r', offset=index_offset, shape=(year_count + 1,))
+        self.offsets = np.memmap(path, dtype='<u4', mode='r', offset=data_offset, shape=(count,)) if count else np.zeros(0, '<u4')
+        self._values = None
+        if flags & FLAG_VALUES and count:
+            self._values = np.memmap(path, dtype=np.uint8, mode='r', offset=data_offset + 4 * count, shape=(count,))
+        elif flags & FLAG_VALUES:
+            self._values = np.zeros(0, dtype=np.uint8)
+        self._year_starts = year_start_epochs(first_year, year_count)
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def years(self) -> range:
+        """Years covered by the year index."""
+        return range(self.first_year, self.first_year + self.year_count)
+
+    @property
+    def has_values(self) -> bool:
+        return self._values is not None
+
+    def _span(self, year: Optional[int]) -> Tuple[int, int, int, int]:
+        """(first event, end event, first year row, end year row) for a year or all years."""
+        if year is None:
+            return 0, self.count, 0, self.year_count
+        row = year - self.first_year
+        if row < 0 or row >= self.year_count:
+            return 0, 0, 0, 0
+        return int(self.year_index[row]), int(self.year_index[row + 1]), row, row + 1
+
+    def timestamps(self, year: Optional[int] = None) -> np.ndarray:
+        """Unix timestamps (int64) of all events, or of one UTC year."""
+        lo, hi, row_lo, row_hi = self._span(year)
+        counts = np.diff(self.year_index[row_lo:row_hi + 1].astype(np.int64))
+        return np.repeat(self._year_starts[row_lo:row_hi], counts) + self.offsets[lo:hi]
+
+    def values(self, year: Optional[int] = None) -> np.ndarray:
+        """Per-event values of all events, or of one UTC year."""
+        if self._values is None:
+            raise ValueError(f"{self.path} has no value column")
+        lo, hi, _, _ = self._span(year)
+        return self._values[lo:hi]
+
+
+def binary_is_stale(bin_dir: str, json_dir: str, stems: Sequence[str]) -> bool:
+    """Whether any of the given .bin files is older than its JSON chunks.
+
+    The .bin files are only rewritten by main.py --binary, so a later run
+    without it leaves them behind the JSON they were exported from.
+
+    Args:
+        bin_dir: Directory of the .bin files
+        json_dir: Directory containing the per-series JSON subdirectories
+        stems: File stems from SERIES to check
+
+    Returns:
+        True if a .bin file is missing or a JSON chunk was modified after it
+    """
+    subdirs = {stem: subdir for stem, subdir, _ in SERIES}
+    for stem in stems:
+        try:
+            bin_mtime = os.path.getmtime(os.path.join(bin_dir, f"{stem}.bin"))
+        except OSError:
+            return True
+        directory = os.path.join(json_dir, subdirs[stem])
+        if not os.path.isdir(directory):
+            continue
+        for name in os.listdir(directory):
+            if name.endswith('.json') and name[:-5].isdigit() \
+                    and os.path.getmtime(os.path.join(directory, name)) > bin_mtime:
+                return True
+    return False
+
+
+def export_json_series(json_dir: str, bin_dir: str) -> Dict[str, int]:
+    """Convert the per-year JSON chunks into one binary file per series.
+
+    Args:
+        json_dir: Directory containing new_moons/, full_moons/ and solar_terms/
+        bin_dir: Directory for the .bin files
+
+    Returns:
+        Dict of written file path to event count
+    """
+    written = {}
+    for stem, subdir, has_values in SERIES:
+        directory = os.path.join(json_dir, subdir)
+        if not os.path.isdir(directory):
+            continue
+        timestamps, values = [], []
+        for chunk in read_year_chunks(directory):
+            if has_values:
+                for ts, idx in chunk:
+                    timestamps.append(int(ts))
+                    values.append(int(idx))
+            else:
+                timestamps.extend(int(ts) for ts in chunk)
+        path = os.path.join(bin_dir, f"{stem}.bin")
+        written[path] = write_binary_series(path, timestamps, values if has_values else None)
+    return written
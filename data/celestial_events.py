@@ -2,6 +2,8 @@
 
 This module calculates rise, set, transit, and anti-transit times for
 celestial bodies (Sun, Moon, planets) between specified start and end dates.
+calculate_all_celestial_events_batch does the same for many sites at once,
+computing each body's geocentric position once per time step for all sites.
 
 Usage:
     python celestial_events.py --start-date YYYY-MM-DD --end-date YYYY-MM-DD [--lat LAT] [--lon LON]
@@ -12,16 +14,80 @@ Example:
 """
 
 import argparse
-from datetime import datetime
-from typing import List, Tuple
-from concurrent.futures import ProcessPoolExecutor, as_completed
-from skyfield.api import utc, load, wgs84
-from skyfield import almanac
-from skyfield.almanac import find_transits
-from antitransit import find_antitransits
-from config import EPHEMERIS_FILE, CELESTIAL_BODIES, DEFAULT_LOCATION, NUM_PROCESSES
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Tuple
+from concurrent.futures import as_completed
+import numpy as np
+from skyfield.api import utc, wgs84
+from skyfield.almanac import build_horizon_function
+from skyfield.units import Distance
+from antitransit import (EVENT_HOUR_ANGLES, HORIZON_EVENTS, MERIDIAN_EVENTS, find_meridian_events, geocentric_itrs,
+                         solve_hour_angle_events, topocentric_hadec)
+from config import CELESTIAL_BODIES, CELESTIAL_SHARD_DAYS, CELESTIAL_SHARD_OVERLAP_DAYS, DEFAULT_LOCATION
+from ephemeris import (get_ephemeris, get_timescale, get_worker_pool, time_to_unix, time_to_unix_us,
+                       us_to_unix_seconds)
+from search_cache import get_search_cache
 from utils import setup_logging, write_csv_file
 
+# Bump whenever a change alters the events found, so cached search results are not reused
+CALCULATOR_VERSION = 2
+
+def _cached_event_times(event_types: Tuple[str, ...], params: dict, start_time: datetime, end_time: datetime,
+                        search: Callable[[], Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """Return int64 Unix timestamps per event type, running the search only for types missing from the cache."""
+    cache = get_search_cache()
+    found = {event_type: cache.lookup(EVENT_CACHE_NAMES[event_type], start_time, end_time, params,
+                                 version=CALCULATOR_VERSION)
+             for event_type in event_types}
+    missing = [event_type for event_type, hit in found.items() if hit is None]
+    if missing:
+        times = search()
+        for event_type in missing:
+            times_us = time_to_unix_us(times[event_type])
+            found[event_type] = (times_us, np.zeros(len(times_us), dtype=np.int64))
+            cache.store(EVENT_CACHE_NAMES[event_type], start_time, end_time, *found[event_type],
+                        params=params, version=CALCULATOR_VERSION)
+    return {event_type: us_to_unix_seconds(hit[0]) for event_type, hit in found.items()}
+
+# Search name -> (event types it finds, search returning a Time array per event type).
+# Transits and antitransits share one hour-angle pass, risings and settings
+# another; both use the same solver as the multi-site batch.
+EVENT_SEARCHES = {
+    'meridian': (MERIDIAN_EVENTS, lambda topo, body, t0, t1: find_meridian_events(topo, body, t0, t1, MERIDIAN_EVENTS)),
+    'horizon': (HORIZON_EVENTS, lambda topo, body, t0, t1: find_meridian_events(topo, body, t0, t1, HORIZON_EVENTS)),
+}
+
+# Search cache name per event type
+EVENT_CACHE_NAMES = {'transit': 'transits', 'antitransit': 'antitransits', 'rise': 'risings', 'set': 'settings'}
+
+def calculate_event_times(body_data: Tuple[str, str], search_name: str, start_time: datetime,
+                          end_time: datetime, location_data: Tuple[float, float]) -> Dict[str, np.ndarray]:
+    """Calculate the Unix timestamps of the event types one search finds for a celestial body.
+    
+    Args:
+        body_data: Tuple of (body_name, body_key)
+        search_name: One of EVENT_SEARCHES ('meridian', 'horizon')
+        start_time: Start datetime for calculation
+        end_time: End datetime for calculation
+        location_data: Tuple of (latitude, longitude)
+        
+    Returns:
+        Dict of event type -> int64 unix timestamps (cached per kernel, body, location and range)
+    """
+    lat, lon = location_data
+    ts = get_timescale()
+    eph = get_ephemeris()
+    topo = eph['earth'] + wgs84.latlon(lat, lon)
+    _, body_key = body_data
+    body = eph[body_key]
+    t0 = ts.from_datetime(start_time)
+    t1 = ts.from_datetime(end_time)
+    
+    event_types, search = EVENT_SEARCHES[search_name]
+    params = {'body': body_key, 'lat': lat, 'lon': lon}
+    return _cached_event_times(event_types, params, start_time, end_time,
+                               lambda: search(topo, body, t0, t1))
+
 def calculate_body_events(body_data: Tuple[str, str], start_time: datetime, end_time: datetime, 
                          location_data: Tuple[float, float]) -> Tuple[str, List[Tuple[int, str, str]], int]:
     """Calculate rise, set, transit, and antitransit events for a celestial body.
@@ -35,61 +101,160 @@ def calculate_body_events(body_data: Tuple[str, str], start_time: datetime, end_
     Returns:
         Tuple of (body_name, list of events with unix timestamps, event count)
     """
-    logger = setup_logging()
+    logger = setup_logging(__name__)
     try:
-        lat, lon = location_data
-        ts = load.timescale()
-        eph = load(EPHEMERIS_FILE)
-        topo = eph['earth'] + wgs84.latlon(lat, lon)
-        body_name, body_key = body_data
-        body = eph[body_key]
-        t0 = ts.from_datetime(start_time)
-        t1 = ts.from_datetime(end_time)
-        
-        # Calculate different event types
-        transit_times = find_transits(topo, body, t0, t1)
-        antitransit_times = find_antitransits(topo, body, t0, t1)
-        rise_times, _ = almanac.find_risings(topo, body, t0, t1)
-        set_times, _ = almanac.find_settings(topo, body, t0, t1)
-        
+        body_name = body_data[0]
         results = []
-        
-        # Process transit events
-        for t in transit_times:
-            dt_obj = t.utc_datetime()
-            unix_timestamp = int(dt_obj.timestamp())
-            results.append((unix_timestamp, body_name, 'transit'))
-            
-        # Process antitransit events
-        for t in antitransit_times:
-            dt_obj = t.utc_datetime()
-            unix_timestamp = int(dt_obj.timestamp())
-            results.append((unix_timestamp, body_name, 'antitransit'))
-            
-        # Process rise events
-        for t in rise_times:
-            dt_obj = t.utc_datetime()
-            unix_timestamp = int(dt_obj.timestamp())
-            results.append((unix_timestamp, body_name, 'rise'))
-            
-        # Process set events
-        for t in set_times:
-            dt_obj = t.utc_datetime()
-            unix_timestamp = int(dt_obj.timestamp())
-            results.append((unix_timestamp, body_name, 'set'))
+        for search_name in EVENT_SEARCHES:
+            found = calculate_event_times(body_data, search_name, start_time, end_time, location_data)
+            for event_type, event_times in found.items():
+                results.extend((unix_timestamp, body_name, event_type) for unix_timestamp in event_times.tolist())
             
         return body_name, results, len(results)
     except Exception as e:
         logger.error(f"Error calculating events for {body_data[0]}: {e}")
         return body_data[0], [], 0
-    finally:
-        if 'eph' in locals():
-            del eph
+
+def plan_event_shards(start_time: datetime, end_time: datetime,
+                      shard_days: int = CELESTIAL_SHARD_DAYS) -> List[Tuple[datetime, datetime, int, int]]:
+    """Split [start_time, end_time] into shards of shard_days.
+    
+    Args:
+        start_time: Start of the requested range (UTC)
+        end_time: End of the requested range (UTC)
+        shard_days: Length of each shard in days
+        
+    Returns:
+        List of (search_start, search_end, lo, hi) where the search window includes
+        CELESTIAL_SHARD_OVERLAP_DAYS on interior edges and [lo, hi) is the Unix
+        timestamp range the shard owns
+    """
+    overlap = timedelta(days=CELESTIAL_SHARD_OVERLAP_DAYS)
+    end_ts = int(end_time.timestamp())
+    shards = []
+    core_start = start_time
+    while True:
+        core_end = core_start + timedelta(days=max(1, shard_days))
+        if core_end >= end_time:
+            shards.append((max(start_time, core_start - overlap), end_time, int(core_start.timestamp()), end_ts + 1))
+            return shards
+        shards.append((max(start_time, core_start - overlap), core_end + overlap,
+                       int(core_start.timestamp()), int(core_end.timestamp())))
+        core_start = core_end
+
+def calculate_event_shard(body_data: Tuple[str, str], search_name: str, search_start: datetime,
+                          search_end: datetime, lo: int, hi: int,
+                          location_data: Tuple[float, float]) -> Tuple[str, Dict[str, np.ndarray]]:
+    """Run one (body, event search, time shard) task and keep the events the shard owns.
+    
+    Returns:
+        Tuple of (body_name, dict of event type -> unix timestamps in [lo, hi))
+    """
+    logger = setup_logging(__name__)
+    try:
+        found = calculate_event_times(body_data, search_name, search_start, search_end, location_data)
+        return body_data[0], {event_type: event_times[(event_times >= lo) & (event_times < hi)]
+                              for event_type, event_times in found.items()}
+    except Exception as e:
+        logger.error(f"Error calculating {search_name} events for {body_data[0]}: {e}")
+        return body_data[0], {}
+
+def calculate_body_events_batch(body_data: Tuple[str, str], start_time: datetime, end_time: datetime,
+                                sites: Dict[str, Tuple[float, float]]) -> Tuple[str, Dict[str, List[Tuple[int, str, str]]], int]:
+    """Calculate rise, set, transit, and antitransit events of one body for many sites.
+    
+    Args:
+        body_data: Tuple of (body_name, body_key)
+        start_time: Start datetime for calculation
+        end_time: End datetime for calculation
+        sites: Mapping of site id to (latitude, longitude)
+        
+    Returns:
+        Tuple of (body_name, events with unix timestamps keyed by site id, event count)
+    """
+    logger = setup_logging(__name__)
+    body_name, body_key = body_data
+    results: Dict[str, List[Tuple[int, str, str]]] = {site_id: [] for site_id in sites}
+    try:
+        ts = get_timescale()
+        eph = get_ephemeris()
+        earth, body = eph['earth'], eph[body_key]
+        t0 = ts.from_datetime(start_time)
+        t1 = ts.from_datetime(end_time)
+        
+        site_ids = list(sites)
+        locations = np.array(list(sites.values()), dtype=np.float64).reshape(-1, 2)
+        site_lat, site_lon = np.radians(locations[:, 0]), np.radians(locations[:, 1])
+        site_xyz = np.array([wgs84.latlon(lat, lon).itrs_xyz.au for lat, lon in locations]).reshape(-1, 3)
+        
+        horizon = build_horizon_function(body)
+        
+        def hadec(t, site_index):
+            # One geocentric position per time, shifted to each site's ITRS position
+            geo = geocentric_itrs(earth, body, t)
+            if site_index is None:
+                v, lon = geo[:, None, :] - site_xyz.T[:, :, None], site_lon[:, None]
+            else:
+                v, lon = geo - site_xyz[site_index].T, site_lon[site_index]
+            ha, dec, distance = topocentric_hadec(v, lon)
+            return ha, dec, horizon(Distance(au=distance))
+        
+        # All four event types for all sites from one hour-angle pass
+        found = solve_hour_angle_events(t0, t1, hadec, site_lat, tuple(EVENT_HOUR_ANGLES))
+        count = 0
+        for event, (site_index, times) in found.items():
+            for i, unix_timestamp in zip(site_index.tolist(), time_to_unix(times).tolist()):
+                results[site_ids[i]].append((unix_timestamp, body_name, event))
+            count += len(site_index)
+        return body_name, results, count
+    except Exception as e:
+        logger.error(f"Error calculating batch events for {body_name}: {e}")
+        return body_name, {site_id: [] for site_id in sites}, 0
+
+def calculate_all_celestial_events_batch(start_time: datetime, end_time: datetime,
+                                         sites: Dict[str, Tuple[float, float]]) -> Dict[str, List[Tuple[int, str, str]]]:
+    """Calculate celestial events for all bodies and many sites using parallel processing.
+    
+    Args:
+        start_time: Start datetime for calculation
+        end_time: End datetime for calculation
+        sites: Mapping of site id to (latitude, longitude)
+        
+    Returns:
+        Dict keyed by site id of (unix_timestamp, body_name, event_type) tuples sorted by time
+    """
+    logger = setup_logging(__name__)
+    all_results: Dict[str, List[Tuple[int, str, str]]] = {site_id: [] for site_id in sites}
+    total_events = 0
+    
+    executor = get_worker_pool()
+    futures = [executor.submit(calculate_body_events_batch, body_data, start_time, end_time, sites)
+              for body_data in CELESTIAL_BODIES]
+    
+    for future in as_completed(futures):
+        try:
+            body_name, results, count = future.result()
+            for site_id, events in results.items():
+                all_results[site_id].extend(events)
+            total_events += count
+            logger.info(f"✓ {body_name}: {count:,} events calculated for {len(sites)} sites")
+        except Exception as e:
+            logger.error(f"❌ Batch events calculation failed for a body: {e}")
+    
+    for events in all_results.values():
+        events.sort(key=lambda x: x[0])
+    logger.info(f"📊 Total celestial events processed: {total_events:,}")
+    
+    return all_results
 
 def calculate_all_celestial_events(start_time: datetime, end_time: datetime, 
                                   location_data: Tuple[float, float]) -> List[Tuple[int, str, str]]:
     """Calculate celestial events for all bodies using parallel processing.
     
+    Work is submitted to the shared worker pool as one task per (body, event
+    search, time shard), so even short ranges spread over every core and long
+    ranges balance across shards.
+    
     Args:
         start_time: Start datetime for calculation
         end_time: End datetime for calculation
@@ -98,25 +263,30 @@ def calculate_all_celestial_events(start_time: datetime, end_time: datetime,
     Returns:
         List of tuples containing (unix_timestamp, body_name, event_type)
     """
-    logger = setup_logging()
+    logger = setup_logging(__name__)
     all_results = []
-    total_events = 0
+    body_counts = {body_name: 0 for body_name, _ in CELESTIAL_BODIES}
     
-    with ProcessPoolExecutor(max_workers=min(NUM_PROCESSES, len(CELESTIAL_BODIES))) as executor:
-        # Submit tasks for each celestial body
-        futures = [executor.submit(calculate_body_events, body_data, start_time, end_time, location_data) 
-                  for body_data in CELESTIAL_BODIES]
-        
-        # Collect results
-        for future in as_completed(futures):
-            try:
-                body_name, results, count = future.result()
-                all_results.extend(results)
-                total_events += count
-                logger.info(f"✓ {body_name}: {count:,} events calculated")
-            except Exception as e:
-                logger.error(f"❌ Events calculation failed for a body: {e}")
+    # Submit one task per body, event search and time shard
+    executor = get_worker_pool()
+    futures = [executor.submit(calculate_event_shard, body_data, search_name, *shard, location_data)
+              for body_data in CELESTIAL_BODIES
+              for search_name in EVENT_SEARCHES
+              for shard in plan_event_shards(start_time, end_time)]
+    
+    # Collect results
+    for future in as_completed(futures):
+        try:
+            body_name, found = future.result()
+            for event_type, event_times in found.items():
+                all_results.extend((unix_timestamp, body_name, event_type) for unix_timestamp in event_times.tolist())
+                body_counts[body_name] += len(event_times)
+        except Exception as e:
+            logger.error(f"❌ Events calculation failed for a task: {e}")
     
+    for body_name, count in body_counts.items():
+        logger.info(f"✓ {body_name}: {count:,} events calculated")
+    total_events = sum(body_counts.values())
     # Sort results by timestamp
     all_results.sort(key=lambda x: x[0])
     logger.info(f"📊 Total celestial events processed: {total_events:,}")
@@ -138,7 +308,7 @@ def parse_args():
 
 def main():
     """Main function for celestial events calculation."""
-    logger = setup_logging()
+    logger = setup_logging(__name__)
     args = parse_args()
     
     logger.info("🌟 Celestial Events Calculator")
@@ -6,10 +6,22 @@ import multiprocessing as mp
 # Configuration constants
 EPHEMERIS_FILE = 'nasa/de440.bsp'
 OUTPUT_DIR = 'output'
+CACHE_DIR = os.path.join(OUTPUT_DIR, 'cache')
+BINARY_DIR = os.path.join(OUTPUT_DIR, 'bin')
+# Incremental generation manifest, kept outside output/json so it is not packaged
+MANIFEST_FILE = os.path.join(OUTPUT_DIR, 'json_manifest.json')
+SEARCH_CACHE_ENABLED = True
 AU_TO_M = 149597870700.0
 TIDAL_INTERVAL_MINUTES = 4
+TIDAL_CHUNK_SIZE = 10080  # Samples per vectorized Time array (4 weeks at 4 minutes)
+TIDAL_FIT_DEGREE = 16  # Chebyshev degree of TidalSeries per-day vector fits
+TIDAL_FIT_CACHE_DAYS = 366  # Daily fits kept in memory by TidalSeries
+LUNISOLAR_CACHE_ANCHORS = 32  # Numbered live-search windows kept by each LunisolarConverter
+ILLUMINATION_INTERVAL_MINUTES = 120
+ILLUMINATION_CHUNK_SIZE = 8760  # Samples per vectorized Time array (2 years at 2 hours)
 MANSION_COUNT = 28
 MANSION_DEGREES = 360.0 / MANSION_COUNT
+MANSION_SEARCH_STEP_DAYS = 0.25  # Below the shortest Moon stay in one mansion (~0.8 days)
 EARTH_RADIUS_KM = 6371.0
 MOON_MASS_KG = 7.342e22
 GRAVITATIONAL_CONSTANT = 6.67430e-11
@@ -18,6 +30,11 @@ GM_SUN = 1.32712440018e20  # m³/s²
 
 # Processing configuration
 NUM_PROCESSES = mp.cpu_count()
+# Overlap added around each year shard so boundary events are never missed
+SHARD_OVERLAP_DAYS = 8
+# Rise/set/transit work is split into (body, event type, time shard) tasks
+CELESTIAL_SHARD_DAYS = 92
+CELESTIAL_SHARD_OVERLAP_DAYS = 1
 os.environ['OMP_NUM_THREADS'] = '1'
 os.environ['MKL_NUM_THREADS'] = '1'
 os.environ['NUMEXPR_NUM_THREADS'] = '1'
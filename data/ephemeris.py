@@ -0,0 +1,230 @@
+"""Shared ephemeris and timescale registry.
+
+Every calculator needs the NASA JPL DE440 kernel and a Skyfield timescale.
+Opening ``nasa/de440.bsp`` parses the DAF file records and segment summaries
+of a 100+ MB file, so doing it on every call dominates short computations.
+This module hands out one kernel and one timescale per process instead.
+
+The kernel is opened through Skyfield's ``SpiceKernel``, whose jplephem
+backend memory-maps segment data, so only the pages actually touched by a
+computation are read from disk and they are shared through the OS page cache
+between worker processes.
+
+Usage:
+    from ephemeris import get_ephemeris, get_timescale
+    eph = get_ephemeris()
+    ts = get_timescale()
+
+    # Warm each worker once when fanning out work
+    ProcessPoolExecutor(max_workers=n, initializer=init_worker)
+
+    # Or reuse the process-wide pool of warmed workers across calls
+    future = get_worker_pool().submit(task, *args)
+"""
+
+import os
+import atexit
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+import numpy as np
+from skyfield.api import load
+from skyfield.jpllib import SpiceKernel
+from skyfield.timelib import Time, Timescale
+from config import EPHEMERIS_FILE, NUM_PROCESSES
+
+_lock = threading.RLock()
+_ephemeris: Optional[SpiceKernel] = None
+_timescale: Optional[Timescale] = None
+_owner_pid: Optional[int] = None
+_pool_lock = threading.Lock()
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_pid: Optional[int] = None
+
+
+def _check_owner() -> None:
+    """Drop handles inherited from a parent process after a fork.
+
+    A forked child shares the parent's file descriptor and offset, so it must
+    open its own kernel rather than reuse the inherited object.
+    """
+    global _ephemeris, _timescale, _owner_pid
+    if _owner_pid is not None and _owner_pid != os.getpid():
+        _ephemeris = None
+        _timescale = None
+        _owner_pid = None
+
+
+def get_ephemeris() -> SpiceKernel:
+    """Return the process-wide ephemeris kernel, loading it on first use.
+
+    Returns:
+        Shared SpiceKernel for EPHEMERIS_FILE
+    """
+    global _ephemeris, _owner_pid
+    eph = _ephemeris
+    if eph is not None and _owner_pid == os.getpid():
+        return eph
+    with _lock:
+        _check_owner()
+        if _ephemeris is None:
+            _ephemeris = load(EPHEMERIS_FILE)
+            _owner_pid = os.getpid()
+        return _ephemeris
+
+
+def kernel_path() -> str:
+    """Return the path of the kernel file served by get_ephemeris()."""
+    return EPHEMERIS_FILE
+
+
+def get_timescale() -> Timescale:
+    """Return the process-wide Skyfield timescale, building it on first use.
+
+    Returns:
+        Shared Timescale instance
+    """
+    global _timescale, _owner_pid
+    ts = _timescale
+    if ts is not None and _owner_pid == os.getpid():
+        return ts
+    with _lock:
+        _check_owner()
+        if _timescale is None:
+            _timescale = load.timescale()
+            _owner_pid = os.getpid()
+        return _timescale
+
+
+def time_from_unix(ts: Timescale, seconds) -> Time:
+    """Build a Skyfield Time (scalar or array) from Unix timestamps.
+
+    One ``ts.utc`` call on an array replaces a Python-level datetime per
+    sample. The timestamps are split into whole days and seconds of day so
+    Skyfield applies the leap second offset of each sample's own date.
+
+    Args:
+        ts: Timescale from get_timescale()
+        seconds: Unix timestamp or NumPy array of them (UTC)
+
+    Returns:
+        Time with the same shape as ``seconds``
+    """
+    days, seconds_of_day = np.divmod(seconds, 86400)
+    return ts.utc(1970, 1, 1 + days, 0, 0, seconds_of_day)
+
+
+def time_to_unix_us(t: Time) -> np.ndarray:
+    """Unix microseconds (int64) of a Skyfield Time, without building datetimes.
+
+    Matches ``datetime_to_us(dt) for dt in t.utc_datetime()``: the UTC
+    calendar fields are taken from ``t.utc``, rounded to the nearest
+    microsecond, and a leap second is folded back into second 59 as a Python
+    datetime would.
+
+    Args:
+        t: Time, scalar or array
+
+    Returns:
+        int64 array shaped like ``t``
+    """
+    year, month, day, hour, minute, second = (np.asarray(field) for field in t.utc)
+    dates = (year.astype(np.int64) - 1970).astype('datetime64[Y]').astype('datetime64[M]')
+    dates = dates + (month.astype(np.int64) - 1)
+    days = (dates.astype('datetime64[D]') + (day.astype(np.int64) - 1)).astype(np.int64)
+    micro = ((second + 0.5e-6) * 1e6).astype(np.int64)
+    micro -= 1_000_000 * (micro >= 60_000_000)
+    minutes = (days * 24 + hour.astype(np.int64)) * 60 + minute.astype(np.int64)
+    return minutes * 60_000_000 + micro
+
+
+def us_to_unix_seconds(times_us: np.ndarray) -> np.ndarray:
+    """Whole Unix seconds (int64) truncated toward zero, like int(datetime.timestamp()).
+
+    Integer division, so exact for any int64 microsecond count.
+    """
+    micro = np.asarray(times_us, dtype=np.int64)
+    return np.where(micro >= 0, micro // 1_000_000, -(-micro // 1_000_000))
+
+
+def time_to_unix(t: Time) -> np.ndarray:
+    """Whole Unix seconds (int64) of a Skyfield Time, truncated toward zero.
+
+    Vectorized equivalent of ``int(dt.timestamp())`` over ``t.utc_datetime()``.
+    """
+    return us_to_unix_seconds(time_to_unix_us(t))
+
+
+def close_ephemeris() -> None:
+    """Close the shared kernel and forget the cached timescale.
+
+    The next call to get_ephemeris() or get_timescale() loads them again.
+    """
+    global _ephemeris, _timescale, _owner_pid
+    with _lock:
+        if _ephemeris is not None and _owner_pid == os.getpid():
+            try:
+                _ephemeris.close()
+            except Exception:
+                pass
+        _ephemeris = None
+        _timescale = None
+        _owner_pid = None
+
+
+def reload_ephemeris() -> SpiceKernel:
+    """Close and reopen the shared kernel, e.g. after the file was replaced.
+
+    Returns:
+        Freshly loaded SpiceKernel
+    """
+    with _lock:
+        close_ephemeris()
+        get_timescale()
+        return get_ephemeris()
+
+
+def init_worker() -> None:
+    """ProcessPoolExecutor initializer that loads kernel and timescale once.
+
+    Pass as ``initializer=init_worker`` so every task running in the worker
+    reuses the same handles instead of opening the kernel per task.
+    """
+    get_timescale()
+    get_ephemeris()
+
+
+def get_worker_pool() -> ProcessPoolExecutor:
+    """Return the process-wide worker pool, starting it on first use.
+
+    Workers run init_worker() once and then serve every later submission, so
+    repeated calls reuse warm workers instead of starting a pool and opening
+    the kernel each time. A forked child starts its own pool, and a pool that
+    broke because a worker died (e.g. killed by the OOM killer) is replaced.
+
+    Returns:
+        Shared ProcessPoolExecutor with NUM_PROCESSES workers
+    """
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is not None and _pool_pid == os.getpid() and getattr(_pool, '_broken', False):
+            # Every submit to a broken pool raises BrokenProcessPool, so start over
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+        if _pool is None or _pool_pid != os.getpid():
+            _pool = ProcessPoolExecutor(max_workers=NUM_PROCESSES, initializer=init_worker)
+            _pool_pid = os.getpid()
+        return _pool
+
+
+def shutdown_worker_pool() -> None:
+    """Shut down the shared worker pool; the next get_worker_pool() starts a new one."""
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is not None and _pool_pid == os.getpid():
+            _pool.shutdown()
+        _pool = None
+        _pool_pid = None
+
+
+atexit.register(shutdown_worker_pool)
@@ -0,0 +1,219 @@
+"""Bulk four-pillar (BaZi) charts.
+
+Four-pillar charts use solar months rather than lunar months: each month
+starts at a jie (the odd-indexed, non-principal solar terms in Skyfield
+ordering, 1 = Qingming ... 21 = Lichun, 23 = Jingzhe) and the year starts at
+Lichun. The year and month pillars of every jie period are therefore fixed by
+the solar term series alone, so this module precomputes them once and resolves
+any instant with one binary search over the jie instants.
+
+Day and hour pillars come from SexagenaryEngine.ganzhi_day_hour_arrays, so they
+follow the same rules as solar_to_lunisolar (whole UTC days from the Jiazi
+anchor, local hour with 23:00 taking the next day's stem).
+
+Usage:
+    from four_pillars import four_pillars
+    charts = four_pillars(np.array([1736899200, 1736985600]), 'Asia/Shanghai')
+    charts.year_cycle, charts.month_cycle, charts.day_cycle, charts.hour_cycle
+"""
+
+import os
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import List, Optional, Sequence, Tuple
+import numpy as np
+from config import BINARY_DIR, OUTPUT_DIR
+from binary_series import BinarySeries, binary_is_stale
+from lunisolar_v2 import CYCLE_FROM_STEM_BRANCH, FIRST_MONTH_STEMS, SexagenaryEngine
+from solar_terms import find_solar_terms
+from timezone_handler import TimezoneHandler
+from utils import read_year_chunks
+
+# Solar term index (Skyfield ordering, 0 = Spring Equinox) of Lichun, the first jie of the year
+LICHUN_TERM = 21
+
+
+@dataclass(frozen=True)
+class FourPillarArrays:
+    """Columnar four-pillar charts, one element per input timestamp."""
+    year_cycle: np.ndarray    # int8, 1..60
+    month_cycle: np.ndarray   # int8, 1..60
+    day_cycle: np.ndarray     # int8, 1..60
+    hour_cycle: np.ndarray    # int8, 1..60
+
+    def __len__(self) -> int:
+        return len(self.year_cycle)
+
+
+class JieTable:
+    """Sorted jie instants with the year and month pillar of each jie period."""
+
+    def __init__(self, solar_terms: Sequence[Tuple[int, int]]):
+        """
+        Build the table from solar terms.
+
+        Args:
+            solar_terms: (unix_timestamp, term_index) pairs in Skyfield ordering
+        """
+        terms = np.asarray(solar_terms, dtype=np.int64).reshape(-1, 2)
+        terms = terms[np.argsort(terms[:, 0], kind='stable')]
+        jie = terms[terms[:, 1] % 2 == 1]
+        if len(jie) < 2:
+            raise ValueError("At least two jie terms are required to build a jie table")
+
+        self.epoch = jie[:, 0]
+        # Month branch: Lichun opens 寅 (2), each later jie the next branch
+        branch_0 = ((jie[:, 1] - LICHUN_TERM) // 2 + 2) % 12
+        month_0 = (branch_0 - 2) % 12
+        # Xiaohan (丑, the 12th month) falls in January but belongs to the previous Lichun year
+        utc_year = self.epoch.astype('datetime64[s]').astype('datetime64[Y]').astype(np.int64) + 1970
+        solar_year = utc_year - (month_0 == 11)
+        year_0 = (solar_year - 4) % 60
+
+        self.year_cycle = (year_0 + 1).astype(np.int8)
+        self.month_cycle = CYCLE_FROM_STEM_BRANCH[(FIRST_MONTH_STEMS[year_0 % 10] + month_0) % 10, branch_0]
+        # Instants after the last jie have no known end, so the range stops there
+        self.range_start = int(self.epoch[0])
+        self.range_end = int(self.epoch[-1])
+
+    def __len__(self) -> int:
+        return len(self.epoch)
+
+    def resolve_array(self, epoch_seconds: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Year and month pillars for an array of UTC instants.
+
+        Args:
+            epoch_seconds: Array of Unix timestamps
+
+        Returns:
+            Tuple of (year_cycle, month_cycle) int8 arrays
+
+        Raises:
+            ValueError: If any instant is outside the table range
+        """
+        epoch = np.asarray(epoch_seconds, dtype=np.int64)
+        outside = (epoch < self.range_start) | (epoch >= self.range_end)
+        if outside.any():
+            raise ValueError(
+                f"{int(outside.sum())} timestamp(s) outside the jie table range "
+                f"[{self.range_start}, {self.range_end})"
+            )
+        rows = np.searchsorted(self.epoch, epoch, side='right') - 1
+        return self.year_cycle[rows], self.month_cycle[rows]
+
+    @classmethod
+    def from_json(cls, json_dir: Optional[str] = None) -> 'JieTable':
+        """Build the table from the per-year solar term chunks written by main.py.
+
+        Args:
+            json_dir: Directory containing solar_terms/ (default: output/json)
+
+        Returns:
+            JieTable covering the years present on disk
+        """
+        json_dir = json_dir or os.path.join(OUTPUT_DIR, 'json')
+        solar_terms: List[Tuple[int, int]] = []
+        for chunk in read_year_chunks(os.path.join(json_dir, 'solar_terms')):
+            solar_terms.extend((int(ts), int(idx)) for ts, idx in chunk)
+        return cls(solar_terms)
+
+    @classmethod
+    def from_binary(cls, bin_dir: Optional[str] = None) -> 'JieTable':
+        """Build the table from the solar term series written by main.py --binary.
+
+        Args:
+            bin_dir: Directory containing solar_terms.bin (default: output/bin)
+
+        Returns:
+            JieTable covering the years in the binary file
+        """
+        terms = BinarySeries(os.path.join(bin_dir or BINARY_DIR, 'solar_terms.bin'))
+        return cls(np.column_stack([terms.timestamps(), terms.values()]))
+
+    @classmethod
+    def from_search(cls, start_time: datetime, end_time: datetime) -> 'JieTable':
+        """Build the table from a live (cached) solar term search.
+
+        Args:
+            start_time: Start datetime; should precede the first instant of interest by a month
+            end_time: End datetime; should follow the last instant of interest by a month
+
+        Returns:
+            JieTable covering the searched range
+        """
+        timestamps, term_indices = find_solar_terms(start_time, end_time)
+        return cls(np.column_stack([timestamps, term_indices]))
+
+
+_table_lock = threading.Lock()
+_table: Optional[JieTable] = None
+_table_loaded = False
+
+
+def get_jie_table() -> Optional[JieTable]:
+    """Return the process-wide jie table, building it on first use.
+
+    The table is read from output/bin when main.py was run with --binary and
+    from the output/json chunks otherwise, or when the JSON chunks were
+    regenerated after the binary files were written.
+
+    Returns:
+        Shared JieTable, or None if the precomputed data is unavailable
+    """
+    global _table, _table_loaded
+    if _table_loaded:
+        return _table
+    with _table_lock:
+        if not _table_loaded:
+            # Prefer the memory-mapped binary series unless the JSON chunks are newer
+            loaders = [JieTable.from_binary, JieTable.from_json]
+            if binary_is_stale(BINARY_DIR, os.path.join(OUTPUT_DIR, 'json'), ('solar_terms',)):
+                loaders.reverse()
+            for loader in loaders:
+                try:
+                    _table = loader()
+                    break
+                except (OSError, ValueError):
+                    _table = None
+            _table_loaded = True
+    return _table
+
+
+def four_pillars(
+    timestamps: np.ndarray,
+    timezone_name: str = 'Asia/Shanghai',
+    table: Optional[JieTable] = None
+) -> FourPillarArrays:
+    """
+    Compute four-pillar charts for an array of UTC instants.
+
+    Args:
+        timestamps: Unix timestamps (UTC), any shape
+        timezone_name: IANA timezone name for the local hour (default: 'Asia/Shanghai')
+        table: Jie table to resolve against (default: the shared table from get_jie_table)
+
+    Returns:
+        FourPillarArrays with the same shape as the input
+
+    Raises:
+        ValueError: If no jie table is available or a timestamp is outside its range
+    """
+    if table is None:
+        table = get_jie_table()
+    if table is None:
+        raise ValueError("Jie table unavailable: generate output/json/solar_terms first")
+
+    epoch = np.asarray(timestamps)
+    if epoch.dtype.kind == 'f':
+        epoch = np.floor(epoch)
+    epoch = epoch.astype(np.int64)
+
+    year_cycle, month_cycle = table.resolve_array(epoch)
+    day_cycle, hour_cycle, _ = SexagenaryEngine.ganzhi_day_hour_arrays(epoch, TimezoneHandler(timezone_name))
+    return FourPillarArrays(
+        year_cycle=year_cycle,
+        month_cycle=month_cycle,
+        day_cycle=day_cycle,
+        hour_cycle=hour_cycle
+    )
@@ -273,7 +273,7 @@ class HuangdaoCalculator:
         """
         # Get lunisolar data (use provided DTO if available, otherwise fetch)
         if dto is None:
-            dto = solar_to_lunisolar(date_obj.strftime("%Y-%m-%d"), "12:00", self.timezone_name, quiet=True)
+            dto = solar_to_lunisolar(date_obj.strftime("%Y-%m-%d"), "12:00", self.timezone_name)
         
         # Check if this is a solar term day
         is_solar_term = self.construction_stars._is_principal_solar_term_day(date_obj)
@@ -312,7 +312,7 @@ class HuangdaoCalculator:
                       for day in range(1, days_in_month + 1)]
         
         # Batch convert all dates to lunisolar (much faster!)
-        lunisolar_results = solar_to_lunisolar_batch(date_range, self.timezone_name, quiet=True)
+        lunisolar_results = solar_to_lunisolar_batch(date_range, self.timezone_name)
         
         # Get mid-month data for header info
         mid_idx = 14  # 15th day (0-indexed)
@@ -0,0 +1,167 @@
+"""Lunar mansion calculation module.
+
+The 28 lunar mansions divide the ecliptic into equal arcs of MANSION_DEGREES.
+This module computes the mansion index for arrays of times and finds the
+instants the Moon crosses from one mansion into the next. The transitions
+alone describe the mansion at any time, so a year needs about 370 rows
+instead of 131,000 4-minute samples.
+
+Longitude is the Moon's astrometric ecliptic longitude (J2000 ecliptic) seen
+from the observer, the same quantity tidal_data.py reports.
+
+Usage:
+    python lunar_mansions.py --start-date YYYY-MM-DD --end-date YYYY-MM-DD [--lat LAT] [--lon LON]
+
+Example:
+    python lunar_mansions.py --start-date 2025-01-01 --end-date 2025-12-31
+"""
+
+import argparse
+from datetime import datetime
+from typing import List, Tuple
+import numpy as np
+from skyfield.api import utc, wgs84
+from skyfield import almanac
+from config import (MANSION_COUNT, MANSION_DEGREES, MANSION_SEARCH_STEP_DAYS,
+                    TIDAL_CHUNK_SIZE, DEFAULT_LOCATION)
+from ephemeris import get_ephemeris, get_timescale, time_from_unix, time_to_unix_us, us_to_unix_seconds
+from search_cache import get_search_cache
+from utils import setup_logging, write_csv_file
+
+# Bump whenever a change alters the events found, so cached search results are not reused
+CALCULATOR_VERSION = 1
+
+def mansion_index(lon_deg: np.ndarray) -> np.ndarray:
+    """Mansion index 1-28 for ecliptic longitudes in degrees."""
+    index = (np.asarray(lon_deg) % 360.0 // MANSION_DEGREES).astype(np.int64) + 1
+    # The modulo keeps longitudes in [0, 360], so an index past 28 can only come
+    # from float rounding in the division; it wraps to mansion 1
+    return np.where(index > MANSION_COUNT, 1, index)
+
+def moon_ecliptic_longitude(observer_at, moon) -> np.ndarray:
+    """Ecliptic longitude in degrees of the Moon seen from an observer position."""
+    return observer_at.observe(moon).ecliptic_latlon()[1].degrees
+
+def calculate_mansions(timestamps: np.ndarray, location_data: Tuple[float, float] = DEFAULT_LOCATION,
+                       chunk_size: int = TIDAL_CHUNK_SIZE) -> Tuple[np.ndarray, np.ndarray]:
+    """Calculate Moon ecliptic longitude and mansion index for an array of times.
+
+    Args:
+        timestamps: Array of Unix timestamps (UTC)
+        location_data: Tuple of (latitude, longitude)
+        chunk_size: Number of samples evaluated per Time array
+
+    Returns:
+        Tuple of (ecliptic longitude in degrees, mansion index 1-28)
+    """
+    lat, lon = location_data
+    ts = get_timescale()
+    eph = get_ephemeris()
+    moon = eph['moon']
+    observer = eph['earth'] + wgs84.latlon(lat, lon)
+
+    timestamps = np.asarray(timestamps, dtype=np.float64)
+    lon_deg = np.empty(len(timestamps))
+    for chunk_start in range(0, len(timestamps), chunk_size):
+        chunk = slice(chunk_start, chunk_start + chunk_size)
+        lon_deg[chunk] = moon_ecliptic_longitude(observer.at(time_from_unix(ts, timestamps[chunk])), moon)
+    return lon_deg, mansion_index(lon_deg)
+
+def mansion_function(observer, moon):
+    """Build a find_discrete() function returning the mansion (0-27) at Time t."""
+    def mansion_at(t):
+        return mansion_index(moon_ecliptic_longitude(observer.at(t), moon)) - 1
+    mansion_at.step_days = MANSION_SEARCH_STEP_DAYS
+    return mansion_at
+
+def find_mansion_transitions(start_time: datetime, end_time: datetime,
+                             location_data: Tuple[float, float] = DEFAULT_LOCATION) -> List[Tuple[int, int]]:
+    """Find the instants the Moon enters each mansion.
+
+    Args:
+        start_time: Start datetime for calculation
+        end_time: End datetime for calculation
+        location_data: Tuple of (latitude, longitude)
+
+    Returns:
+        List of tuples containing (unix_timestamp, mansion index 1-28 entered)
+    """
+    logger = setup_logging(__name__)
+    try:
+        lat, lon = location_data
+        params = {'lat': lat, 'lon': lon}
+        cache = get_search_cache()
+        found = cache.lookup('lunar_mansions', start_time, end_time, params, version=CALCULATOR_VERSION)
+        if found is None:
+            ts = get_timescale()
+            eph = get_ephemeris()
+            observer = eph['earth'] + wgs84.latlon(lat, lon)
+            t0 = ts.from_datetime(start_time)
+            t1 = ts.from_datetime(end_time)
+            t, y = almanac.find_discrete(t0, t1, mansion_function(observer, eph['moon']))
+            found = (time_to_unix_us(t), y)
+            cache.store('lunar_mansions', start_time, end_time, *found, params=params, version=CALCULATOR_VERSION)
+        times_us, mansions = found
+        mansions = np.asarray(mansions, dtype=np.int64) + 1
+        return list(zip(us_to_unix_seconds(times_us).tolist(), mansions.tolist()))
+    except Exception as e:
+        logger.error(f"Error finding lunar mansion transitions: {e}")
+        return []
+
+def mansions_from_transitions(timestamps: np.ndarray, transition_times: np.ndarray,
+                              transition_mansions: np.ndarray) -> np.ndarray:
+    """Mansion index at arbitrary times from a list of transitions.
+
+    Times before the first transition get the mansion preceding it.
+
+    Args:
+        timestamps: Array of Unix timestamps (UTC)
+        transition_times: Sorted Unix timestamps of mansion transitions
+        transition_mansions: Mansion index 1-28 entered at each transition
+
+    Returns:
+        Mansion index 1-28 for each timestamp
+    """
+    transition_mansions = np.asarray(transition_mansions, dtype=np.int64)
+    previous = (transition_mansions[:1] - 2) % MANSION_COUNT + 1
+    lookup = np.concatenate([previous, transition_mansions])
+    return lookup[np.searchsorted(transition_times, timestamps, side='right')]
+
+def parse_args():
+    """Parse command line arguments for lunar mansion calculation."""
+    parser = argparse.ArgumentParser(description='Lunar Mansion Transition Calculator.')
+    parser.add_argument('--start-date', type=str, default='2024-01-01',
+                       help='Start date in YYYY-MM-DD format.')
+    parser.add_argument('--end-date', type=str, default='2024-01-31',
+                       help='End date in YYYY-MM-DD format.')
+    parser.add_argument('--lat', type=float, default=DEFAULT_LOCATION[0],
+                       help=f'Latitude (default: {DEFAULT_LOCATION[0]})')
+    parser.add_argument('--lon', type=float, default=DEFAULT_LOCATION[1],
+                       help=f'Longitude (default: {DEFAULT_LOCATION[1]})')
+    return parser.parse_args()
+
+def main():
+    """Main function for lunar mansion calculation."""
+    logger = setup_logging(__name__)
+    args = parse_args()
+
+    logger.info("🌙 Lunar Mansion Transition Calculator")
+    logger.info(f"Finding mansion transitions from {args.start_date} to {args.end_date}")
+    logger.info(f"Location: {args.lat:.6f}°N, {args.lon:.6f}°E")
+
+    # Parse dates
+    start_time = datetime.strptime(args.start_date, '%Y-%m-%d').replace(tzinfo=utc)
+    end_time = datetime.strptime(args.end_date, '%Y-%m-%d').replace(hour=23, minute=59, second=59, tzinfo=utc)
+
+    results = find_mansion_transitions(start_time, end_time, (args.lat, args.lon))
+
+    if results:
+        data = [{'timestamp': timestamp, 'mansion_index': mansion} for timestamp, mansion in results]
+        count = write_csv_file('lunar_mansions.csv', data, ['timestamp', 'mansion_index'])
+        logger.info(f"✅ Successfully found {count} mansion transitions")
+        logger.info(f"📄 Results saved to output/lunar_mansions.csv")
+    else:
+        logger.warning("⚠️ No mansion transitions found in the specified date range")
+
+if __name__ == '__main__':
+    main()
@@ -17,22 +17,36 @@ This module implements:
 Usage:
     from lunisolar_v2 import solar_to_lunisolar
     result = solar_to_lunisolar("2025-01-15", "14:30")
+
+    # Long-lived converter that caches its work across calls
+    from lunisolar_v2 import LunisolarConverter
+    converter = LunisolarConverter('Asia/Shanghai')
+    results = converter.convert_range("2025-01-01", "2025-01-31")
+
+    # Columnar conversion of many UTC instants
+    from lunisolar_v2 import solar_to_lunisolar_array
+    arrays = solar_to_lunisolar_array(np.array([1736899200, 1736985600]), 'Asia/Shanghai')
 """
 
 import logging
+import threading
+import warnings
+from bisect import bisect_right
+from collections import OrderedDict
 from datetime import datetime, timedelta, date, timezone
-from typing import List, Tuple, Optional
-from dataclasses import dataclass
-import logging
-from skyfield.api import utc, load
-from skyfield import almanac
+from typing import Dict, List, Tuple, Optional, Sequence, Union
+from dataclasses import dataclass, field
+import numpy as np
+from skyfield.api import utc
 
-from config import EPHEMERIS_FILE
-from utils import setup_logging
+from config import LUNISOLAR_CACHE_ANCHORS
 from solar_terms import calculate_solar_terms
 from moon_phases import calculate_moon_phases
+from month_table import TableMonth, UNIX_EPOCH_ORDINAL, get_month_table
+from solstices import SolsticeProvider, get_solstice_provider
 from timezone_handler import TimezoneHandler
 
+logger = logging.getLogger(__name__)
 
 # Constants from traditional Chinese calendar
 HEAVENLY_STEMS = [
@@ -79,6 +93,32 @@ PRINCIPAL_TERMS = {
     12: 300   # Z12 大寒 Great Cold
 }
 
+# Proleptic ordinal of the Jiazi day anchor (January 31, 4 AD) used by ganzhi_day
+JIAZI_DAY_ORDINAL = date(4, 1, 31).toordinal()
+
+# Sexagenary lookup tables (0-based stem/branch indices, 1-based cycle numbers)
+STEM_INDEX = {stem[0]: i for i, stem in enumerate(HEAVENLY_STEMS)}
+BRANCH_INDEX = {branch[0]: i for i, branch in enumerate(EARTHLY_BRANCHES)}
+STEM_CHARS = np.array([stem[0] for stem in HEAVENLY_STEMS])
+BRANCH_CHARS = np.array([branch[0] for branch in EARTHLY_BRANCHES])
+
+# Cycle number - 1 -> stem and branch index
+CYCLE_STEMS = np.arange(60, dtype=np.int8) % 10
+CYCLE_BRANCHES = np.arange(60, dtype=np.int8) % 12
+
+# [stem, branch] -> cycle number by the Chinese Remainder Theorem
+# (cycle - 1 = 6 * stem - 5 * branch mod 60); pairs of mixed parity never occur and map to 1
+_stems, _branches = np.ogrid[:10, :12]
+CYCLE_FROM_STEM_BRANCH = np.where((_stems - _branches) % 2 == 0,
+                                  (6 * _stems - 5 * _branches) % 60 + 1, 1).astype(np.int8)
+
+# Year stem -> stem of the first lunar month (Wu Hu Dun: 甲/己 -> 丙, 乙/庚 -> 戊, ...)
+FIRST_MONTH_STEMS = (2 * (np.arange(10, dtype=np.int8) % 5) + 2) % 10
+
+# [day stem, hour branch] -> hour stem (Wu Shu Dun: 甲/己 days start at 甲子, 乙/庚 at 丙子, ...)
+HOUR_STEM_TABLE = ((2 * (_stems % 5) + _branches) % 10).astype(np.int8)
+del _stems, _branches
+
 
 # Data Models
 @dataclass(frozen=True)
@@ -124,11 +164,57 @@ class LunisolarDateDTO:
     hour_cycle: int
 
 
+@dataclass(frozen=True)
+class LunisolarArrays:
+    """Columnar lunisolar dates, one element per input timestamp."""
+    year: np.ndarray          # int16
+    month: np.ndarray         # int8
+    day: np.ndarray           # int8
+    hour: np.ndarray          # int8, local hour
+    is_leap_month: np.ndarray # bool
+    year_cycle: np.ndarray    # int8, 1..60
+    month_cycle: np.ndarray   # int8, 1..60
+    day_cycle: np.ndarray     # int8, 1..60
+    hour_cycle: np.ndarray    # int8, 1..60
+
+    def __len__(self) -> int:
+        return len(self.year)
+
+
+@dataclass
+class MonthNumberingTrace:
+    """Opt-in record of one LeapMonthAssigner.assign_month_numbers call.
+    
+    Rows are (period index, start CST date, end CST date, has principal term,
+    month number, is leap); periods before the Zi month keep month number 0."""
+    anchor_solstice_utc: Optional[datetime] = None
+    zi_month_index: int = -1
+    rows: List[Tuple[int, date, date, bool, int, bool]] = field(default_factory=list)
+    
+    def record(self, periods: Sequence[MonthPeriod], anchor_solstice_utc: datetime, zi_month_index: int) -> None:
+        """Store the numbering of the periods after an assignment."""
+        self.anchor_solstice_utc = anchor_solstice_utc
+        self.zi_month_index = zi_month_index
+        self.rows = [
+            (i, period.start_cst_date, period.end_cst_date, period.has_principal_term,
+             period.month_number, period.is_leap)
+            for i, period in enumerate(periods)
+        ]
+    
+    def __str__(self) -> str:
+        lines = [f"Winter Solstice (Z11) at {self.anchor_solstice_utc}, Zi month at period {self.zi_month_index}"]
+        for i, start, end, has_term, month_number, is_leap in self.rows:
+            lines.append(
+                f"Period {i:2d}: Month {month_number:2d} [{'LEAP' if is_leap else '    '}] "
+                f"Term:{'✓' if has_term else '✗'} | {start} to {end}"
+            )
+        return "\n".join(lines)
+
+
 class TimezoneService:
     """Handles timezone conversions and CST date-only comparisons."""
     
     def __init__(self, timezone_handler: Optional[TimezoneHandler] = None):
-        self.logger = setup_logging()
         self.tz_handler = timezone_handler or TimezoneHandler.create_cst_handler()
     
     def utc_to_cst_date(self, utc_datetime: datetime) -> date:
@@ -148,8 +234,8 @@ class TimezoneService:
 class WindowPlanner:
     """Plans calculation windows around Winter Solstice anchors."""
     
-    def __init__(self):
-        self.logger = setup_logging()
+    def __init__(self, solstice_provider: Optional[SolsticeProvider] = None):
+        self.solstices = solstice_provider or get_solstice_provider()
     
     def compute_window(self, target_utc: datetime) -> Tuple[datetime, datetime]:
         """Return [start, end] window framing two consecutive Winter Solstices
@@ -164,9 +250,9 @@ class WindowPlanner:
         target_year = target_naive.year
         
         # Find Winter Solstices for current and adjacent years
-        solstice_current = self._find_winter_solstice(target_year)
-        solstice_prev = self._find_winter_solstice(target_year - 1)
-        solstice_next = self._find_winter_solstice(target_year + 1)
+        solstice_current = self.winter_solstice(target_year)
+        solstice_prev = self.winter_solstice(target_year - 1)
+        solstice_next = self.winter_solstice(target_year + 1)
         
         # Determine which solstice pair to use
         if target_naive >= solstice_current:
@@ -180,40 +266,18 @@ class WindowPlanner:
         window_start = anchor_start - timedelta(days=30)
         window_end = anchor_end + timedelta(days=30)
         
-        self.logger.debug(f"Computed window: {window_start} to {window_end}")
+        logger.debug("Computed window: %s to %s", window_start, window_end)
         return window_start, window_end
     
-    def _find_winter_solstice(self, year: int) -> datetime:
-        """Find Winter Solstice for a given year."""
-        try:
-            ts = load.timescale()
-            eph = load(EPHEMERIS_FILE)
-            
-            t0 = ts.utc(year, 1, 1)
-            t1 = ts.utc(year + 1, 1, 1)
-            t, y = almanac.find_discrete(t0, t1, almanac.seasons(eph))
-            
-            for time, season in zip(t, y):
-                if season == 3:  # Winter solstice
-                    # Use utc_datetime() method to get proper UTC datetime
-                    solstice_datetime = time.utc_datetime()
-                    return solstice_datetime.replace(tzinfo=None)  # Ensure timezone-naive
-            
-            raise ValueError(f"Winter solstice not found for year {year}")
-        except Exception as e:
-            self.logger.error(f"Error finding winter solstice for {year}: {e}")
-            raise
-        finally:
-            if 'eph' in locals():
-                del eph
+    def winter_solstice(self, year: int) -> datetime:
+        """Find Winter Solstice for a given year (timezone-naive UTC).
+        Served from the solstice table or the provider's LRU cache when possible."""
+        return self.solstices.winter_solstice(year)
 
 
 class EphemerisService:
     """Single-pass computation of new moons and principal terms."""
     
-    def __init__(self):
-        self.logger = setup_logging()
-    
     def compute_new_moons(self, start: datetime, end: datetime) -> List[datetime]:
         """Return sorted UTC instants of new moons in [start, end].
         One pass only per window."""
@@ -240,7 +304,7 @@ class EphemerisService:
             
             return sorted(new_moons)
         except Exception as e:
-            self.logger.error(f"Error computing new moons: {e}")
+            logger.error("Error computing new moons: %s", e)
             return []
     
     def compute_principal_terms(self, start: datetime, end: datetime) -> List[PrincipalTerm]:
@@ -281,7 +345,7 @@ class EphemerisService:
             
             return principal_terms
         except Exception as e:
-            self.logger.error(f"Error computing principal terms: {e}")
+            logger.error("Error computing principal terms: %s", e)
             return []
 
 
@@ -289,7 +353,6 @@ class MonthBuilder:
     """Builds MonthPeriod objects from new moon sequences."""
     
     def __init__(self, timezone_service: TimezoneService):
-        self.logger = setup_logging()
         self.tz_service = timezone_service
     
     def build_month_periods(self, new_moons: List[datetime]) -> List[MonthPeriod]:
@@ -313,36 +376,72 @@ class MonthBuilder:
             )
             periods.append(period)
         
-        self.logger.debug(f"Built {len(periods)} month periods")
+        logger.debug("Built %d month periods", len(periods))
         return periods
 
 
+class PeriodIndex:
+    """Sorted index of consecutive MonthPeriods keyed by CST date ordinals.
+    
+    Build it once per period list and query it many times: lookups are a
+    binary search and term tagging is a single sorted merge."""
+    
+    def __init__(self, periods: Sequence[MonthPeriod]):
+        self.periods = list(periods)
+        self.start_ordinals = [period.start_cst_date.toordinal() for period in self.periods]
+        self.end_ordinals = [period.end_cst_date.toordinal() for period in self.periods]
+    
+    def __len__(self) -> int:
+        return len(self.periods)
+    
+    def find(self, cst_date: date) -> Optional[MonthPeriod]:
+        """Return the period with startCstDate <= cst_date < endCstDate in O(log n), or None."""
+        ordinal = cst_date.toordinal()
+        i = bisect_right(self.start_ordinals, ordinal) - 1
+        if i >= 0 and ordinal < self.end_ordinals[i]:
+            return self.periods[i]
+        return None
+    
+    def tag_principal_terms(self, terms: Sequence[PrincipalTerm]) -> int:
+        """Set has_principal_term on the periods holding each term's CST date.
+        
+        Terms are merged against the periods in one O(n + m) pass. A term on a
+        period's end date belongs to the next period.
+        
+        Returns:
+            Number of terms mapped to a period
+        """
+        term_ordinals = sorted(term.cst_date.toordinal() for term in terms)
+        mapped = 0
+        i = 0
+        n = len(self.periods)
+        for ordinal in term_ordinals:
+            while i < n and self.end_ordinals[i] <= ordinal:
+                i += 1
+            if i == n:
+                break
+            if self.start_ordinals[i] <= ordinal:
+                self.periods[i].has_principal_term = True
+                mapped += 1
+        return mapped
+
+
 class TermIndexer:
     """Maps principal terms to lunar months using date-only CST comparisons."""
     
-    def __init__(self):
-        self.logger = setup_logging()
-    
-    def tag_principal_terms(self, periods: List[MonthPeriod], terms: List[PrincipalTerm]) -> None:
+    def tag_principal_terms(self, periods: Union[List[MonthPeriod], PeriodIndex], terms: List[PrincipalTerm]) -> None:
         """For each term, find the MonthPeriod whose CST startDate <= term.cstDate < endDate.
         If term.cstDate == period.endCstDate, skip (belongs to next month). Set period.hasPrincipalTerm = True."""
-        for term in terms:
-            for period in periods:
-                # Date-only comparison: term belongs to month if it falls within the period
-                # but NOT if it falls on the end date (belongs to next month)
-                if (period.start_cst_date <= term.cst_date < period.end_cst_date):
-                    period.has_principal_term = True
-                    self.logger.debug(f"Term Z{term.term_index} mapped to month period {period.index}")
-                    break
+        index = periods if isinstance(periods, PeriodIndex) else PeriodIndex(periods)
+        mapped = index.tag_principal_terms(terms)
+        logger.debug("Mapped %d of %d principal terms to %d month periods", mapped, len(terms), len(index))
 
 
 class LeapMonthAssigner:
     """Assigns month numbers and leap status using no-zhongqi rule."""
     
-    def __init__(self):
-        self.logger = setup_logging()
-    
-    def assign_month_numbers(self, periods: List[MonthPeriod], anchor_solstice_utc: datetime) -> None:
+    def assign_month_numbers(self, periods: List[MonthPeriod], anchor_solstice_utc: datetime,
+                             trace: Optional['MonthNumberingTrace'] = None) -> None:
         """Assign month numbers starting from Zi month (month 11).
         
         Strategy:
@@ -352,92 +451,42 @@ class LeapMonthAssigner:
            - Leap months (no principal term): take the preceding month's number
         
         This forward-only approach works because the WindowPlanner ensures the Zi month
-        is at or near the start of the period list, making a backward pass unnecessary."""
-        
-        self.logger.info("=" * 80)
-        self.logger.info("MONTH NUMBERING DEBUG - Starting month numbering process")
-        self.logger.info("=" * 80)
+        is at or near the start of the period list, making a backward pass unnecessary.
         
+        Pass a MonthNumberingTrace to record the numbering of every period; one is
+        also built and logged when DEBUG logging is enabled."""
         # Find Zi month (contains Winter Solstice)
         zi_month_index = self._find_zi_month(periods, anchor_solstice_utc)
         if zi_month_index == -1:
             raise ValueError("Could not find Zi month containing Winter Solstice")
         
-        self.logger.info(f"Winter Solstice (Z11) at: {anchor_solstice_utc}")
-        self.logger.info(f"Zi month (month 11) found at period index: {zi_month_index}")
-        self.logger.info(f"  Period start: {periods[zi_month_index].start_cst_date}")
-        self.logger.info(f"  Period end: {periods[zi_month_index].end_cst_date}")
-        self.logger.info(f"  Has principal term: {periods[zi_month_index].has_principal_term}")
-        
         # Assign Zi month
         periods[zi_month_index].month_number = 11
         periods[zi_month_index].is_leap = False
         
         # Assign subsequent months (forward pass)
-        self.logger.info("\n" + "-" * 80)
-        self.logger.info("FORWARD PASS - Assigning months after Zi month (11)")
-        self.logger.info("-" * 80)
-        
         current_month_number = 11
         for i in range(zi_month_index + 1, len(periods)):
             period = periods[i]
-            
-            self.logger.info(f"\n{'='*60}")
-            self.logger.info(f"FORWARD PASS - Processing period index {i}:")
-            self.logger.info(f"{'='*60}")
-            self.logger.info(f"  Period dates: {period.start_cst_date} to {period.end_cst_date}")
-            self.logger.info(f"  Has principal term: {period.has_principal_term}")
-            self.logger.info(f"  Current tracker (represents previous month number): {current_month_number}")
-            
             if period.has_principal_term:
                 # Regular month - increment number
-                old_value = current_month_number
-                self.logger.info(f"\n  ✓ HAS PRINCIPAL TERM - This is a REGULAR month")
-                self.logger.info(f"  Step 1: Calculate new month number")
-                self.logger.info(f"          Formula: (current_month_number % 12) + 1")
-                self.logger.info(f"          Calculation: ({old_value} % 12) + 1 = {(old_value % 12) + 1}")
                 current_month_number = (current_month_number % 12) + 1
                 period.month_number = current_month_number
                 period.is_leap = False
-                self.logger.info(f"  Step 2: Assign to period")
-                self.logger.info(f"          period.month_number = {current_month_number}")
-                self.logger.info(f"          period.is_leap = False")
-                self.logger.info(f"  Step 3: Update tracker")
-                self.logger.info(f"          current_month_number = {current_month_number} (for next iteration)")
-                self.logger.info(f"\n  → RESULT: Regular month {current_month_number} assigned")
             else:
                 # Leap month - takes previous month number
-                self.logger.info(f"\n  ✗ NO PRINCIPAL TERM - This is a LEAP month")
-                self.logger.info(f"  Step 1: Identify preceding month number")
-                self.logger.info(f"          Preceding month number = {current_month_number}")
-                self.logger.info(f"  Step 2: Assign to period (per rule: leap takes PRECEDING month number)")
                 period.month_number = current_month_number
                 period.is_leap = True
-                self.logger.info(f"          period.month_number = {current_month_number}")
-                self.logger.info(f"          period.is_leap = True")
-                self.logger.info(f"  Step 3: Keep tracker unchanged")
-                self.logger.info(f"          current_month_number = {current_month_number} (unchanged for next)")
-                self.logger.info(f"\n  → RESULT: Leap month {current_month_number} assigned")
-        
-        # Note: No backward pass needed - WindowPlanner ensures Zi month is at list start
-        if zi_month_index > 0:
-            self.logger.info("\n" + "-" * 80)
-            self.logger.info(f"NOTE: {zi_month_index} period(s) before Zi month exist in window")
-            self.logger.info("These are outside the calculation scope and remain unnumbered")
-            self.logger.info("-" * 80)
-        
-        # Summary
-        self.logger.info("\n" + "=" * 80)
-        self.logger.info("FINAL MONTH NUMBERING SUMMARY")
-        self.logger.info("=" * 80)
-        for i, period in enumerate(periods):
-            leap_indicator = "LEAP" if period.is_leap else "    "
-            term_indicator = "✓" if period.has_principal_term else "✗"
-            self.logger.info(
-                f"Period {i:2d}: Month {period.month_number:2d} [{leap_indicator}] "
-                f"Term:{term_indicator} | {period.start_cst_date} to {period.end_cst_date}"
-            )
-        self.logger.info("=" * 80 + "\n")
+        
+        # Note: No backward pass needed - WindowPlanner ensures Zi month is at list start;
+        # periods before it are outside the calculation scope and remain unnumbered
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if trace is None and debug:
+            trace = MonthNumberingTrace()
+        if trace is not None:
+            trace.record(periods, anchor_solstice_utc, zi_month_index)
+            if debug:
+                logger.debug("Month numbering:\n%s", trace)
     
     def _find_zi_month(self, periods: List[MonthPeriod], anchor_solstice_utc: datetime) -> int:
         """Find the month period that contains the Winter Solstice."""
@@ -457,64 +506,26 @@ class SexagenaryEngine:
     """Calculates sexagenary cycles for year, month, day, and hour."""
     
     def __init__(self, timezone_service: TimezoneService):
-        self.logger = setup_logging()
         self.tz_service = timezone_service
     
     def ganzhi_year(self, lunar_year: int) -> Tuple[str, str, int]:
         """Use 4 AD as authoritative Jiazi anchor; return (stem, branch, cycleIndex 1..60)."""
         year_cycle = (lunar_year - 4) % 60 + 1
-        if year_cycle <= 0:
-            year_cycle += 60
         
         stem_char, branch_char, _, _ = self._get_stem_branch(year_cycle)
         return stem_char, branch_char, year_cycle
     
     def ganzhi_month(self, lunar_year: int, lunar_month: int) -> Tuple[str, str, int]:
         """Calculate month stem and branch using traditional rules based on year stem."""
-        # Get year stem for month stem calculation
-        year_stem, _, _ = self.ganzhi_year(lunar_year)
-        year_stem_idx = next((i for i, (char, _, _, _) in enumerate(HEAVENLY_STEMS) if char == year_stem), 0) + 1
-        
-        # Traditional month stem calculation mapping
-        mapping_first_month_stem = {
-            1: 3, 6: 3,   # 甲/己 -> 丙 (index 3)
-            2: 5, 7: 5,   # 乙/庚 -> 戊 (index 5)
-            3: 7, 8: 7,   # 丙/辛 -> 庚 (index 7)
-            4: 9, 9: 9,   # 丁/壬 -> 壬 (index 9)
-            5: 1, 10: 1,  # 戊/癸 -> 甲 (index 1)
-        }
-        
-        first_month_stem_idx = mapping_first_month_stem[year_stem_idx]
-        month_stem_idx = ((first_month_stem_idx - 1 + (lunar_month - 1)) % 10) + 1
-        
-        # Month branch calculation
-        month_branch_idx = (lunar_month + 2) % 12
-        if month_branch_idx == 0:
-            month_branch_idx = 12
-        
-        # Get stem and branch characters
-        month_stem_char = HEAVENLY_STEMS[month_stem_idx - 1][0]
-        month_branch_char = EARTHLY_BRANCHES[month_branch_idx - 1][0]
-        
-        # Calculate month cycle from stem-branch pair
-        month_cycle = self._calculate_cycle_from_stem_branch(month_stem_idx, month_branch_idx)
-        
-        return month_stem_char, month_branch_char, month_cycle
+        month_cycle = int(self.ganzhi_month_array(lunar_year, lunar_month))
+        stem_char, branch_char, _, _ = self._get_stem_branch(month_cycle)
+        return stem_char, branch_char, month_cycle
     
     def ganzhi_day(self, target_local: datetime) -> Tuple[str, str, int]:
         """Day cycle using continuous count and documented historical anchors.
         Note: Keep canonical anchor date per rules doc."""
-        # Anchor: January 31, 4 AD (Jiazi day), defined in UTC for consistency.
-        reference_date_utc = datetime(4, 1, 31, tzinfo=timezone.utc)
-        
-        # Convert the local target datetime to UTC to ensure correct day counting.
-        target_utc = self.tz_service.local_to_utc(target_local)
-        
-        # Calculate the difference in days at the UTC level.
-        days_diff = (target_utc.date() - reference_date_utc.date()).days
-        
-        # The cycle calculation remains the same.
-        day_cycle = (days_diff % 60) + 1
+        # Anchor: January 31, 4 AD (Jiazi day), counted in whole UTC days.
+        day_cycle = (self._utc_ordinal(target_local) - JIAZI_DAY_ORDINAL) % 60 + 1
         
         stem_char, branch_char, _, _ = self._get_stem_branch(day_cycle)
         return stem_char, branch_char, day_cycle
@@ -532,23 +543,74 @@ class SexagenaryEngine:
         # Handle 23:00-23:59 boundary (belongs to next day's Zi hour)
         if hour >= 23:
             # Advance to the next day in the same timezone to get the correct stem.
-            next_day_local = target_local + timedelta(days=1)
-            next_day_stem, _, _ = self.ganzhi_day(next_day_local)
-            base_day_stem = next_day_stem
+            next_day_cycle = (self._utc_ordinal(target_local) + 1 - JIAZI_DAY_ORDINAL) % 60 + 1
+            base_day_stem, _, _, _ = self._get_stem_branch(next_day_cycle)
         
         # Calculate hour stem using Wu Shu Dun rule
         hour_stem_char = self._calculate_hour_stem(base_day_stem, hour_branch_index)
         
         # Calculate hour cycle
-        stem_index = next((i for i, (char, _, _, _) in enumerate(HEAVENLY_STEMS) if char == hour_stem_char), 0)
-        hour_cycle = self._calculate_cycle_from_stem_branch(stem_index + 1, hour_branch_index)
+        hour_cycle = self._calculate_cycle_from_stem_branch(STEM_INDEX[hour_stem_char] + 1, hour_branch_index)
         
         return hour_stem_char, hour_branch_char, hour_cycle
     
+    @staticmethod
+    def ganzhi_year_array(lunar_years) -> np.ndarray:
+        """Year cycle numbers (1..60) for an int array of lunar years."""
+        return ((np.asarray(lunar_years, dtype=np.int64) - 4) % 60 + 1).astype(np.int8)
+    
+    @staticmethod
+    def ganzhi_month_array(lunar_years, lunar_months) -> np.ndarray:
+        """Month cycle numbers (1..60) for int arrays of lunar years and month numbers (1..12)."""
+        year_stem_0 = (np.asarray(lunar_years, dtype=np.int64) - 4) % 10
+        month_0 = np.asarray(lunar_months, dtype=np.int64) - 1
+        month_stem_0 = (FIRST_MONTH_STEMS[year_stem_0] + month_0) % 10
+        month_branch_0 = (month_0 + 2) % 12
+        return CYCLE_FROM_STEM_BRANCH[month_stem_0, month_branch_0]
+    
+    @staticmethod
+    def ganzhi_day_array(utc_ordinals) -> np.ndarray:
+        """Day cycle numbers (1..60) for an int array of proleptic UTC day ordinals."""
+        return ((np.asarray(utc_ordinals, dtype=np.int64) - JIAZI_DAY_ORDINAL) % 60 + 1).astype(np.int8)
+    
+    @staticmethod
+    def ganzhi_day_hour_arrays(epoch_seconds, timezone_handler: TimezoneHandler) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Day cycles, hour cycles and local hours for int64 UTC instants.
+        
+        Uses the timezone's precomputed UTC offset table and integer math only.
+        
+        Returns:
+            Tuple of (day_cycle, hour_cycle, local_hour) arrays
+        """
+        epoch = np.asarray(epoch_seconds, dtype=np.int64)
+        local_hour = (epoch + timezone_handler.utc_offsets(epoch)) // 3600 % 24
+        day_cycle = SexagenaryEngine.ganzhi_day_array(epoch // 86400 + UNIX_EPOCH_ORDINAL)
+        return day_cycle, SexagenaryEngine.ganzhi_hour_array(day_cycle, local_hour), local_hour
+    
+    @staticmethod
+    def ganzhi_hour_array(day_cycles, local_hours) -> np.ndarray:
+        """Hour cycle numbers (1..60) for int arrays of day cycles and local hours (0..23).
+        
+        day_cycles are the ganzhi_day_array values of the same instants; 23:00-23:59
+        takes the next day's stem (Wu Shu Dun).
+        """
+        local_hours = np.asarray(local_hours, dtype=np.int64)
+        hour_branch_0 = (local_hours + 1) // 2 % 12
+        day_stem_0 = (np.asarray(day_cycles, dtype=np.int64) - 1 + (local_hours >= 23)) % 10
+        return CYCLE_FROM_STEM_BRANCH[HOUR_STEM_TABLE[day_stem_0, hour_branch_0], hour_branch_0]
+    
+    def _utc_ordinal(self, target_local: datetime) -> int:
+        """Proleptic ordinal of the UTC date of a local datetime, from its UTC offset."""
+        offset = target_local.utcoffset()
+        if offset is None:
+            return self.tz_service.local_to_utc(target_local).date().toordinal()
+        seconds = target_local.hour * 3600 + target_local.minute * 60 + target_local.second
+        return target_local.toordinal() + (seconds - offset.days * 86400 - offset.seconds) // 86400
+    
     def _get_stem_branch(self, cycle_number: int) -> Tuple[str, str, int, int]:
         """Get Heavenly Stem and Earthly Branch for a given cycle number."""
-        stem_index = (cycle_number - 1) % 10
-        branch_index = (cycle_number - 1) % 12
+        stem_index = int(CYCLE_STEMS[cycle_number - 1])
+        branch_index = int(CYCLE_BRANCHES[cycle_number - 1])
         
         stem_char = HEAVENLY_STEMS[stem_index][0]
         branch_char = EARTHLY_BRANCHES[branch_index][0]
@@ -557,16 +619,8 @@ class SexagenaryEngine:
     
     def _get_hour_branch(self, hour: int, minute: int = 0) -> Tuple[str, str, int]:
         """Get the Earthly Branch for a given hour."""
-        decimal_hour = hour + minute / 60.0
-        
-        # Handle the special case where 23:00-01:00 is 子 (Zi)
-        if decimal_hour >= 23.0 or decimal_hour < 1.0:
-            branch_index = 0  # 子 (Zi)
-        else:
-            # For other hours, calculate normally
-            branch_index = int((decimal_hour - 1.0) // 2.0) + 1
-            if branch_index >= 12:
-                branch_index = 11
+        # 23:00-01:00 is 子 (Zi), then one branch per two hours
+        branch_index = (hour + 1) // 2 % 12
         
         branch_char = EARTHLY_BRANCHES[branch_index][0]
         branch_name = EARTHLY_BRANCHES[branch_index][2]
@@ -575,46 +629,23 @@ class SexagenaryEngine:
     
     def _calculate_hour_stem(self, day_stem: str, hour_branch_index: int) -> str:
         """Calculate hour stem using Wu Shu Dun (五鼠遁) rule."""
-        # Wu Shu Dun mapping: day stem -> Zi hour stem
-        wu_shu_dun = {
-            '甲': 0, '己': 0,  # Jiazi starts with 甲
-            '乙': 2, '庚': 2,  # Bingzi starts with 丙
-            '丙': 4, '辛': 4,  # Wuzi starts with 戊
-            '丁': 6, '壬': 6,  # Gengzi starts with 庚
-            '戊': 8, '癸': 8   # Renzi starts with 壬
-        }
-        
-        zi_hour_stem_index = wu_shu_dun.get(day_stem, 0)
-        hour_stem_index = (zi_hour_stem_index + hour_branch_index - 1) % 10
-        
+        hour_stem_index = HOUR_STEM_TABLE[STEM_INDEX.get(day_stem, 0), hour_branch_index - 1]
         return HEAVENLY_STEMS[hour_stem_index][0]
     
     def _calculate_cycle_from_stem_branch(self, stem_idx: int, branch_idx: int) -> int:
         """Calculate 60-cycle position from stem and branch indices."""
-        # Convert to 0-based indices
-        stem_0 = stem_idx - 1
-        branch_0 = branch_idx - 1
-        
-        # Find the cycle position where stem and branch align
-        for cycle in range(1, 61):
-            cycle_stem = (cycle - 1) % 10
-            cycle_branch = (cycle - 1) % 12
-            if cycle_stem == stem_0 and cycle_branch == branch_0:
-                return cycle
-        
-        # Fallback (should not happen with valid inputs)
-        return 1
+        return int(CYCLE_FROM_STEM_BRANCH[stem_idx - 1, branch_idx - 1])
 
 
 class LunarMonthResolver:
     """Resolves target month information from periods."""
     
     def __init__(self, timezone_service: TimezoneService):
-        self.logger = setup_logging()
         self.tz_service = timezone_service
     
-    def find_period_for_datetime(self, periods: List[MonthPeriod], target_utc: datetime) -> MonthPeriod:
-        """Match by CST date-only boundaries: startCstDate <= targetCstDate < endCstDate."""
+    def find_period_for_datetime(self, periods: Union[List[MonthPeriod], PeriodIndex], target_utc: datetime) -> MonthPeriod:
+        """Match by CST date-only boundaries: startCstDate <= targetCstDate < endCstDate.
+        Pass a prebuilt PeriodIndex to resolve many targets against the same periods."""
         # Ensure timezone-naive datetime for CST conversion
         if target_utc.tzinfo is not None:
             target_naive = target_utc.replace(tzinfo=None)
@@ -623,11 +654,11 @@ class LunarMonthResolver:
             
         target_cst_date = self.tz_service.utc_to_cst_date(target_naive)
         
-        for period in periods:
-            if period.start_cst_date <= target_cst_date < period.end_cst_date:
-                return period
-        
-        raise ValueError(f"No period found for date {target_cst_date}")
+        index = periods if isinstance(periods, PeriodIndex) else PeriodIndex(periods)
+        period = index.find(target_cst_date)
+        if period is None:
+            raise ValueError(f"No period found for date {target_cst_date}")
+        return period
     
     def calculate_lunar_day(self, target_utc: datetime, period: MonthPeriod) -> int:
         """Return day-in-month using CST date-only difference from period.startCstDate, bounded 1..30."""
@@ -666,12 +697,31 @@ class LunarMonthResolver:
             return period_start.year + 1
 
 
+def _epoch_seconds(dt: datetime) -> int:
+    """Whole Unix seconds for a datetime (naive values are taken as UTC)."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - datetime(1970, 1, 1, tzinfo=timezone.utc)) // timedelta(seconds=1)
+
+
+def _period_from_table(month: TableMonth) -> MonthPeriod:
+    """Build a MonthPeriod from a precomputed table row."""
+    epoch = datetime(1970, 1, 1)
+    return MonthPeriod(
+        index=month.index,
+        start_utc=epoch + timedelta(seconds=month.start_epoch),
+        end_utc=epoch + timedelta(seconds=month.end_epoch),
+        start_cst_date=date.fromordinal(month.start_ordinal),
+        end_cst_date=date.fromordinal(month.end_ordinal),
+        has_principal_term=month.has_principal_term,
+        is_leap=month.is_leap,
+        month_number=month.month_number
+    )
+
+
 class ResultAssembler:
     """Assembles the final LunisolarDateDTO."""
     
-    def __init__(self):
-        self.logger = setup_logging()
-    
     def assemble_result(
         self,
         lunar_year: int,
@@ -711,260 +761,331 @@ class ResultAssembler:
         )
 
 
+class LunisolarConverter:
+    """Long-lived lunisolar converter for one timezone.
+    
+    Owns the service graph (timezone handling, window planning, ephemeris
+    searches, month numbering, sexagenary engine) so repeated conversions
+    only do the per-date work. Dates inside the precomputed month table are
+    resolved from it; for other dates the numbered month periods of each
+    anchor Winter Solstice are computed once and kept in an LRU cache keyed
+    by the anchor year, so later dates under the same anchor need no new
+    ephemeris search. Safe to share between threads.
+    
+    Usage:
+        converter = LunisolarConverter('Asia/Shanghai')
+        result = converter.convert("2025-01-15", "14:30")
+        results = converter.convert_range("2025-01-01", "2025-12-31")
+    """
+    
+    def __init__(
+        self,
+        timezone_name: str = 'Asia/Shanghai',
+        use_table: bool = True,
+        cache_anchors: int = LUNISOLAR_CACHE_ANCHORS
+    ):
+        """
+        Build the service graph for one timezone.
+        
+        Args:
+            timezone_name: IANA timezone name (default: 'Asia/Shanghai' for CST)
+            use_table: If True, resolve dates from the precomputed month table
+                       when inside its range (default: True)
+            cache_anchors: Maximum number of anchor years whose numbered month
+                           periods are kept in memory
+        """
+        self.timezone_name = timezone_name
+        self.use_table = use_table
+        self.cache_anchors = cache_anchors
+        self.tz_service = TimezoneService(TimezoneHandler(timezone_name))
+        self.window_planner = WindowPlanner()
+        self.ephemeris_service = EphemerisService()
+        self.month_builder = MonthBuilder(self.tz_service)
+        self.term_indexer = TermIndexer()
+        self.leap_assigner = LeapMonthAssigner()
+        self.sexagenary_engine = SexagenaryEngine(self.tz_service)
+        self.month_resolver = LunarMonthResolver(self.tz_service)
+        self.result_assembler = ResultAssembler()
+        self._anchors: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def convert(self, solar_date: str, solar_time: str = "12:00") -> LunisolarDateDTO:
+        """
+        Convert a local solar date and time to a lunisolar date.
+        
+        Args:
+            solar_date: Solar date in YYYY-MM-DD format
+            solar_time: Solar time in HH:MM format (default: 12:00)
+            
+        Returns:
+            LunisolarDateDTO object with complete lunisolar information
+        """
+        logger.debug("Converting %s %s to lunisolar", solar_date, solar_time)
+        return self.convert_datetime(self.tz_service.parse_local_datetime(solar_date, solar_time))
+    
+    def convert_many(self, date_range: Sequence[Tuple[str, str]]) -> List[LunisolarDateDTO]:
+        """
+        Convert many local solar dates and times.
+        
+        Args:
+            date_range: (date_str, time_str) tuples, e.g. [("YYYY-MM-DD", "HH:MM"), ...]
+            
+        Returns:
+            List of LunisolarDateDTO objects in the same order as input
+        """
+        return [self.convert(solar_date, solar_time) for solar_date, solar_time in date_range]
+    
+    def convert_range(self, start_date: str, end_date: str, solar_time: str = "12:00") -> List[LunisolarDateDTO]:
+        """
+        Convert every local date from start_date to end_date inclusive at one time of day.
+        
+        Args:
+            start_date: First solar date in YYYY-MM-DD format
+            end_date: Last solar date in YYYY-MM-DD format
+            solar_time: Solar time in HH:MM format (default: 12:00)
+            
+        Returns:
+            List of LunisolarDateDTO objects, one per day
+        """
+        first = date.fromisoformat(start_date)
+        days = (date.fromisoformat(end_date) - first).days + 1
+        return self.convert_many([((first + timedelta(days=i)).isoformat(), solar_time) for i in range(days)])
+    
+    def convert_datetime(self, local_datetime: datetime) -> LunisolarDateDTO:
+        """
+        Convert a timezone-aware local datetime to a lunisolar date.
+        
+        Args:
+            local_datetime: Datetime localized to this converter's timezone
+            
+        Returns:
+            LunisolarDateDTO object with complete lunisolar information
+        """
+        target_utc = self.tz_service.local_to_utc(local_datetime)
+        target_period, lunar_year = self._resolve_month(target_utc)
+        lunar_day = self.month_resolver.calculate_lunar_day(target_utc, target_period)
+        
+        # Calculate sexagenary cycles
+        engine = self.sexagenary_engine
+        day_ganzhi = engine.ganzhi_day(local_datetime)
+        result = self.result_assembler.assemble_result(
+            lunar_year=lunar_year,
+            target_period=target_period,
+            lunar_day=lunar_day,
+            local_hour=local_datetime.hour,
+            year_ganzhi=engine.ganzhi_year(lunar_year),
+            month_ganzhi=engine.ganzhi_month(lunar_year, target_period.month_number),
+            day_ganzhi=day_ganzhi,
+            hour_ganzhi=engine.ganzhi_hour(local_datetime, day_ganzhi[0])
+        )
+        logger.debug("Conversion completed: %d-%d-%d", result.year, result.month, result.day)
+        return result
+    
+    def _resolve_month(self, target_utc: datetime) -> Tuple[MonthPeriod, int]:
+        """Return (month period, lunar year) for a UTC instant."""
+        # Fast path: binary search in the precomputed month table
+        table = get_month_table() if self.use_table else None
+        table_month = table.resolve(_epoch_seconds(target_utc)) if table else None
+        if table_month is not None:
+            return _period_from_table(table_month), table_month.lunar_year
+        
+        # Anchor is the latest Winter Solstice at or before the target
+        target_naive = target_utc.replace(tzinfo=None) if target_utc.tzinfo else target_utc
+        anchor_year = target_naive.year
+        if target_naive < self.window_planner.winter_solstice(anchor_year):
+            anchor_year -= 1
+        anchor_solstice, period_index = self._numbered_periods(anchor_year)
+        
+        target_period = self.month_resolver.find_period_for_datetime(period_index, target_utc)
+        return target_period, self.month_resolver.calculate_lunar_year(target_period, anchor_solstice)
+    
+    def _numbered_periods(self, anchor_year: int) -> Tuple[datetime, PeriodIndex]:
+        """Month periods numbered from the Winter Solstice of anchor_year, computed once per anchor."""
+        with self._lock:
+            cached = self._anchors.get(anchor_year)
+            if cached is not None:
+                self._anchors.move_to_end(anchor_year)
+                return cached
+            
+            # Window spans this solstice to the next, expanded by 30 days on each side
+            anchor_solstice = self.window_planner.winter_solstice(anchor_year)
+            window_start, window_end = self.window_planner.compute_window(anchor_solstice)
+            
+            new_moons = self.ephemeris_service.compute_new_moons(window_start, window_end)
+            principal_terms = self.ephemeris_service.compute_principal_terms(window_start, window_end)
+            if not new_moons:
+                raise ValueError("No new moons found in calculation window")
+            
+            # Build month periods, map terms and number them from the anchor
+            periods = self.month_builder.build_month_periods(new_moons)
+            period_index = PeriodIndex(periods)
+            self.term_indexer.tag_principal_terms(period_index, principal_terms)
+            self.leap_assigner.assign_month_numbers(periods, anchor_solstice)
+            
+            cached = self._anchors[anchor_year] = (anchor_solstice, period_index)
+            if len(self._anchors) > self.cache_anchors:
+                self._anchors.popitem(last=False)
+            return cached
+
+
+_converters_lock = threading.Lock()
+_converters: Dict[Tuple[str, bool], LunisolarConverter] = {}
+
+
+def get_converter(timezone_name: str = 'Asia/Shanghai', use_table: bool = True) -> LunisolarConverter:
+    """Return the process-wide LunisolarConverter for a timezone, building it on first use."""
+    key = (timezone_name, use_table)
+    converter = _converters.get(key)
+    if converter is None:
+        with _converters_lock:
+            converter = _converters.get(key)
+            if converter is None:
+                converter = _converters[key] = LunisolarConverter(timezone_name, use_table)
+    return converter
+
+
+def _warn_quiet_ignored(quiet: Optional[bool]) -> None:
+    """Warn callers that still pass the ignored quiet flag."""
+    if quiet is not None:
+        warnings.warn("quiet is deprecated and ignored; per-conversion logging is DEBUG-only",
+                      DeprecationWarning, stacklevel=3)
+
+
 def solar_to_lunisolar_batch(
     date_range: List[Tuple[str, str]],
     timezone_name: str = 'Asia/Shanghai',
-    quiet: bool = True
+    quiet: Optional[bool] = None,
+    use_table: bool = True
 ) -> List[LunisolarDateDTO]:
     """
     Efficiently convert multiple solar dates to lunisolar dates in batch.
     
-    This function processes multiple dates using a single ephemeris window calculation,
-    making it much more efficient than calling solar_to_lunisolar repeatedly.
+    Delegates to the shared LunisolarConverter for the timezone: dates inside
+    the precomputed month table are resolved from it directly, and the rest
+    reuse one numbered window per anchor Winter Solstice, cached across calls.
     
     Args:
         date_range: List of (date_str, time_str) tuples in format [("YYYY-MM-DD", "HH:MM"), ...]
         timezone_name: IANA timezone name (default: 'Asia/Shanghai' for CST)
-        quiet: If True, suppresses info-level logging (default: True)
+        quiet: Deprecated and ignored (warns when passed); per-conversion
+               logging is DEBUG-only
+        use_table: If True, resolve dates from the precomputed month table
+                   when inside its range (default: True)
         
     Returns:
         List of LunisolarDateDTO objects in the same order as input
     """
+    _warn_quiet_ignored(quiet)
     if not date_range:
         return []
     
-    logger = setup_logging()
-    if quiet:
-        logger.setLevel(logging.WARNING)  # Only show warnings and errors
-    
     try:
-        # Initialize services
-        tz_handler = TimezoneHandler(timezone_name)
-        tz_service = TimezoneService(tz_handler)
-        window_planner = WindowPlanner()
-        ephemeris_service = EphemerisService()
-        month_builder = MonthBuilder(tz_service)
-        term_indexer = TermIndexer()
-        leap_assigner = LeapMonthAssigner()
-        sexagenary_engine = SexagenaryEngine(tz_service)
-        month_resolver = LunarMonthResolver(tz_service)
-        result_assembler = ResultAssembler()
-        
-        # Parse all dates and find the window that covers all of them
-        parsed_dates = []
-        for solar_date, solar_time in date_range:
-            local_dt = tz_service.parse_local_datetime(solar_date, solar_time)
-            target_utc = tz_service.local_to_utc(local_dt)
-            parsed_dates.append((local_dt, target_utc))
-        
-        # Find min and max dates to determine window
-        all_utc_dates = [utc for _, utc in parsed_dates]
-        min_date = min(all_utc_dates)
-        max_date = max(all_utc_dates)
-        
-        # Compute window that covers all dates
-        window_start_min, _ = window_planner.compute_window(min_date)
-        _, window_end_max = window_planner.compute_window(max_date)
-        
-        # Get ephemeris data once for entire range
-        new_moons = ephemeris_service.compute_new_moons(window_start_min, window_end_max)
-        principal_terms = ephemeris_service.compute_principal_terms(window_start_min, window_end_max)
-        
-        if not new_moons:
-            raise ValueError("No new moons found in calculation window")
-        
-        # Build month periods and map terms once
-        periods = month_builder.build_month_periods(new_moons)
-        term_indexer.tag_principal_terms(periods, principal_terms)
-        
-        # Find Winter Solstice anchors for the years involved
-        years = set(utc.year for _, utc in parsed_dates)
-        solstices = {}
-        for year in years:
-            solstices[year] = window_planner._find_winter_solstice(year)
-            solstices[year - 1] = window_planner._find_winter_solstice(year - 1)
-        
-        # Process each date
-        results = []
-        for local_datetime, target_utc in parsed_dates:
-            target_naive = target_utc.replace(tzinfo=None) if target_utc.tzinfo else target_utc
-            current_year_solstice = solstices[target_utc.year]
-            
-            if target_naive >= current_year_solstice:
-                anchor_solstice = current_year_solstice
-            else:
-                anchor_solstice = solstices[target_utc.year - 1]
-            
-            # Assign month numbers (only once per anchor)
-            # Note: This modifies periods, so we need to be careful
-            # For simplicity, we'll reassign for each date (can be optimized further)
-            leap_assigner.assign_month_numbers(periods, anchor_solstice)
-            
-            # Find target month period
-            target_period = month_resolver.find_period_for_datetime(periods, target_utc)
-            lunar_day = month_resolver.calculate_lunar_day(target_utc, target_period)
-            lunar_year = month_resolver.calculate_lunar_year(target_period, anchor_solstice)
-            
-            # Calculate sexagenary cycles
-            year_ganzhi = sexagenary_engine.ganzhi_year(lunar_year)
-            month_ganzhi = sexagenary_engine.ganzhi_month(lunar_year, target_period.month_number)
-            day_ganzhi = sexagenary_engine.ganzhi_day(local_datetime)
-            hour_ganzhi = sexagenary_engine.ganzhi_hour(local_datetime, day_ganzhi[0])
-            
-            # Assemble result
-            result = result_assembler.assemble_result(
-                lunar_year=lunar_year,
-                target_period=target_period,
-                lunar_day=lunar_day,
-                local_hour=local_datetime.hour,
-                year_ganzhi=year_ganzhi,
-                month_ganzhi=month_ganzhi,
-                day_ganzhi=day_ganzhi,
-                hour_ganzhi=hour_ganzhi
-            )
-            results.append(result)
-        
-        return results
-        
+        return get_converter(timezone_name, use_table).convert_many(date_range)
     except Exception as e:
-        logger.error(f"Error in solar_to_lunisolar_batch conversion: {e}")
+        logger.error("Error in solar_to_lunisolar_batch conversion: %s", e)
         raise
-    finally:
-        if quiet:
-            logger.setLevel(logging.INFO)  # Restore default level
 
 
 def solar_to_lunisolar(
     solar_date: str,
     solar_time: str = "12:00",
     timezone_name: str = 'Asia/Shanghai',
-    quiet: bool = False
+    quiet: Optional[bool] = None,
+    use_table: bool = True
 ) -> LunisolarDateDTO:
     """
     Convert solar date and time to lunisolar date with stems and branches.
     
-    This is the main entry point that orchestrates the entire conversion pipeline
-    following the blueprint architecture.
+    This is the main entry point; it delegates to the shared LunisolarConverter
+    for the timezone, which orchestrates the conversion pipeline following the
+    blueprint architecture.
     
     Args:
         solar_date: Solar date in YYYY-MM-DD format
         solar_time: Solar time in HH:MM format (default: 12:00)
         timezone_name: IANA timezone name (default: 'Asia/Shanghai' for CST)
-        quiet: If True, suppresses info-level logging (default: False)
+        quiet: Deprecated and ignored (warns when passed); per-conversion
+               logging is DEBUG-only
+        use_table: If True, resolve the month from the precomputed month table
+                   when the date is inside its range (default: True)
         
     Returns:
         LunisolarDateDTO object with complete lunisolar information
     """
-    logger = setup_logging()
-    original_level = logger.level
+    _warn_quiet_ignored(quiet)
+    try:
+        return get_converter(timezone_name, use_table).convert(solar_date, solar_time)
+    except Exception as e:
+        logger.error("Error in solar_to_lunisolar conversion: %s", e)
+        raise
+
+
+def solar_to_lunisolar_array(
+    epoch_seconds: np.ndarray,
+    timezone_name: str = 'Asia/Shanghai'
+) -> LunisolarArrays:
+    """
+    Convert an array of UTC instants to lunisolar dates column by column.
     
-    if quiet:
-        logger.setLevel(logging.WARNING)
+    Months are resolved with np.searchsorted against the precomputed month
+    table and the sexagenary cycles with modular arithmetic, so no per-date
+    Python objects are created. Each element matches what solar_to_lunisolar
+    returns for the same instant.
     
-    try:
-        # Initialize services with the specified timezone name
-        tz_handler = TimezoneHandler(timezone_name)
-        tz_service = TimezoneService(tz_handler)
-        window_planner = WindowPlanner()
-        ephemeris_service = EphemerisService()
-        month_builder = MonthBuilder(tz_service)
-        term_indexer = TermIndexer()
-        leap_assigner = LeapMonthAssigner()
-        sexagenary_engine = SexagenaryEngine(tz_service)
-        month_resolver = LunarMonthResolver(tz_service)
-        result_assembler = ResultAssembler()
-        
-        # Parse input and convert to UTC
-        local_datetime = tz_service.parse_local_datetime(solar_date, solar_time)
-        target_utc = tz_service.local_to_utc(local_datetime)
-        
-        logger.info(f"Converting {solar_date} {solar_time} to lunisolar")
-        
-        # Plan calculation window
-        window_start, window_end = window_planner.compute_window(target_utc)
-        
-        # Get ephemeris data
-        new_moons = ephemeris_service.compute_new_moons(window_start, window_end)
-        principal_terms = ephemeris_service.compute_principal_terms(window_start, window_end)
-        
-        if not new_moons:
-            raise ValueError("No new moons found in calculation window")
-        
-        # Build month periods and map terms
-        periods = month_builder.build_month_periods(new_moons)
-        term_indexer.tag_principal_terms(periods, principal_terms)
-        
-        # Find Winter Solstice for anchor - use the correct one based on target date
-        target_naive = target_utc.replace(tzinfo=None) if target_utc.tzinfo else target_utc
-        current_year_solstice = window_planner._find_winter_solstice(target_utc.year)
-        
-        if target_naive >= current_year_solstice:
-            anchor_solstice = current_year_solstice
-        else:
-            anchor_solstice = window_planner._find_winter_solstice(target_utc.year - 1)
-        
-        # Assign month numbers and leap status
-        leap_assigner.assign_month_numbers(periods, anchor_solstice)
-        
-        # Find target month period
-        target_period = month_resolver.find_period_for_datetime(periods, target_utc)
-        lunar_day = month_resolver.calculate_lunar_day(target_utc, target_period)
-        
-        # Calculate lunar year based on month periods and their numbering
-        lunar_year = month_resolver.calculate_lunar_year(target_period, anchor_solstice)
-        
-        # Calculate sexagenary cycles
-        year_ganzhi = sexagenary_engine.ganzhi_year(lunar_year)
-        
-        # Calculate month ganzhi using traditional rules
-        month_ganzhi = sexagenary_engine.ganzhi_month(lunar_year, target_period.month_number)
-        
-        day_ganzhi = sexagenary_engine.ganzhi_day(local_datetime)
-        hour_ganzhi = sexagenary_engine.ganzhi_hour(local_datetime, day_ganzhi[0])
-        
-        # Assemble final result
-        result = result_assembler.assemble_result(
-            lunar_year=lunar_year,
-            target_period=target_period,
-            lunar_day=lunar_day,
-            local_hour=local_datetime.hour,
-            year_ganzhi=year_ganzhi,
-            month_ganzhi=month_ganzhi,
-            day_ganzhi=day_ganzhi,
-            hour_ganzhi=hour_ganzhi
-        )
+    Args:
+        epoch_seconds: Unix timestamps (UTC), any shape
+        timezone_name: IANA timezone name for the local hour (default: 'Asia/Shanghai')
         
-        logger.info(f"Conversion completed: {result.year}-{result.month}-{result.day}")
-        return result
+    Returns:
+        LunisolarArrays with the same shape as the input
         
-    except Exception as e:
-        logger.error(f"Error in solar_to_lunisolar conversion: {e}")
-        raise
-    finally:
-        if quiet:
-            logger.setLevel(original_level)
+    Raises:
+        ValueError: If the month table is unavailable or a timestamp is outside its range
+    """
+    table = get_month_table()
+    if table is None:
+        raise ValueError("Month table unavailable: generate output/json/new_moons and solar_terms first")
+    
+    epoch = np.asarray(epoch_seconds)
+    if epoch.dtype.kind == 'f':
+        epoch = np.floor(epoch)
+    epoch = epoch.astype(np.int64)
+    
+    lunar_year, month, day, is_leap = table.resolve_array(epoch)
+    
+    # Sexagenary pillars by table lookup; the day pillar counts whole UTC days
+    day_cycle, hour_cycle, local_hour = SexagenaryEngine.ganzhi_day_hour_arrays(
+        epoch, TimezoneHandler(timezone_name))
+    
+    return LunisolarArrays(
+        year=lunar_year.astype(np.int16),
+        month=month.astype(np.int8),
+        day=day,
+        hour=local_hour.astype(np.int8),
+        is_leap_month=is_leap.astype(bool),
+        year_cycle=SexagenaryEngine.ganzhi_year_array(lunar_year),
+        month_cycle=SexagenaryEngine.ganzhi_month_array(lunar_year, month),
+        day_cycle=day_cycle,
+        hour_cycle=hour_cycle
+    )
 
 
 def get_stem_pinyin(stem_char: str) -> str:
     """Get pinyin for a heavenly stem character."""
-    for char, pinyin, _, _ in HEAVENLY_STEMS:
-        if char == stem_char:
-            return pinyin
-    return ""
+    return HEAVENLY_STEMS[STEM_INDEX[stem_char]][1] if stem_char in STEM_INDEX else ""
 
 
 def get_branch_pinyin(branch_char: str) -> str:
     """Get pinyin for an earthly branch character."""
-    for char, pinyin, *_ in EARTHLY_BRANCHES:
-        if char == branch_char:
-            return pinyin
-    return ""
+    return EARTHLY_BRANCHES[BRANCH_INDEX[branch_char]][1] if branch_char in BRANCH_INDEX else ""
 
 
 if __name__ == "__main__":
     import argparse
     import sys
+    from utils import setup_logging
     
+    setup_logging()
     parser = argparse.ArgumentParser(description='Lunisolar Calendar Conversion v2')
     parser.add_argument('--date', type=str, required=True, help='Solar date in YYYY-MM-DD format')
     parser.add_argument('--time', type=str, default='12:00', help='Solar time in HH:MM format')
@@ -15,6 +15,15 @@ Usage:
 
 Example:
     python data/main.py --start-date 2025-01-01 --end-date 2025-12-31
+
+    # Full regeneration, one shard per decade spread across all cores
+    python data/main.py --start-date 1900-01-01 --end-date 2100-12-31 --shard-years 10
+
+    # Also write output/bin/{new_moons,full_moons,solar_terms}.bin
+    python data/main.py --start-date 1900-01-01 --end-date 2100-12-31 --binary
+
+    # Recompute only years that are missing or stale since the last run
+    python data/main.py --start-date 1900-01-01 --end-date 2100-12-31 --incremental
 """
 import os
 import time
@@ -23,13 +32,18 @@ import multiprocessing as mp
 from datetime import datetime, timedelta, timezone
 from concurrent.futures import ProcessPoolExecutor, as_completed
 from skyfield.api import utc
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
+import numpy as np
 from rich.console import Console
 
 # Import modular calculation functions
-from moon_phases import calculate_moon_phases
-from solar_terms import calculate_solar_terms
-from config import NUM_PROCESSES, OUTPUT_DIR
+from moon_phases import find_moon_phases
+from solar_terms import find_solar_terms
+from config import BINARY_DIR, NUM_PROCESSES, OUTPUT_DIR, SHARD_OVERLAP_DAYS
+from binary_series import export_json_series
+from ephemeris import init_worker
+from manifest import GenerationManifest, calculator_version
+from search_cache import get_search_cache
 from utils import setup_logging, write_static_json
 
 # Initialize Rich console
@@ -40,7 +54,111 @@ console = Console()
 # All calculation functions have been moved to separate modules
 
 # Setup logging
-logger = setup_logging()
+logger = setup_logging(__name__)
+
+# Calculator per dataset, returning (timestamps, values) int64 arrays;
+# each module's source hash is the dataset's code version
+CALCULATORS = {
+    "moon_phases": find_moon_phases,
+    "solar_terms": find_solar_terms,
+}
+
+def year_from_ts(ts: int) -> int:
+    """Group timestamps by UTC year (platform-independent, avoids time_t range issues)."""
+    try:
+        ts_int = int(ts)
+    except Exception:
+        ts_int = int(float(ts))
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    dt = epoch + timedelta(seconds=ts_int)
+    return dt.year
+
+def plan_shards(start_time: datetime, end_time: datetime, shard_years: int = 1) -> List[Tuple[datetime, datetime, int, int]]:
+    """Split [start_time, end_time] into year-aligned shards.
+    
+    Args:
+        start_time: Start of the requested range (UTC)
+        end_time: End of the requested range (UTC)
+        shard_years: Number of calendar years per shard (1 = yearly, 10 = decades)
+        
+    Returns:
+        List of (search_start, search_end, lo, hi) where the search window includes
+        the overlap and [lo, hi) is the Unix timestamp range the shard owns
+    """
+    overlap = timedelta(days=SHARD_OVERLAP_DAYS)
+    end_ts = int(end_time.timestamp())
+    shards = []
+    year = start_time.year
+    while year <= end_time.year:
+        next_year = year + max(1, shard_years)
+        core_start = max(start_time, datetime(year, 1, 1, tzinfo=timezone.utc))
+        core_end = min(end_time, datetime(next_year, 1, 1, tzinfo=timezone.utc))
+        lo = int(core_start.timestamp())
+        hi = min(int(datetime(next_year, 1, 1, tzinfo=timezone.utc).timestamp()), end_ts + 1)
+        shards.append((core_start - overlap, core_end + overlap, lo, hi))
+        year = next_year
+    return shards
+
+def year_ranges(lo: int, hi: int) -> List[Tuple[int, int, int]]:
+    """Split a [lo, hi) Unix timestamp range into (year, year_lo, year_hi) pieces."""
+    pieces = []
+    year = year_from_ts(lo)
+    while True:
+        next_lo = int(datetime(year + 1, 1, 1, tzinfo=timezone.utc).timestamp())
+        pieces.append((year, max(lo, int(datetime(year, 1, 1, tzinfo=timezone.utc).timestamp())), min(hi, next_lo)))
+        if next_lo >= hi:
+            return pieces
+        year += 1
+
+def write_year_files(dataset: str, results: Tuple[np.ndarray, np.ndarray], json_dir: str) -> Dict[int, Dict[str, int]]:
+    """Write a shard's events as per-year JSON files.
+    
+    Args:
+        dataset: 'moon_phases' or 'solar_terms'
+        results: (timestamps, values) arrays returned by calculate_shard
+        json_dir: Base output directory (output/json)
+        
+    Returns:
+        Event count per written file (path relative to json_dir), grouped by year
+    """
+    timestamps, values = results
+    if dataset == "moon_phases":
+        # Moon phases: split into new_moons and full_moons, store arrays of timestamps
+        series = {
+            'new_moons': timestamps[values == 0],   # New Moon
+            'full_moons': timestamps[values == 2],  # Full Moon
+        }
+    elif dataset == "solar_terms":
+        # Solar terms: store compact pairs [timestamp, index]
+        series = {'solar_terms': np.column_stack([timestamps, values])}
+    else:
+        series = {}
+    
+    written: Dict[int, Dict[str, int]] = {}
+    for subdir, rows in sorted(series.items()):
+        if not len(rows):
+            continue
+        event_times = rows if rows.ndim == 1 else rows[:, 0]
+        years = event_times.astype('datetime64[s]').astype('datetime64[Y]').astype(np.int64) + 1970
+        for y in np.unique(years).tolist():
+            rel_path = f"{subdir}/{y}.json"
+            count = write_static_json(os.path.join(json_dir, subdir, f"{y}.json"), rows[years == y].tolist())
+            if count:
+                written.setdefault(y, {})[rel_path] = count
+    return written
+
+def calculate_shard(dataset: str, search_start: datetime, search_end: datetime, lo: int, hi: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Run one calculator over a shard window and keep only the events the shard owns.
+    
+    Shards overlap so that events near a boundary are always found; filtering to
+    [lo, hi) and dropping duplicate timestamps leaves each event in exactly one shard.
+    """
+    if dataset not in CALCULATORS:
+        raise ValueError(f"Unknown dataset: {dataset}")
+    timestamps, values = CALCULATORS[dataset](search_start, search_end)
+    owned = (timestamps >= lo) & (timestamps < hi)
+    timestamps, first = np.unique(timestamps[owned], return_index=True)
+    return timestamps, values[owned][first]
 
 def main():
     """Main function with error handling and improved structure."""
@@ -49,6 +167,9 @@ def main():
         parser = argparse.ArgumentParser(description='Astronomical Data Calculator.')
         parser.add_argument('--start-date', type=str, default='2024-01-01', help='Start date in YYYY-MM-DD format.')
         parser.add_argument('--end-date', type=str, default='2024-01-07', help='End date in YYYY-MM-DD format.')
+        parser.add_argument('--shard-years', type=int, default=1, help='Calendar years per parallel shard (default: 1).')
+        parser.add_argument('--incremental', action='store_true', help='Skip years whose files are unchanged since the last run.')
+        parser.add_argument('--binary', action='store_true', help='Also write one memory-mappable .bin file per series to output/bin.')
         # Keeping arguments lean: no interactive selection, always generates moon phases and solar terms
         args = parser.parse_args()
         
@@ -76,100 +197,74 @@ def main():
         console.print(f"\n[green]📊 Generating moon phases and solar terms[/green]")
         total_start_time = time.time()
         
-        num_workers = min(NUM_PROCESSES, 2)
+        shards = plan_shards(start_time, end_time, args.shard_years)
+        base_json_dir = os.path.join(OUTPUT_DIR, 'json')
+        manifest = GenerationManifest.load(get_search_cache().kernel_hash(), json_dir=base_json_dir)
+        code_versions = {dataset: calculator_version(CALCULATORS[dataset]) for dataset in selected_files}
+
+        # In incremental mode a shard is skipped when every year it owns is fresh
+        tasks = []
+        skipped = 0
+        for shard in shards:
+            _shard_start, _shard_end, lo, hi = shard
+            for dataset in selected_files:
+                if args.incremental and all(
+                    manifest.is_fresh(dataset, y, y_lo, y_hi, code_versions[dataset])
+                    for y, y_lo, y_hi in year_ranges(lo, hi)
+                ):
+                    skipped += 1
+                    continue
+                tasks.append((dataset, shard))
+        if args.incremental:
+            logger.info(f"   • Incremental: {skipped} up-to-date shard task(s) skipped")
+
+        num_workers = max(1, min(NUM_PROCESSES, len(tasks)))
+        logger.info(f"   • Shards: {len(shards)} x {args.shard_years} year(s), "
+                    f"±{SHARD_OVERLAP_DAYS} day overlap, {num_workers} worker(s)")
+
+        files_written = []
+        moon_phase_count = 0
+        solar_term_count = 0
         
-        with ProcessPoolExecutor(max_workers=min(NUM_PROCESSES, num_workers)) as executor:
-            # Submit tasks conditionally based on selection
+        with ProcessPoolExecutor(max_workers=num_workers, initializer=init_worker) as executor:
+            # One task per (dataset, shard) so work spreads across every core
             logger.info("   📡 Submitting calculation tasks...")
             futures = {}
+            for dataset, (shard_start, shard_end, lo, hi) in tasks:
+                future = executor.submit(calculate_shard, dataset, shard_start, shard_end, lo, hi)
+                futures[future] = (dataset, lo, hi)
+            logger.info(f"   📨 Submitted {len(futures)} shard tasks")
             
-            if "moon_phases" in selected_files:
-                futures["moon_phases"] = executor.submit(calculate_moon_phases, start_time, end_time)
-                logger.info("   🌙 Submitted moon phases calculation")
-                
-            if "solar_terms" in selected_files:
-                futures["solar_terms"] = executor.submit(calculate_solar_terms, start_time, end_time)
-                logger.info("   ☀️ Submitted solar terms calculation")
-            # Collect results with progress tracking
+            # Write per-year JSON files as soon as each shard finishes
             logger.info("   ⏳ Processing results...")
-            
-            # Initialize result variables
-            moon_phases_results = []
-            solar_terms_results = []
-            
-            # Collect results conditionally with error handling
-            if "moon_phases" in selected_files:
+            for future in as_completed(futures):
+                dataset, lo, hi = futures[future]
                 try:
-                    moon_phases_results = futures["moon_phases"].result()
-                    logger.info(f"   ✓ Moon phases: {len(moon_phases_results)} phases calculated")
+                    results = future.result()
                 except Exception as e:
-                    logger.error(f"   ❌ Moon phases calculation failed: {e}")
-                    moon_phases_results = []
+                    logger.error(f"   ❌ {dataset} shard {year_from_ts(lo)} failed: {e}")
+                    continue
                 
-            if "solar_terms" in selected_files:
-                try:
-                    solar_terms_results = futures["solar_terms"].result()
-                    logger.info(f"   ✓ Solar terms: {len(solar_terms_results)} terms calculated")
-                except Exception as e:
-                    logger.error(f"   ❌ Solar terms calculation failed: {e}")
-                    solar_terms_results = []
+                written = write_year_files(dataset, results, base_json_dir)
+                for y, y_lo, y_hi in year_ranges(lo, hi):
+                    year_files = written.get(y, {})
+                    manifest.record(dataset, y, y_lo, y_hi, code_versions[dataset], year_files)
+                    files_written.extend(os.path.join(base_json_dir, rel_path) for rel_path in year_files)
+                    if dataset == "moon_phases":
+                        moon_phase_count += sum(year_files.values())
+                    elif dataset == "solar_terms":
+                        solar_term_count += sum(year_files.values())
+                manifest.save()
+                logger.info(f"   ✓ {dataset} {year_from_ts(lo)}: {len(results[0])} items")
         
-            
-        # Sort and prepare for output (results contain Unix timestamps)
-        logger.info(f"\n💾 Building JSON output chunks...")
-        # Helper to group by year (platform-independent, avoids time_t range issues)
-        def year_from_ts(ts: int) -> int:
-            try:
-                ts_int = int(ts)
-            except Exception:
-                ts_int = int(float(ts))
-            epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
-            dt = epoch + timedelta(seconds=ts_int)
-            return dt.year
+        files_written.sort()
 
-        files_written = []
-        moon_phase_count = 0
-        solar_term_count = 0
-        events_count = 0
-
-        base_json_dir = os.path.join(OUTPUT_DIR, 'json')
-
-        # Moon phases: split into new_moons and full_moons, store arrays of timestamps
-        if "moon_phases" in selected_files and moon_phases_results:
-            new_moons_by_year = {}
-            full_moons_by_year = {}
-            for timestamp, phase_index, _phase in moon_phases_results:
-                y = year_from_ts(timestamp)
-                if phase_index == 0:  # New Moon
-                    new_moons_by_year.setdefault(y, []).append(int(timestamp))
-                elif phase_index == 2:  # Full Moon
-                    full_moons_by_year.setdefault(y, []).append(int(timestamp))
-            # Write JSON per year
-            for y, arr in sorted(new_moons_by_year.items()):
-                path = os.path.join(base_json_dir, 'new_moons', f"{y}.json")
-                count = write_static_json(path, arr)
-                moon_phase_count += count
-                if count:
-                    files_written.append(path)
-            for y, arr in sorted(full_moons_by_year.items()):
-                path = os.path.join(base_json_dir, 'full_moons', f"{y}.json")
-                count = write_static_json(path, arr)
-                moon_phase_count += count
-                if count:
-                    files_written.append(path)
-
-        # Solar terms: store compact pairs [timestamp, index]
-        if "solar_terms" in selected_files and solar_terms_results:
-            solar_terms_by_year = {}
-            for timestamp, idx, *_names in solar_terms_results:
-                y = year_from_ts(timestamp)
-                solar_terms_by_year.setdefault(y, []).append([int(timestamp), int(idx)])
-            for y, arr in sorted(solar_terms_by_year.items()):
-                path = os.path.join(base_json_dir, 'solar_terms', f"{y}.json")
-                count = write_static_json(path, arr)
-                solar_term_count += count
-                if count:
-                    files_written.append(path)
+        # Binary series are rebuilt from every year on disk, not just this run's range
+        if args.binary:
+            logger.info(f"\n💾 Writing binary series to {BINARY_DIR}...")
+            for path, count in export_json_series(base_json_dir, BINARY_DIR).items():
+                logger.info(f"   • {path}: {count:,} events")
+                files_written.append(path)
 
         total_end_time = time.time()
         execution_time = total_end_time - total_start_time
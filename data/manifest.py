@@ -0,0 +1,164 @@
+"""Generation manifest for incremental regeneration of output/json.
+
+``main.py --incremental`` only recomputes years whose inputs changed. The
+manifest records, for every dataset and year that was written:
+- The SHA-256 of the kernel file the events were computed with
+- A code version (the calculator module's CALCULATOR_VERSION and
+  OUTPUT_FORMAT_VERSION)
+- The [lo, hi) Unix timestamp range the year was computed over
+- Checksum and event count of each JSON file written for the year
+
+A year is fresh when the kernel and code version still match, the recorded
+range covers the requested one, and every recorded file is still on disk with
+the same checksum. Anything else is recomputed.
+
+The manifest lives next to ``output/json`` rather than inside it, so the
+TypeScript package's copy-data scripts do not ship it.
+
+Usage:
+    manifest = GenerationManifest.load(kernel_sha256)
+    if not manifest.is_fresh('solar_terms', 2025, lo, hi, code_version):
+        ...  # recompute, write files, then:
+        manifest.record('solar_terms', 2025, lo, hi, code_version, {'solar_terms/2025.json': 24})
+        manifest.save()
+"""
+
+import os
+import json
+import hashlib
+import inspect
+import logging
+from typing import Any, Callable, Dict, Optional
+from config import MANIFEST_FILE, OUTPUT_DIR
+from utils import write_static_json
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+# Bump when the JSON layout changes for every dataset at once
+OUTPUT_FORMAT_VERSION = 1
+_HASH_BLOCK_SIZE = 1 << 20
+
+
+def file_sha256(path: str) -> str:
+    """SHA-256 hex digest of a file's contents."""
+    sha = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b''):
+            sha.update(block)
+    return sha.hexdigest()
+
+
+def calculator_version(calculator: Callable) -> str:
+    """Code version of a calculator.
+
+    Combines OUTPUT_FORMAT_VERSION with the CALCULATOR_VERSION of the module
+    defining the calculator, the same version that keys its search cache. Only
+    bumping one of them marks the dataset's years stale; edits that leave the
+    output unchanged do not.
+    """
+    module = inspect.getmodule(calculator)
+    return f"{OUTPUT_FORMAT_VERSION}.{module.CALCULATOR_VERSION}"
+
+
+class GenerationManifest:
+    """Per-dataset, per-year record of what output/json was generated from."""
+
+    def __init__(self, kernel_sha256: str, data: Optional[Dict[str, Any]] = None,
+                 path: str = MANIFEST_FILE, json_dir: Optional[str] = None):
+        """
+        Initialize the manifest.
+
+        Args:
+            kernel_sha256: SHA-256 of the kernel used for this run
+            data: Previously saved manifest contents, if any
+            path: Location of the manifest file (default: output/json_manifest.json)
+            json_dir: Directory the recorded file paths are relative to
+                      (default: output/json)
+        """
+        self.path = path
+        self.json_dir = json_dir or os.path.join(OUTPUT_DIR, 'json')
+        self.kernel_sha256 = kernel_sha256
+        self.datasets: Dict[str, Dict[str, Any]] = {}
+        if data and data.get('version') == MANIFEST_VERSION and data.get('kernel_sha256') == kernel_sha256:
+            self.datasets = data.get('datasets', {})
+        elif data:
+            logger.info("Manifest was written for a different kernel or format; all years are stale")
+
+    @classmethod
+    def load(cls, kernel_sha256: str, path: str = MANIFEST_FILE,
+             json_dir: Optional[str] = None) -> 'GenerationManifest':
+        """Read the manifest from disk, starting empty if it is missing or unreadable."""
+        data = None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            pass
+        return cls(kernel_sha256, data, path, json_dir)
+
+    def is_fresh(self, dataset: str, year: int, lo: int, hi: int, code_version: str) -> bool:
+        """Return True if the year's files are up to date for [lo, hi).
+
+        Args:
+            dataset: Calculator name, e.g. 'moon_phases'
+            year: Gregorian year of the output files
+            lo: Start of the requested range within the year (Unix seconds)
+            hi: End (exclusive) of the requested range within the year
+            code_version: Current code version of the calculator
+
+        Returns:
+            True if the year can be skipped
+        """
+        entry = self._dataset(dataset, code_version).get('years', {}).get(str(year))
+        if entry is None or entry['lo'] > lo or entry['hi'] < hi:
+            return False
+        for rel_path, info in entry['files'].items():
+            path = os.path.join(self.json_dir, rel_path)
+            try:
+                if file_sha256(path) != info['sha256']:
+                    return False
+            except OSError:
+                return False
+        return True
+
+    def record(self, dataset: str, year: int, lo: int, hi: int, code_version: str,
+               files: Dict[str, int]) -> None:
+        """Record the files written for a year.
+
+        Args:
+            dataset: Calculator name
+            year: Gregorian year of the output files
+            lo: Start of the computed range within the year (Unix seconds)
+            hi: End (exclusive) of the computed range within the year
+            code_version: Code version the files were computed with
+            files: Event count per written file, keyed by path relative to json_dir
+        """
+        entry = {
+            'lo': int(lo),
+            'hi': int(hi),
+            'files': {
+                rel_path: {
+                    'sha256': file_sha256(os.path.join(self.json_dir, rel_path)),
+                    'count': int(count),
+                }
+                for rel_path, count in sorted(files.items())
+            },
+        }
+        self._dataset(dataset, code_version).setdefault('years', {})[str(year)] = entry
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        write_static_json(self.path, {
+            'version': MANIFEST_VERSION,
+            'kernel_sha256': self.kernel_sha256,
+            'datasets': self.datasets,
+        })
+
+    def _dataset(self, dataset: str, code_version: str) -> Dict[str, Any]:
+        """Dataset section, reset when the code version changed."""
+        section = self.datasets.get(dataset)
+        if section is None or section.get('code_version') != code_version:
+            section = {'code_version': code_version, 'years': {}}
+            self.datasets[dataset] = section
+        return section
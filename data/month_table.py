@@ -0,0 +1,309 @@
+"""Precomputed lunar month table.
+
+The lunisolar month structure between 1900 and 2100 is fully determined by the
+new moon and solar term series that the pipeline already writes to
+``output/json/new_moons`` and ``output/json/solar_terms``. This module turns
+those series into a compact, sorted table of month periods so that a date can
+be resolved with a binary search instead of fresh ephemeris root searches.
+
+The numbering follows the same rules as ``LeapMonthAssigner`` in
+``lunisolar_v2``:
+- Month boundaries and principal-term membership use CST (UTC+8) dates
+- The month containing the Winter Solstice instant is month 11 (Zi month)
+- Counting forward from the Zi month, a month with a principal term takes the
+  next number and a month without one is a leap month repeating the previous
+  number
+
+A date is numbered from the latest Winter Solstice at or before it, exactly as
+the live engine does, so a period near a solstice can carry two numberings.
+Each row keeps the numbering of its own anchor plus the one continued from the
+previous anchor.
+
+Usage:
+    from month_table import get_month_table
+    table = get_month_table()
+    month = table.resolve(1738154158)  # None when outside the table range
+"""
+
+import os
+import threading
+from typing import List, NamedTuple, Optional, Sequence, Tuple
+import numpy as np
+from config import BINARY_DIR, OUTPUT_DIR
+from binary_series import BinarySeries, binary_is_stale
+from utils import read_year_chunks
+
+# Solar term index (Skyfield ordering, 0 = Spring Equinox) of the Winter Solstice
+WINTER_SOLSTICE_TERM = 18
+# CST is fixed at UTC+8 for month boundaries
+CST_OFFSET_SECONDS = 8 * 3600
+SECONDS_PER_DAY = 86400
+# date(1970, 1, 1).toordinal()
+UNIX_EPOCH_ORDINAL = 719163
+
+
+class TableMonth(NamedTuple):
+    """A lunar month period resolved from the table for a specific instant."""
+    index: int
+    start_epoch: int
+    end_epoch: int
+    start_ordinal: int
+    end_ordinal: int
+    has_principal_term: bool
+    month_number: int
+    is_leap: bool
+    lunar_year: int
+
+
+def epoch_to_cst_ordinal(epoch_seconds):
+    """Convert Unix seconds to proleptic CST day ordinals.
+
+    Accepts a scalar or a NumPy array.
+    """
+    return (epoch_seconds + CST_OFFSET_SECONDS) // SECONDS_PER_DAY + UNIX_EPOCH_ORDINAL
+
+
+def _utc_year(epoch_seconds: np.ndarray) -> np.ndarray:
+    """Return the UTC Gregorian year of each Unix timestamp."""
+    return epoch_seconds.astype('datetime64[s]').astype('datetime64[Y]').astype(np.int64) + 1970
+
+
+class LunarMonthTable:
+    """Sorted array of numbered lunar month periods with O(log n) lookup."""
+
+    def __init__(self, new_moons: Sequence[int], solar_terms: Sequence[Tuple[int, int]]):
+        """
+        Build the table from new moon instants and solar terms.
+
+        Args:
+            new_moons: Unix timestamps of new moons
+            solar_terms: (unix_timestamp, term_index) pairs in Skyfield ordering
+        """
+        moons = np.unique(np.asarray(new_moons, dtype=np.int64))
+        if len(moons) < 2:
+            raise ValueError("At least two new moons are required to build a month table")
+
+        self.start_epoch = moons[:-1]
+        self.end_epoch = moons[1:]
+        self.start_ordinal = epoch_to_cst_ordinal(self.start_epoch)
+        self.end_ordinal = epoch_to_cst_ordinal(self.end_epoch)
+        start_year = _utc_year(self.start_epoch)
+        n = len(self.start_epoch)
+
+        terms = np.asarray(solar_terms, dtype=np.int64).reshape(-1, 2)
+        terms = terms[np.argsort(terms[:, 0], kind='stable')]
+
+        # Principal terms (even indices) tag the period holding their CST date
+        principal_ordinals = epoch_to_cst_ordinal(terms[terms[:, 1] % 2 == 0, 0])
+        rows = np.searchsorted(self.start_ordinal, principal_ordinals, side='right') - 1
+        inside = (rows >= 0) & (principal_ordinals < self.end_ordinal[np.clip(rows, 0, n - 1)])
+        self.has_principal_term = np.zeros(n, dtype=bool)
+        self.has_principal_term[rows[inside]] = True
+
+        # Zi month for each solstice: period whose UTC span contains the instant
+        solstices = terms[terms[:, 1] == WINTER_SOLSTICE_TERM, 0]
+        zi_rows = np.searchsorted(self.start_epoch, solstices, side='right') - 1
+        valid = (zi_rows >= 0) & (solstices < self.end_epoch[np.clip(zi_rows, 0, n - 1)])
+        self.solstice_epoch = solstices[valid]
+        zi_rows = zi_rows[valid]
+
+        # Row numbering under its own anchor and under the previous anchor
+        self.anchor = np.full(n, -1, dtype=np.int32)
+        self.month_number = np.zeros(n, dtype=np.int8)
+        self.is_leap = np.zeros(n, dtype=bool)
+        self.prev_month_number = np.zeros(n, dtype=np.int8)
+        self.prev_is_leap = np.zeros(n, dtype=bool)
+
+        has_term = self.has_principal_term.tolist()
+        for k, zi in enumerate(zi_rows.tolist()):
+            own_end = int(zi_rows[k + 1]) if k + 1 < len(zi_rows) else n
+            next_end = int(zi_rows[k + 2]) if k + 2 < len(zi_rows) else n
+            current = 11
+            self.anchor[zi] = k
+            self.month_number[zi] = 11
+            for i in range(zi + 1, next_end):
+                leap = not has_term[i]
+                if not leap:
+                    current = (current % 12) + 1
+                if i < own_end:
+                    self.anchor[i] = k
+                    self.month_number[i] = current
+                    self.is_leap[i] = leap
+                else:
+                    self.prev_month_number[i] = current
+                    self.prev_is_leap[i] = leap
+
+        # Lunar year rule from LunarMonthResolver.calculate_lunar_year
+        self.lunar_year = np.where(np.isin(self.month_number, (11, 12)), start_year + 1, start_year).astype(np.int16)
+        self.prev_lunar_year = np.where(np.isin(self.prev_month_number, (11, 12)), start_year + 1, start_year).astype(np.int16)
+
+        # Instants outside [first anchor, last anchor) cannot be numbered safely
+        if len(self.solstice_epoch) >= 2:
+            self.range_start = int(self.solstice_epoch[0])
+            self.range_end = int(self.solstice_epoch[-1])
+        else:
+            self.range_start = self.range_end = 0
+
+    def __len__(self) -> int:
+        return len(self.start_epoch)
+
+    def covers(self, epoch_seconds: int) -> bool:
+        """Return True if the instant lies inside the numbered table range."""
+        return self.range_start <= epoch_seconds < self.range_end
+
+    def resolve(self, epoch_seconds: int) -> Optional[TableMonth]:
+        """Resolve the lunar month containing a UTC instant.
+
+        Args:
+            epoch_seconds: Unix timestamp of the target instant
+
+        Returns:
+            TableMonth with the numbering valid for that instant, or None if
+            the instant is outside the table range
+        """
+        epoch_seconds = int(epoch_seconds)
+        if not self.covers(epoch_seconds):
+            return None
+
+        cst_ordinal = epoch_to_cst_ordinal(epoch_seconds)
+        row = int(np.searchsorted(self.start_ordinal, cst_ordinal, side='right')) - 1
+        if row < 0 or cst_ordinal >= self.end_ordinal[row]:
+            return None
+
+        # The anchor is the latest Winter Solstice at or before the instant
+        anchor = int(np.searchsorted(self.solstice_epoch, epoch_seconds, side='right')) - 1
+        row_anchor = int(self.anchor[row])
+        if anchor == row_anchor:
+            month_number, is_leap, lunar_year = self.month_number[row], self.is_leap[row], self.lunar_year[row]
+        elif anchor == row_anchor - 1:
+            month_number, is_leap, lunar_year = self.prev_month_number[row], self.prev_is_leap[row], self.prev_lunar_year[row]
+        else:
+            return None
+        if month_number == 0:
+            return None
+
+        return TableMonth(
+            index=row,
+            start_epoch=int(self.start_epoch[row]),
+            end_epoch=int(self.end_epoch[row]),
+            start_ordinal=int(self.start_ordinal[row]),
+            end_ordinal=int(self.end_ordinal[row]),
+            has_principal_term=bool(self.has_principal_term[row]),
+            month_number=int(month_number),
+            is_leap=bool(is_leap),
+            lunar_year=int(lunar_year),
+        )
+
+    def resolve_array(self, epoch_seconds: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Vectorized resolve() for an array of UTC instants.
+
+        Args:
+            epoch_seconds: Array of Unix timestamps
+
+        Returns:
+            Tuple of (lunar_year int16, month_number int8, lunar_day int8,
+            is_leap bool) arrays
+
+        Raises:
+            ValueError: If any instant is outside the table range
+        """
+        epoch = np.asarray(epoch_seconds, dtype=np.int64)
+        outside = (epoch < self.range_start) | (epoch >= self.range_end)
+        if outside.any():
+            raise ValueError(
+                f"{int(outside.sum())} timestamp(s) outside the month table range "
+                f"[{self.range_start}, {self.range_end})"
+            )
+
+        cst_ordinal = epoch_to_cst_ordinal(epoch)
+        rows = np.searchsorted(self.start_ordinal, cst_ordinal, side='right') - 1
+        anchors = np.searchsorted(self.solstice_epoch, epoch, side='right') - 1
+        own = anchors == self.anchor[rows]
+
+        month_number = np.where(own, self.month_number[rows], self.prev_month_number[rows])
+        is_leap = np.where(own, self.is_leap[rows], self.prev_is_leap[rows])
+        lunar_year = np.where(own, self.lunar_year[rows], self.prev_lunar_year[rows])
+        resolved = (own | (anchors == self.anchor[rows] - 1)) & (month_number != 0)
+        if not resolved.all():
+            raise ValueError(f"{int((~resolved).sum())} timestamp(s) could not be resolved from the month table")
+
+        lunar_day = np.clip(cst_ordinal - self.start_ordinal[rows] + 1, 1, 30).astype(np.int8)
+        return lunar_year, month_number, lunar_day, is_leap
+
+    @classmethod
+    def from_json(cls, json_dir: Optional[str] = None) -> 'LunarMonthTable':
+        """Build the table from the per-year JSON chunks written by main.py.
+
+        Args:
+            json_dir: Directory containing new_moons/ and solar_terms/
+                      (default: output/json)
+
+        Returns:
+            LunarMonthTable covering the years present on disk
+        """
+        json_dir = json_dir or os.path.join(OUTPUT_DIR, 'json')
+        new_moons: List[int] = []
+        for chunk in read_year_chunks(os.path.join(json_dir, 'new_moons')):
+            new_moons.extend(chunk)
+        solar_terms: List[Tuple[int, int]] = []
+        for chunk in read_year_chunks(os.path.join(json_dir, 'solar_terms')):
+            solar_terms.extend((int(ts), int(idx)) for ts, idx in chunk)
+        return cls(new_moons, solar_terms)
+
+    @classmethod
+    def from_binary(cls, bin_dir: Optional[str] = None) -> 'LunarMonthTable':
+        """Build the table from the binary series written by main.py --binary.
+
+        Args:
+            bin_dir: Directory containing new_moons.bin and solar_terms.bin
+                     (default: output/bin)
+
+        Returns:
+            LunarMonthTable covering the years in the binary files
+        """
+        bin_dir = bin_dir or BINARY_DIR
+        new_moons = BinarySeries(os.path.join(bin_dir, 'new_moons.bin'))
+        terms = BinarySeries(os.path.join(bin_dir, 'solar_terms.bin'))
+        return cls(new_moons.timestamps(), np.column_stack([terms.timestamps(), terms.values()]))
+
+
+_table_lock = threading.Lock()
+_table: Optional[LunarMonthTable] = None
+_table_loaded = False
+
+
+def get_month_table() -> Optional[LunarMonthTable]:
+    """Return the process-wide month table, building it on first use.
+
+    The table is read from output/bin when main.py was run with --binary and
+    from the output/json chunks otherwise, or when the JSON chunks were
+    regenerated after the binary files were written.
+
+    Returns:
+        Shared LunarMonthTable, or None if the precomputed data is unavailable
+    """
+    global _table, _table_loaded
+    if _table_loaded:
+        return _table
+    with _table_lock:
+        if not _table_loaded:
+            # Prefer the memory-mapped binary series unless the JSON chunks are newer
+            loaders = [LunarMonthTable.from_binary, LunarMonthTable.from_json]
+            if binary_is_stale(BINARY_DIR, os.path.join(OUTPUT_DIR, 'json'), ('new_moons', 'solar_terms')):
+                loaders.reverse()
+            for loader in loaders:
+                try:
+                    _table = loader()
+                    break
+                except (OSError, ValueError):
+                    _table = None
+            _table_loaded = True
+    return _table
+
+
+def reset_month_table() -> None:
+    """Forget the shared table so the next call rebuilds it from disk."""
+    global _table, _table_loaded
+    with _table_lock:
+        _table = None
+        _table_loaded = False
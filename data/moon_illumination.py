@@ -1,141 +1,176 @@
 """Moon illumination calculation module.
 
-This module calculates moon illumination percentage at 2-hour intervals
-using vectorized approach for efficient computation.
+This module calculates moon illumination percentage at regular intervals
+(2 hours by default) using vectorized approach for efficient computation.
 
 Usage:
-    python moon_illumination.py --start-date YYYY-MM-DD --end-date YYYY-MM-DD
+    python moon_illumination.py --start-date YYYY-MM-DD --end-date YYYY-MM-DD [--interval-minutes N] [--format csv|npy|col]
 
 Example:
     python moon_illumination.py --start-date 2025-01-01 --end-date 2025-12-31
+    python moon_illumination.py --start-date 2025-01-01 --end-date 2025-01-31 --interval-minutes 1
 """
 
-from datetime import datetime, timedelta
-from typing import List
+import os
+import argparse
+from datetime import datetime
+from typing import Dict, Iterator, List
 import numpy as np
-from skyfield.api import utc, load
-from config import EPHEMERIS_FILE
-from utils import setup_logging, write_csv_file, parse_date_args
+from skyfield.api import utc
+from config import ILLUMINATION_CHUNK_SIZE, ILLUMINATION_INTERVAL_MINUTES, OUTPUT_DIR
+from ephemeris import get_ephemeris, get_timescale, time_from_unix
+from series_sinks import SINK_FORMATS, open_sink
+from utils import setup_logging
 
-def calculate_moon_illumination(start_time: datetime, end_time: datetime) -> List[str]:
+# Output columns: (name, dtype, CSV format)
+ILLUMINATION_COLUMNS = [
+    ('timestamp', 'f8', '%r'),
+    ('illumination_percentage', 'f8', '%.6f'),
+]
+
+def illumination_sample_count(start_time: datetime, end_time: datetime,
+                              interval_minutes: float = ILLUMINATION_INTERVAL_MINUTES) -> int:
+    """Number of samples between start_time and end_time inclusive at the given interval."""
+    time_diff_minutes = (end_time - start_time).total_seconds() / 60
+    return int(time_diff_minutes / interval_minutes) + 1
+
+def iter_moon_illumination_chunks(start_time: datetime, end_time: datetime,
+                                  interval_minutes: float = ILLUMINATION_INTERVAL_MINUTES,
+                                  chunk_size: int = ILLUMINATION_CHUNK_SIZE) -> Iterator[Dict[str, np.ndarray]]:
     """
-    Calculate moon illumination percentage at 2-hour intervals using vectorized approach.
+    Yield moon illumination percentage chunk by chunk.
+    
+    The sampling grid is a NumPy array of Unix timestamps converted to one
+    Skyfield Time per chunk, so no Python datetime is built per sample.
     
     Args:
         start_time: Start datetime for calculation
         end_time: End datetime for calculation
+        interval_minutes: Sampling interval (default: 2 hours)
+        chunk_size: Number of samples evaluated per Time array
     
-    Returns:
-        List of CSV-formatted strings for each interval
+    Yields:
+        Dict of NumPy arrays keyed by the ILLUMINATION_COLUMNS names
     """
-    logger = setup_logging()
-    try:
-        ts = load.timescale()
-        eph = load(EPHEMERIS_FILE)
-        earth, moon, sun = eph['earth'], eph['moon'], eph['sun']
+    ts = get_timescale()
+    eph = get_ephemeris()
+    earth, moon, sun = eph['earth'], eph['moon'], eph['sun']
+    
+    # Calculate total number of intervals
+    num_intervals = illumination_sample_count(start_time, end_time, interval_minutes)
+    step_seconds = interval_minutes * 60
+    
+    chunk_size = max(min(num_intervals, chunk_size), 1)
+    
+    start_timestamp = start_time.timestamp()
+    end_timestamp = end_time.timestamp()
+    
+    # Process in chunks for memory efficiency
+    for chunk_start in range(0, num_intervals, chunk_size):
+        chunk_end = min(chunk_start + chunk_size, num_intervals)
         
-        # Calculate total time span and number of 2-hour intervals
-        time_diff_hours = (end_time - start_time).total_seconds() / 3600
-        num_intervals = int(time_diff_hours / 2) + 1
+        # Timestamps for this chunk
+        timestamps = start_timestamp + np.arange(chunk_start, chunk_end) * step_seconds
+        timestamps = timestamps[timestamps <= end_timestamp]
+        if not len(timestamps):
+            break
+            
+        # Vectorized calculation for the chunk
+        t = time_from_unix(ts, timestamps)
         
-        # Determine optimal chunk size based on date range
-        # For very long ranges (>10 years), use smaller chunks to manage memory
-        total_days = (end_time - start_time).days
-        if total_days > 3650:  # >10 years
-            chunk_size = 4380  # ~1 year of 2-hour intervals
-        elif total_days > 365:  # >1 year
-            chunk_size = 8760  # ~2 years of 2-hour intervals
-        else:
-            chunk_size = min(num_intervals, 17520)  # ~4 years max or all intervals
+        # Get positions for all times at once
+        earth_pos = earth.at(t).position.km
+        moon_pos = moon.at(t).position.km
+        sun_pos = sun.at(t).position.km
         
-        rows = []
+        # Calculate vectors FROM MOON for all times
+        moon_to_earth = earth_pos - moon_pos
+        moon_to_sun = sun_pos - moon_pos
         
-        # Process in chunks for memory efficiency
-        for chunk_start in range(0, num_intervals, chunk_size):
-            chunk_end = min(chunk_start + chunk_size, num_intervals)
-            
-            # Generate datetime list for this chunk
-            chunk_dates = []
-            for i in range(chunk_start, chunk_end):
-                current_time = start_time + timedelta(hours=2) * i
-                if current_time <= end_time:
-                    chunk_dates.append(current_time)
-            
-            if not chunk_dates:
-                break
-                
-            # Vectorized calculation for the chunk
-            t = ts.from_datetimes(chunk_dates)
-            
-            # Get positions for all times at once
-            earth_pos = earth.at(t).position.km
-            moon_pos = moon.at(t).position.km
-            sun_pos = sun.at(t).position.km
-            
-            # Calculate vectors FROM MOON for all times
-            moon_to_earth = earth_pos - moon_pos
-            moon_to_sun = sun_pos - moon_pos
-            
-            # Calculate phase angle using vectorized operations
-            dot_product = np.einsum('ij,ij->j', moon_to_earth, moon_to_sun)
-            earth_magnitude = np.linalg.norm(moon_to_earth, axis=0)
-            sun_magnitude = np.linalg.norm(moon_to_sun, axis=0)
-            
-            cos_phase_angle = dot_product / (earth_magnitude * sun_magnitude)
-            cos_phase_angle = np.clip(cos_phase_angle, -1.0, 1.0)
-            
-            phase_angle = np.arccos(cos_phase_angle)
-            
-            # Convert to illumination percentage
-            illumination_fraction = (1 + np.cos(phase_angle)) / 2
-            illumination_percentage = illumination_fraction * 100
-            
-            # Convert to CSV format
-            for i, (dt, illumination) in enumerate(zip(chunk_dates, illumination_percentage)):
-                timestamp = dt.timestamp()
-                rows.append(f"{timestamp},{illumination:.6f}\n")
+        # Calculate phase angle using vectorized operations
+        dot_product = np.einsum('ij,ij->j', moon_to_earth, moon_to_sun)
+        earth_magnitude = np.linalg.norm(moon_to_earth, axis=0)
+        sun_magnitude = np.linalg.norm(moon_to_sun, axis=0)
+        
+        cos_phase_angle = dot_product / (earth_magnitude * sun_magnitude)
+        cos_phase_angle = np.clip(cos_phase_angle, -1.0, 1.0)
+        
+        phase_angle = np.arccos(cos_phase_angle)
         
+        # Convert to illumination percentage
+        illumination_fraction = (1 + np.cos(phase_angle)) / 2
+        yield {
+            'timestamp': timestamps,
+            'illumination_percentage': illumination_fraction * 100,
+        }
+
+def calculate_moon_illumination(start_time: datetime, end_time: datetime,
+                                interval_minutes: float = ILLUMINATION_INTERVAL_MINUTES) -> List[str]:
+    """
+    Calculate moon illumination percentage at regular intervals using vectorized approach.
+    
+    Args:
+        start_time: Start datetime for calculation
+        end_time: End datetime for calculation
+        interval_minutes: Sampling interval (default: 2 hours)
+    
+    Returns:
+        List of CSV-formatted strings for each interval
+    """
+    logger = setup_logging(__name__)
+    try:
+        rows = []
+        for chunk in iter_moon_illumination_chunks(start_time, end_time, interval_minutes):
+            for timestamp, illumination in zip(chunk['timestamp'].tolist(), chunk['illumination_percentage'].tolist()):
+                rows.append(f"{timestamp},{illumination:.6f}\n")
         return rows
         
     except Exception as e:
         logger.error(f"Error calculating moon illumination: {e}")
         return []
-    finally:
-        if 'eph' in locals():
-            del eph
+
+def parse_args():
+    """Parse command line arguments for moon illumination calculation."""
+    parser = argparse.ArgumentParser(description='Moon Illumination Calculator.')
+    parser.add_argument('--start-date', type=str, default='2024-01-01', 
+                       help='Start date in YYYY-MM-DD format.')
+    parser.add_argument('--end-date', type=str, default='2024-01-07', 
+                       help='End date in YYYY-MM-DD format.')
+    parser.add_argument('--interval-minutes', type=float, default=ILLUMINATION_INTERVAL_MINUTES,
+                       help=f'Sampling interval in minutes (default: {ILLUMINATION_INTERVAL_MINUTES})')
+    parser.add_argument('--format', choices=SINK_FORMATS, default='csv',
+                       help='Output format (default: csv)')
+    return parser.parse_args()
 
 def main():
     """Main function for moon illumination calculation."""
-    logger = setup_logging()
-    args = parse_date_args()
+    logger = setup_logging(__name__)
+    args = parse_args()
     
     logger.info("🌕 Moon Illumination Calculator")
     logger.info(f"Calculating moon illumination from {args.start_date} to {args.end_date}")
-    logger.info("Interval: 2 hours")
+    logger.info(f"Interval: {args.interval_minutes:g} minutes")
     
     # Parse dates
     start_time = datetime.strptime(args.start_date, '%Y-%m-%d').replace(tzinfo=utc)
     end_time = datetime.strptime(args.end_date, '%Y-%m-%d').replace(hour=23, minute=59, second=59, tzinfo=utc)
     
-    # Calculate moon illumination
-    rows = calculate_moon_illumination(start_time, end_time)
+    # Stream chunks straight to the output file
+    path = os.path.join(OUTPUT_DIR, f"moon_illumination.{args.format}")
+    try:
+        total = illumination_sample_count(start_time, end_time, args.interval_minutes)
+        attrs = {'interval_minutes': args.interval_minutes}
+        with open_sink(args.format, path, ILLUMINATION_COLUMNS, total, attrs) as sink:
+            for chunk in iter_moon_illumination_chunks(start_time, end_time, args.interval_minutes):
+                sink.write(chunk)
+        count = sink.count
+    except Exception as e:
+        logger.error(f"Error calculating moon illumination: {e}")
+        count = 0
     
-    if rows:
-        # Parse moon illumination data from CSV format to dictionary format
-        data = []
-        for row in rows:
-            parts = row.strip().split(',')
-            if len(parts) >= 2:
-                data.append({
-                    'timestamp': parts[0],
-                    'illumination_percentage': parts[1]
-                })
-        
-        # Write to CSV
-        count = write_csv_file('moon_illumination.csv', data, 
-                             ['timestamp', 'illumination_percentage'])
+    if count:
         logger.info(f"✅ Successfully calculated {count:,} moon illumination data points")
-        logger.info(f"📄 Results saved to output/moon_illumination.csv")
+        logger.info(f"📄 Results saved to {path}")
     else:
         logger.warning("⚠️ No moon illumination data calculated for the specified date range")
 
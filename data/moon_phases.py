@@ -12,11 +12,41 @@ Example:
 
 from datetime import datetime
 from typing import List, Tuple
-from skyfield.api import utc, load
+import numpy as np
+from skyfield.api import utc
 from skyfield import almanac
-from config import EPHEMERIS_FILE
+from ephemeris import get_ephemeris, get_timescale, time_to_unix_us, us_to_unix_seconds
+from search_cache import get_search_cache
 from utils import setup_logging, write_csv_file, parse_date_args
 
+# Bump whenever a change alters the events found; keys the search cache and the manifest code version
+CALCULATOR_VERSION = 1
+
+def find_moon_phases(start_time: datetime, end_time: datetime) -> Tuple[np.ndarray, np.ndarray]:
+    """Find New Moons and Full Moons between start and end times.
+    
+    Args:
+        start_time: Start datetime for calculation
+        end_time: End datetime for calculation
+        
+    Returns:
+        Tuple of int64 arrays (unix_timestamps, phase indices: 0 New Moon, 2 Full Moon)
+    """
+    cache = get_search_cache()
+    found = cache.lookup('moon_phases', start_time, end_time, version=CALCULATOR_VERSION)
+    if found is None:
+        ts = get_timescale()
+        eph = get_ephemeris()
+        t0 = ts.from_datetime(start_time)
+        t1 = ts.from_datetime(end_time)
+        t, y = almanac.find_discrete(t0, t1, almanac.moon_phases(eph))
+        found = (time_to_unix_us(t), y)
+        cache.store('moon_phases', start_time, end_time, *found, version=CALCULATOR_VERSION)
+    times_us, phases = found
+    phases = np.asarray(phases, dtype=np.int64)
+    keep = (phases == 0) | (phases == 2)  # New Moon (0) and Full Moon (2)
+    return us_to_unix_seconds(times_us)[keep], phases[keep]
+
 def calculate_moon_phases(start_time: datetime, end_time: datetime) -> List[Tuple[int, int, str]]:
     """Calculate moon phases between start and end times.
     
@@ -27,32 +57,18 @@ def calculate_moon_phases(start_time: datetime, end_time: datetime) -> List[Tupl
     Returns:
         List of tuples containing (unix_timestamp, phase_index, phase_name)
     """
-    logger = setup_logging()
+    logger = setup_logging(__name__)
     try:
-        ts = load.timescale()
-        eph = load(EPHEMERIS_FILE)
-        t0 = ts.from_datetime(start_time)
-        t1 = ts.from_datetime(end_time)
-        t, y = almanac.find_discrete(t0, t1, almanac.moon_phases(eph))
-        results = []
-        for ti, yi in zip(t, y):
-            if yi in (0, 2):  # New Moon (0) and Full Moon (2)
-                dt_obj = ti.utc_datetime()
-                unix_timestamp = int(dt_obj.timestamp())
-                phase_index = yi
-                phase_name = almanac.MOON_PHASES[yi]
-                results.append((unix_timestamp, phase_index, phase_name))
-        return results
+        timestamps, phases = find_moon_phases(start_time, end_time)
+        return [(unix_timestamp, phase_index, almanac.MOON_PHASES[phase_index])
+                for unix_timestamp, phase_index in zip(timestamps.tolist(), phases.tolist())]
     except Exception as e:
         logger.error(f"Error calculating moon phases: {e}")
         return []
-    finally:
-        if 'eph' in locals():
-            del eph
 
 def main():
     """Main function for moon phases calculation."""
-    logger = setup_logging()
+    logger = setup_logging(__name__)
     args = parse_date_args()
     
     logger.info("🌙 Moon Phases Calculator")
@@ -0,0 +1,273 @@
+"""Persistent cache of ephemeris search results.
+
+Root searches such as ``almanac.find_discrete`` are deterministic for a given
+kernel, function, code version and time range, so their results can be reused
+across process restarts. This module stores them under ``output/cache/`` as compact
+int64 arrays (event instants in Unix microseconds plus an integer value per
+event, e.g. phase or term index).
+
+Layout:
+    output/cache/<kernel sha256 prefix>/<function>/v<version>[/<params hash>]/<start_us>_<end_us>.npz
+
+The version is the calling module's CALCULATOR_VERSION, bumped whenever a
+change to the search alters the events it finds.
+
+Each file is one searched span. Spans that overlap or touch are coalesced on
+write, and a query for any sub-range of a cached span is answered by slicing
+it, without touching the ephemeris. Two searches over overlapping ranges find
+the same root a few hundred microseconds apart, so on a merge the cached
+events win: new events are only added outside the cached spans and away from
+any cached event with the same value.
+
+Usage:
+    cache = get_search_cache()
+    found = cache.lookup('moon_phases', start_time, end_time, version=CALCULATOR_VERSION)
+    if found is None:
+        ...  # run the search
+        cache.store('moon_phases', start_time, end_time, times_us, values, version=CALCULATOR_VERSION)
+"""
+
+import os
+import json
+import logging
+import hashlib
+import tempfile
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+import numpy as np
+from config import CACHE_DIR, SEARCH_CACHE_ENABLED
+from ephemeris import kernel_path
+
+logger = logging.getLogger(__name__)
+
+_UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_HASH_BLOCK_SIZE = 1 << 20
+# New events this close to a cached event with the same value are the same root
+MERGE_TOLERANCE_US = 1_000_000
+
+
+def datetime_to_us(dt: datetime) -> int:
+    """Unix microseconds for a datetime (naive values are taken as UTC)."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    delta = dt - _UNIX_EPOCH
+    return (delta.days * 86400 + delta.seconds) * 1_000_000 + delta.microseconds
+
+
+class SearchCache:
+    """Content-addressed on-disk cache of search results keyed by kernel and range."""
+
+    def __init__(self, cache_dir: str = CACHE_DIR, enabled: bool = SEARCH_CACHE_ENABLED):
+        """
+        Initialize the cache.
+
+        Args:
+            cache_dir: Root directory for cached spans (default: output/cache)
+            enabled: If False, lookups always miss and stores are ignored
+        """
+        self.cache_dir = cache_dir
+        self.enabled = enabled
+        self._kernel_hashes: Dict[Tuple[str, int, int], str] = {}
+        self._lock = threading.Lock()
+
+    def lookup(self, function: str, start: datetime, end: datetime,
+               params: Optional[Dict[str, Any]] = None, *,
+               version: int) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+        """Return cached (times_us, values) for [start, end], or None on a miss.
+
+        Args:
+            function: Search name, e.g. 'moon_phases', 'solar_terms', 'seasons'
+            start: Start of the queried range
+            end: End of the queried range
+            params: Extra parameters the result depends on (body, location, ...)
+            version: Code version of the search (the caller's CALCULATOR_VERSION)
+
+        Returns:
+            Tuple of int64 arrays, or None if no cached span covers the range
+        """
+        if not self.enabled:
+            return None
+        try:
+            directory = self._namespace_dir(function, params, version)
+            start_us, end_us = datetime_to_us(start), datetime_to_us(end)
+            for span_start, span_end, path in self._list_spans(directory):
+                if span_start <= start_us and end_us <= span_end:
+                    times_us, values = self._read_span(path)
+                    mask = (times_us >= start_us) & (times_us <= end_us)
+                    return times_us[mask], values[mask]
+        except Exception as e:
+            logger.warning("Search cache lookup failed for %s: %s", function, e)
+        return None
+
+    def store(self, function: str, start: datetime, end: datetime,
+              times_us: np.ndarray, values: np.ndarray,
+              params: Optional[Dict[str, Any]] = None, *, version: int) -> None:
+        """Store a searched span, coalescing it with overlapping or touching spans.
+
+        Args:
+            function: Search name used for lookup()
+            start: Start of the searched range
+            end: End of the searched range
+            times_us: Event instants in Unix microseconds
+            values: Integer value per event
+            params: Extra parameters the result depends on
+            version: Code version of the search (the caller's CALCULATOR_VERSION)
+        """
+        if not self.enabled:
+            return
+        try:
+            directory = self._namespace_dir(function, params, version)
+            os.makedirs(directory, exist_ok=True)
+            span_start, span_end = datetime_to_us(start), datetime_to_us(end)
+            times_us = np.asarray(times_us, dtype=np.int64)
+            values = np.asarray(values, dtype=np.int64)
+
+            merged: List[str] = []
+            cached_times, cached_values = [], []
+            keep = np.ones(len(times_us), dtype=bool)
+            for other_start, other_end, path in self._list_spans(directory):
+                if other_start <= span_end and span_start <= other_end:
+                    other_times, other_values = self._read_span(path)
+                    cached_times.append(other_times)
+                    cached_values.append(other_values)
+                    # Inside a cached span the cached events are already complete
+                    keep &= (times_us < other_start) | (times_us > other_end)
+                    span_start = min(span_start, other_start)
+                    span_end = max(span_end, other_end)
+                    merged.append(path)
+
+            if merged:
+                cached_t = np.concatenate(cached_times)
+                cached_v = np.concatenate(cached_values)
+                order = np.argsort(cached_t, kind='stable')
+                cached_t, cached_v = cached_t[order], cached_v[order]
+                keep &= ~_near_same_value(times_us, values, cached_t, cached_v)
+                times_us = np.concatenate([cached_t, times_us[keep]])
+                values = np.concatenate([cached_v, values[keep]])
+
+            times_us, unique = np.unique(times_us, return_index=True)
+            values = values[unique]
+            target = os.path.join(directory, f"{span_start}_{span_end}.npz")
+            self._write_span(target, span_start, span_end, times_us, values)
+            for path in merged:
+                if path != target:
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
+        except Exception as e:
+            logger.warning("Search cache store failed for %s: %s", function, e)
+
+    def kernel_hash(self) -> str:
+        """SHA-256 of the kernel file, memoized by path, size and mtime."""
+        path = os.path.abspath(kernel_path())
+        stat = os.stat(path)
+        key = (path, stat.st_size, stat.st_mtime_ns)
+        with self._lock:
+            digest = self._kernel_hashes.get(key)
+            if digest is None:
+                digest = self._read_kernel_index().get(_index_key(key))
+            if digest is None:
+                sha = hashlib.sha256()
+                with open(path, 'rb') as f:
+                    for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b''):
+                        sha.update(block)
+                digest = sha.hexdigest()
+                self._write_kernel_index(_index_key(key), digest)
+            self._kernel_hashes[key] = digest
+        return digest
+
+    def _namespace_dir(self, function: str, params: Optional[Dict[str, Any]], version: int) -> str:
+        parts = [self.cache_dir, self.kernel_hash()[:16], function, f"v{int(version)}"]
+        if params:
+            encoded = json.dumps(params, sort_keys=True, separators=(',', ':'))
+            parts.append(hashlib.sha1(encoded.encode('utf-8')).hexdigest()[:16])
+        return os.path.join(*parts)
+
+    def _list_spans(self, directory: str) -> List[Tuple[int, int, str]]:
+        if not os.path.isdir(directory):
+            return []
+        spans = []
+        for name in os.listdir(directory):
+            if not name.endswith('.npz'):
+                continue
+            try:
+                start_text, end_text = name[:-4].split('_')
+                spans.append((int(start_text), int(end_text), os.path.join(directory, name)))
+            except ValueError:
+                continue
+        return sorted(spans)
+
+    @staticmethod
+    def _read_span(path: str) -> Tuple[np.ndarray, np.ndarray]:
+        with np.load(path) as data:
+            return data['times_us'], data['values']
+
+    @staticmethod
+    def _write_span(path: str, span_start: int, span_end: int,
+                    times_us: np.ndarray, values: np.ndarray) -> None:
+        """Write atomically so concurrent workers never read a partial file."""
+        directory = os.path.dirname(path)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                np.savez(f, span=np.array([span_start, span_end], dtype=np.int64),
+                         times_us=times_us, values=values)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _read_kernel_index(self) -> Dict[str, str]:
+        try:
+            with open(os.path.join(self.cache_dir, 'kernels.json'), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _write_kernel_index(self, key: str, digest: str) -> None:
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            index = self._read_kernel_index()
+            index[key] = digest
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(index, f)
+            os.replace(tmp_path, os.path.join(self.cache_dir, 'kernels.json'))
+        except OSError as e:
+            logger.warning("Could not record kernel hash: %s", e)
+
+
+def _near_same_value(times_us: np.ndarray, values: np.ndarray,
+                     cached_times: np.ndarray, cached_values: np.ndarray) -> np.ndarray:
+    """Mask of events within MERGE_TOLERANCE_US of a sorted cached event with the same value."""
+    if not len(cached_times):
+        return np.zeros(len(times_us), dtype=bool)
+    right = np.searchsorted(cached_times, times_us)
+    near = np.zeros(len(times_us), dtype=bool)
+    for neighbour in (np.clip(right - 1, 0, None), np.clip(right, None, len(cached_times) - 1)):
+        near |= ((np.abs(cached_times[neighbour] - times_us) <= MERGE_TOLERANCE_US)
+                 & (cached_values[neighbour] == values))
+    return near
+
+
+def _index_key(key: Tuple[str, int, int]) -> str:
+    """Kernel index entry name: path, size and mtime of the kernel file."""
+    path, size, mtime_ns = key
+    return f"{path}|{size}|{mtime_ns}"
+
+
+_cache_lock = threading.Lock()
+_cache: Optional[SearchCache] = None
+
+
+def get_search_cache() -> SearchCache:
+    """Return the process-wide search cache."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = SearchCache()
+    return _cache
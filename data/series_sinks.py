@@ -0,0 +1,305 @@
+"""Streaming sinks for high-frequency series.
+
+The tidal and illumination calculators can yield their results as chunks of
+NumPy columns. A sink writes each chunk as soon as it is produced, so peak
+memory is one chunk regardless of the date range and values never round-trip
+through formatted strings.
+
+Columns are described as (name, dtype, csv_format) tuples; a chunk is a dict
+mapping each column name to a 1-D array of equal length.
+
+The 'col' format is a self-describing columnar container (see ColumnarSink)
+that ColumnarSeries memory-maps and slices by time without parsing.
+
+Usage:
+    with open_sink('csv', 'output/tidal_lunar_4min.csv', TIDAL_COLUMNS) as sink:
+        for chunk in iter_tidal_chunks(start_time, end_time, location):
+            sink.write(chunk)
+
+    series = ColumnarSeries('output/tidal_lunar_4min.col')
+    january = series.read(1735689600, 1738368000)  # dict of column views
+"""
+
+import os
+import json
+import struct
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
+from numpy.lib.format import open_memmap
+
+Column = Tuple[str, str, str]
+
+SINK_FORMATS = ('csv', 'npy', 'col')
+
+# Columnar container: magic, u32 header length, JSON header, aligned column blocks
+COLUMNAR_MAGIC = b'LSCOL\x00\x00\x01'
+COLUMNAR_VERSION = 1
+_COLUMNAR_PREFIX = struct.Struct('<8sI')
+_COLUMNAR_ALIGN = 64
+
+
+class CsvSink:
+    """Append chunks to a CSV file with one fixed printf-style format per column."""
+
+    def __init__(self, path: str, columns: Sequence[Column]):
+        """
+        Open the CSV file and write the header.
+
+        Args:
+            path: Output file path
+            columns: (name, dtype, csv_format) per column
+        """
+        self.path = path
+        self.columns = list(columns)
+        self.count = 0
+        parent_dir = os.path.dirname(path)
+        if parent_dir:
+            os.makedirs(parent_dir, exist_ok=True)
+        # Same line terminator as csv.DictWriter in write_csv_file
+        self._file = open(path, 'w', newline='', encoding='utf-8')
+        self._file.write(','.join(name for name, _, _ in self.columns) + '\r\n')
+        self._row_format = ','.join(fmt for _, _, fmt in self.columns) + '\r\n'
+
+    def write(self, chunk: Dict[str, np.ndarray]) -> int:
+        """Write one chunk and return the number of rows written."""
+        arrays = [np.asarray(chunk[name]).tolist() for name, _, _ in self.columns]
+        row_format = self._row_format
+        self._file.writelines(row_format % row for row in zip(*arrays))
+        self.count += len(arrays[0]) if arrays else 0
+        return len(arrays[0]) if arrays else 0
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> 'CsvSink':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class NpySink:
+    """Fill a structured .npy file in place through a memory map.
+
+    The .npy header stores the array shape, so the total number of rows must
+    be known up front; rows that were never written stay zero.
+    """
+
+    def __init__(self, path: str, columns: Sequence[Column], total: int):
+        """
+        Create the .npy file.
+
+        Args:
+            path: Output file path
+            columns: (name, dtype, csv_format) per column
+            total: Number of rows the file will hold
+        """
+        self.path = path
+        self.count = 0
+        parent_dir = os.path.dirname(path)
+        if parent_dir:
+            os.makedirs(parent_dir, exist_ok=True)
+        dtype = np.dtype([(name, dtype) for name, dtype, _ in columns])
+        self._array = open_memmap(path, mode='w+', dtype=dtype, shape=(total,))
+
+    def write(self, chunk: Dict[str, np.ndarray]) -> int:
+        """Write one chunk after the rows already written and return its length."""
+        n = len(next(iter(chunk.values())))
+        if self.count + n > len(self._array):
+            raise ValueError(f"{self.path}: more rows than the declared total of {len(self._array)}")
+        block = self._array[self.count:self.count + n]
+        for name in self._array.dtype.names:
+            block[name] = chunk[name]
+        self.count += n
+        return n
+
+    def close(self) -> None:
+        if self._array is not None:
+            self._array.flush()
+            self._array = None
+
+    def __enter__(self) -> 'NpySink':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def _align(offset: int) -> int:
+    return -(-offset // _COLUMNAR_ALIGN) * _COLUMNAR_ALIGN
+
+
+class ColumnarSink:
+    """Write typed columns into a self-describing, memory-mappable container.
+
+    File layout:
+        magic        8 bytes  b'LSCOL\\0\\0\\x01'
+        header_size  u32      length of the JSON header in bytes
+        header       JSON     {"version", "rows", "time_column", "attrs",
+                               "columns": [{"name", "dtype", "offset"}, ...]}
+        columns      one contiguous little-endian block per column, each
+                     starting at its header offset (64-byte aligned)
+
+    Like NpySink, the total number of rows must be known up front.
+    """
+
+    def __init__(self, path: str, columns: Sequence[Column], total: int,
+                 attrs: Optional[Dict[str, Any]] = None):
+        """
+        Create the container and map its column blocks.
+
+        Args:
+            path: Output file path
+            columns: (name, dtype, csv_format) per column; the first column is
+                     the time column and must be written in ascending order
+            total: Number of rows the file will hold
+            attrs: Optional JSON-serializable metadata (location, interval, ...)
+        """
+        self.path = path
+        self.total = total
+        self.count = 0
+        parent_dir = os.path.dirname(path)
+        if parent_dir:
+            os.makedirs(parent_dir, exist_ok=True)
+
+        dtypes = [np.dtype(dtype).newbyteorder('<') for _, dtype, _ in columns]
+        # Header size depends on the offsets it lists, so lay out until stable
+        offsets = [0] * len(columns)
+        while True:
+            header = json.dumps({
+                'version': COLUMNAR_VERSION,
+                'rows': total,
+                'time_column': columns[0][0],
+                'attrs': attrs or {},
+                'columns': [
+                    {'name': name, 'dtype': dtype.str, 'offset': offset}
+                    for (name, _, _), dtype, offset in zip(columns, dtypes, offsets)
+                ],
+            }, separators=(',', ':')).encode('utf-8')
+            position = _align(_COLUMNAR_PREFIX.size + len(header))
+            new_offsets = []
+            for dtype in dtypes:
+                new_offsets.append(position)
+                position = _align(position + dtype.itemsize * total)
+            if new_offsets == offsets:
+                break
+            offsets = new_offsets
+
+        with open(path, 'wb') as f:
+            f.write(_COLUMNAR_PREFIX.pack(COLUMNAR_MAGIC, len(header)))
+            f.write(header)
+            f.truncate(position)
+        self._columns = {
+            name: np.memmap(path, dtype=dtype, mode='r+', offset=offset, shape=(total,))
+            for (name, _, _), dtype, offset in zip(columns, dtypes, offsets)
+        } if total else {}
+
+    def write(self, chunk: Dict[str, np.ndarray]) -> int:
+        """Write one chunk after the rows already written and return its length."""
+        n = len(next(iter(chunk.values())))
+        if self.count + n > self.total:
+            raise ValueError(f"{self.path}: more rows than the declared total of {self.total}")
+        for name, block in self._columns.items():
+            block[self.count:self.count + n] = chunk[name]
+        self.count += n
+        return n
+
+    def close(self) -> None:
+        for block in self._columns.values():
+            block.flush()
+        self._columns = {}
+
+    def __enter__(self) -> 'ColumnarSink':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class ColumnarSeries:
+    """Memory-mapped reader for containers written by ColumnarSink."""
+
+    def __init__(self, path: str):
+        """
+        Open a columnar container.
+
+        Args:
+            path: File written by ColumnarSink
+
+        Raises:
+            ValueError: If the file is not a supported columnar container
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            prefix = f.read(_COLUMNAR_PREFIX.size)
+            if len(prefix) != _COLUMNAR_PREFIX.size:
+                raise ValueError(f"{path}: truncated header")
+            magic, header_size = _COLUMNAR_PREFIX.unpack(prefix)
+            if magic != COLUMNAR_MAGIC:
+                raise ValueError(f"{path}: not a columnar series file")
+            self.header = json.loads(f.read(header_size).decode('utf-8'))
+        if self.header.get('version') != COLUMNAR_VERSION:
+            raise ValueError(f"{path}: unsupported columnar version {self.header.get('version')}")
+
+        self.rows: int = self.header['rows']
+        self.attrs: Dict[str, Any] = self.header.get('attrs', {})
+        self.time_column: str = self.header['time_column']
+        self._columns = {
+            column['name']: (
+                np.memmap(path, dtype=np.dtype(column['dtype']), mode='r',
+                          offset=column['offset'], shape=(self.rows,))
+                if self.rows else np.zeros(0, dtype=np.dtype(column['dtype']))
+            )
+            for column in self.header['columns']
+        }
+
+    def __len__(self) -> int:
+        return self.rows
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._columns)
+
+    def column(self, name: str) -> np.ndarray:
+        """Read-only memory-mapped view of one column."""
+        return self._columns[name]
+
+    def read(self, start: Optional[float] = None, end: Optional[float] = None) -> Dict[str, np.ndarray]:
+        """Column views for the rows in [start, end), or all rows.
+
+        Args:
+            start: Inclusive lower bound on the time column (default: first row)
+            end: Exclusive upper bound on the time column (default: after last row)
+
+        Returns:
+            Dict of memory-mapped column views keyed by name
+        """
+        times = self._columns[self.time_column]
+        lo = 0 if start is None else int(np.searchsorted(times, start, side='left'))
+        hi = self.rows if end is None else int(np.searchsorted(times, end, side='left'))
+        return {name: column[lo:hi] for name, column in self._columns.items()}
+
+
+def open_sink(fmt: str, path: str, columns: Sequence[Column], total: Optional[int] = None,
+              attrs: Optional[Dict[str, Any]] = None):
+    """Open a sink by format name.
+
+    Args:
+        fmt: One of SINK_FORMATS
+        path: Output file path
+        columns: (name, dtype, csv_format) per column
+        total: Number of rows, required for 'npy' and 'col'
+        attrs: Metadata stored in the 'col' header (ignored by other formats)
+
+    Returns:
+        Sink with write(chunk) and close()
+    """
+    if fmt == 'csv':
+        return CsvSink(path, columns)
+    if fmt in ('npy', 'col') and total is None:
+        raise ValueError(f"The {fmt} sink needs the total number of rows")
+    if fmt == 'npy':
+        return NpySink(path, columns, total)
+    if fmt == 'col':
+        return ColumnarSink(path, columns, total, attrs)
+    raise ValueError(f"Unknown sink format: {fmt}")
@@ -12,11 +12,39 @@ Example:
 
 from datetime import datetime
 from typing import List, Tuple
-from skyfield.api import utc, load
+import numpy as np
+from skyfield.api import utc
 from skyfield import almanac, almanac_east_asia as almanac_ea
-from config import EPHEMERIS_FILE
+from ephemeris import get_ephemeris, get_timescale, time_to_unix_us, us_to_unix_seconds
+from search_cache import get_search_cache
 from utils import setup_logging, write_csv_file, parse_date_args
 
+# Bump whenever a change alters the events found; keys the search cache and the manifest code version
+CALCULATOR_VERSION = 1
+
+def find_solar_terms(start_time: datetime, end_time: datetime) -> Tuple[np.ndarray, np.ndarray]:
+    """Find solar terms between start and end times.
+    
+    Args:
+        start_time: Start datetime for calculation
+        end_time: End datetime for calculation
+        
+    Returns:
+        Tuple of int64 arrays (unix_timestamps, term indices 0-23)
+    """
+    cache = get_search_cache()
+    found = cache.lookup('solar_terms', start_time, end_time, version=CALCULATOR_VERSION)
+    if found is None:
+        ts = get_timescale()
+        eph = get_ephemeris()
+        t0 = ts.from_datetime(start_time)
+        t1 = ts.from_datetime(end_time)
+        t, tm = almanac.find_discrete(t0, t1, almanac_ea.solar_terms(eph))
+        found = (time_to_unix_us(t), tm)
+        cache.store('solar_terms', start_time, end_time, *found, version=CALCULATOR_VERSION)
+    times_us, term_indices = found
+    return us_to_unix_seconds(times_us), np.asarray(term_indices, dtype=np.int64)
+
 def calculate_solar_terms(start_time: datetime, end_time: datetime) -> List[Tuple[int, int, str, str, str]]:
     """Calculate solar terms between start and end times.
     
@@ -27,18 +55,11 @@ def calculate_solar_terms(start_time: datetime, end_time: datetime) -> List[Tupl
     Returns:
         List of tuples containing (unix_timestamp, index, zht, zhs, vn)
     """
-    logger = setup_logging()
+    logger = setup_logging(__name__)
     try:
-        ts = load.timescale()
-        eph = load(EPHEMERIS_FILE)
-        t0 = ts.from_datetime(start_time)
-        t1 = ts.from_datetime(end_time)
-        t, tm = almanac.find_discrete(t0, t1, almanac_ea.solar_terms(eph))
+        timestamps, term_indices = find_solar_terms(start_time, end_time)
         results = []
-        for tmi, ti in zip(tm, t):
-            dt_obj = ti.utc_datetime()
-            unix_timestamp = int(dt_obj.timestamp())
-            idx = tmi
+        for unix_timestamp, idx in zip(timestamps.tolist(), term_indices.tolist()):
             zht = almanac_ea.SOLAR_TERMS_ZHT[idx] if hasattr(almanac_ea, 'SOLAR_TERMS_ZHT') else ''
             zhs = almanac_ea.SOLAR_TERMS_ZHS[idx] if hasattr(almanac_ea, 'SOLAR_TERMS_ZHS') else ''
             vn = almanac_ea.SOLAR_TERMS_VN[idx] if hasattr(almanac_ea, 'SOLAR_TERMS_VN') else ''
@@ -47,13 +68,10 @@ def calculate_solar_terms(start_time: datetime, end_time: datetime) -> List[Tupl
     except Exception as e:
         logger.error(f"Error calculating solar terms: {e}")
         return []
-    finally:
-        if 'eph' in locals():
-            del eph
 
 def main():
     """Main function for solar terms calculation."""
-    logger = setup_logging()
+    logger = setup_logging(__name__)
     args = parse_date_args()
     
     logger.info("☀️ Solar Terms Calculator")
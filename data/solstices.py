@@ -0,0 +1,107 @@
+"""Winter Solstice provider.
+
+Window planning needs the Winter Solstice of the target year and its
+neighbours, and each lookup used to be a full-year ``almanac.seasons`` root
+search. This module answers those lookups from a precomputed table when one
+is available and otherwise from a bounded LRU cache in front of the live
+search.
+
+The table comes from the ``output/json/solar_terms`` chunks: solar term 18
+(270 degrees) is the Winter Solstice, so no extra data file is needed.
+
+Usage:
+    from solstices import get_solstice_provider
+    solstice = get_solstice_provider().winter_solstice(2025)
+"""
+
+import logging
+import threading
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Iterable, Optional
+from skyfield import almanac
+from ephemeris import get_ephemeris, get_timescale, time_to_unix_us
+from month_table import get_month_table
+from search_cache import get_search_cache
+
+logger = logging.getLogger(__name__)
+
+_UNIX_EPOCH = datetime(1970, 1, 1)
+
+
+class SolsticeProvider:
+    """Winter Solstice instants by year from a table or a memoized live search."""
+
+    def __init__(self, table: Optional[Dict[int, int]] = None, cache_size: int = 64):
+        """
+        Initialize the provider.
+
+        Args:
+            table: Optional mapping of Gregorian year to solstice Unix timestamp
+            cache_size: Maximum number of live search results kept in the LRU cache
+        """
+        self.table = dict(table or {})
+        self._search = lru_cache(maxsize=cache_size)(self._search_winter_solstice)
+
+    def winter_solstice(self, year: int) -> datetime:
+        """Return the Winter Solstice of a year as a timezone-naive UTC datetime."""
+        epoch_seconds = self.table.get(year)
+        if epoch_seconds is not None:
+            return _UNIX_EPOCH + timedelta(seconds=epoch_seconds)
+        return self._search(year)
+
+    def cache_info(self):
+        """Hit/miss statistics of the live search cache."""
+        return self._search.cache_info()
+
+    def _search_winter_solstice(self, year: int) -> datetime:
+        """Find the Winter Solstice for a year with an ephemeris search."""
+        try:
+            start = datetime(year, 1, 1)
+            end = datetime(year + 1, 1, 1)
+            cache = get_search_cache()
+            found = cache.lookup('seasons', start, end)
+            if found is None:
+                ts = get_timescale()
+                eph = get_ephemeris()
+                t0 = ts.utc(year, 1, 1)
+                t1 = ts.utc(year + 1, 1, 1)
+                t, y = almanac.find_discrete(t0, t1, almanac.seasons(eph))
+                found = (time_to_unix_us(t), y)
+                cache.store('seasons', start, end, *found)
+
+            for time_us, season in zip(*found):
+                if season == 3:  # Winter solstice
+                    return _UNIX_EPOCH + timedelta(microseconds=int(time_us))
+
+            raise ValueError(f"Winter solstice not found for year {year}")
+        except Exception as e:
+            logger.error("Error finding winter solstice for %d: %s", year, e)
+            raise
+
+    @classmethod
+    def from_epochs(cls, solstice_epochs: Iterable[int], cache_size: int = 64) -> 'SolsticeProvider':
+        """Build a provider from Winter Solstice Unix timestamps."""
+        table = {}
+        for epoch_seconds in solstice_epochs:
+            epoch_seconds = int(epoch_seconds)
+            table[(_UNIX_EPOCH + timedelta(seconds=epoch_seconds)).year] = epoch_seconds
+        return cls(table, cache_size)
+
+
+_provider_lock = threading.Lock()
+_provider: Optional[SolsticeProvider] = None
+
+
+def get_solstice_provider() -> SolsticeProvider:
+    """Return the process-wide provider, seeded from the month table if present."""
+    global _provider
+    if _provider is None:
+        with _provider_lock:
+            if _provider is None:
+                month_table = get_month_table()
+                if month_table is not None:
+                    _provider = SolsticeProvider.from_epochs(month_table.solstice_epoch)
+                else:
+                    _provider = SolsticeProvider()
+    return _provider
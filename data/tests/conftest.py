@@ -0,0 +1,53 @@
+"""Shared fixtures for the data/ test suite.
+
+Run from anywhere with ``python -m pytest data/tests``. Tests that need a JPL
+kernel use the ``kernel`` fixture and are skipped when nasa/de440.bsp is not
+a real kernel (e.g. a Git LFS pointer); set EPHEMERIS_FILE to use another one.
+"""
+
+import os
+import sys
+import pytest
+
+DATA_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPO_ROOT = os.path.dirname(DATA_DIR)
+sys.path.insert(0, DATA_DIR)
+
+import ephemeris
+import utils
+from search_cache import get_search_cache
+
+# Leave logging to pytest: setup_logging would point a handler at (and
+# reconfigure) whichever capture stream is sys.stdout when it first runs
+utils._logging_configured = True
+
+
+@pytest.fixture(scope='session', autouse=True)
+def repo_root():
+    """Run from the repository root, where config's relative paths point."""
+    with pytest.MonkeyPatch.context() as patch:
+        patch.chdir(REPO_ROOT)
+        yield REPO_ROOT
+
+
+@pytest.fixture(autouse=True)
+def no_search_cache():
+    """Keep the shared on-disk search cache out of every test."""
+    cache = get_search_cache()
+    enabled = cache.enabled
+    cache.enabled = False
+    yield
+    cache.enabled = enabled
+
+
+@pytest.fixture(scope='session')
+def kernel():
+    """The shared ephemeris kernel, or skip when none is available."""
+    if os.environ.get('EPHEMERIS_FILE'):
+        ephemeris.EPHEMERIS_FILE = os.environ['EPHEMERIS_FILE']
+    if not os.path.isfile(ephemeris.EPHEMERIS_FILE):
+        pytest.skip(f"No ephemeris kernel at {ephemeris.EPHEMERIS_FILE}")
+    try:
+        return ephemeris.get_ephemeris()
+    except Exception as e:
+        pytest.skip(f"No usable ephemeris kernel at {ephemeris.EPHEMERIS_FILE}: {e}")
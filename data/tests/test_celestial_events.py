@@ -0,0 +1,57 @@
+"""Rise, set and meridian events against Skyfield's almanac searches."""
+
+from datetime import datetime, timezone
+import numpy as np
+import pytest
+from skyfield import almanac
+from skyfield.api import wgs84
+from celestial_events import calculate_body_events_batch, calculate_event_times
+from ephemeris import get_timescale, time_to_unix
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+END = datetime(2024, 3, 1, tzinfo=timezone.utc)
+BODIES = [('Sun', 'sun'), ('Moon', 'moon'), ('Mars', 'mars')]
+SITES = {'hanoi': (20.95, 105.94), 'tromso': (69.65, 18.96), 'sydney': (-33.87, 151.21)}
+# Event times are whole Unix seconds, Skyfield's are not
+TOLERANCE_SECONDS = 1.0
+
+
+def almanac_times(kernel, body_key, lat, lon):
+    """Unix times per event type from Skyfield's own searches."""
+    ts = get_timescale()
+    t0, t1 = ts.from_datetime(START), ts.from_datetime(END)
+    observer = kernel['earth'] + wgs84.latlon(lat, lon)
+    body = kernel[body_key]
+    t, y = almanac.find_discrete(t0, t1, almanac.meridian_transits(kernel, body, wgs84.latlon(lat, lon)))
+    return {
+        'transit': time_to_unix(t[y == 1]),
+        'antitransit': time_to_unix(t[y == 0]),
+        'rise': time_to_unix(almanac.find_risings(observer, body, t0, t1)[0]),
+        'set': time_to_unix(almanac.find_settings(observer, body, t0, t1)[0]),
+    }
+
+
+def assert_close(got, expected, context):
+    got, expected = np.asarray(got, dtype=np.float64), np.asarray(expected, dtype=np.float64)
+    assert len(got) == len(expected), f"{context}: {len(got)} events, expected {len(expected)}"
+    assert np.all(np.abs(got - expected) <= TOLERANCE_SECONDS), context
+
+
+@pytest.mark.parametrize('body_data', BODIES)
+@pytest.mark.parametrize('site', SITES)
+def test_single_site_events_match_almanac(kernel, body_data, site):
+    lat, lon = SITES[site]
+    expected = almanac_times(kernel, body_data[1], lat, lon)
+    for search_name in ('meridian', 'horizon'):
+        for event_type, times in calculate_event_times(body_data, search_name, START, END, (lat, lon)).items():
+            assert_close(times, expected[event_type], f"{body_data[0]} {site} {event_type}")
+
+
+@pytest.mark.parametrize('body_data', BODIES)
+def test_batch_events_match_almanac(kernel, body_data):
+    _, results, _ = calculate_body_events_batch(body_data, START, END, SITES)
+    for site, (lat, lon) in SITES.items():
+        expected = almanac_times(kernel, body_data[1], lat, lon)
+        for event_type, times in expected.items():
+            got = [timestamp for timestamp, _, event in results[site] if event == event_type]
+            assert_close(got, times, f"{body_data[0]} {site} {event_type}")
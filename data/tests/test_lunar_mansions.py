@@ -0,0 +1,24 @@
+"""Mansion index arithmetic."""
+
+import numpy as np
+import pytest
+from config import MANSION_COUNT, MANSION_DEGREES
+from lunar_mansions import mansion_index
+
+
+@pytest.mark.parametrize('lon_deg', [0.0, np.float64(0.0), np.array(0.0), 360.0, -360.0])
+def test_scalar_and_zero_dimensional_input(lon_deg):
+    index = mansion_index(lon_deg)
+    assert np.ndim(index) == 0
+    assert int(index) == 1
+
+
+def test_array_input_covers_every_mansion():
+    centres = (np.arange(MANSION_COUNT) + 0.5) * MANSION_DEGREES
+    assert mansion_index(centres).tolist() == list(range(1, MANSION_COUNT + 1))
+    assert mansion_index(centres - 720.0).tolist() == list(range(1, MANSION_COUNT + 1))
+
+
+def test_longitudes_just_below_a_full_turn_stay_in_the_last_mansion():
+    lon_deg = np.array([np.nextafter(360.0, 0.0), -1e-20, -1e-9])
+    assert mansion_index(lon_deg).tolist() == [MANSION_COUNT] * 3
@@ -0,0 +1,150 @@
+"""Lunisolar conversion paths against each other and the pre-rewrite baseline.
+
+fixtures/lunisolar_baseline.json holds solar_to_lunisolar results from the
+per-call implementation before the month table and batch rewrites (commit
+f88cb96, DE421 kernel): random dates and times in several timezones, both
+sides of CST midnight on new moon days, leap months and New Year.
+"""
+
+import os
+import json
+import random
+import warnings
+from dataclasses import asdict
+from datetime import date, datetime, timedelta, timezone
+import numpy as np
+import pytest
+import lunisolar_v2
+from lunisolar_v2 import (
+    LunisolarArrays, MonthBuilder, PeriodIndex, PrincipalTerm, TermIndexer, TimezoneService,
+    solar_to_lunisolar, solar_to_lunisolar_array, solar_to_lunisolar_batch
+)
+from timezone_handler import TimezoneHandler
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), 'fixtures', 'lunisolar_baseline.json')
+ZONES = ('Asia/Shanghai', 'Asia/Ho_Chi_Minh', 'America/New_York', 'Europe/London', 'Australia/Sydney')
+
+
+@pytest.fixture(autouse=True)
+def fresh_converters(monkeypatch):
+    """Start every test without converters, and their anchor caches, from earlier tests."""
+    monkeypatch.setattr(lunisolar_v2, '_converters', {})
+
+
+def load_baseline():
+    with open(BASELINE_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def sample_dates(seed: int, count: int, first: date, last: date):
+    """Random (date_str, time_str) pairs between two dates."""
+    rng = random.Random(seed)
+    span = (last - first).days
+    dates = []
+    for _ in range(count):
+        day = first + timedelta(days=rng.randrange(span + 1))
+        dates.append((day.isoformat(), f"{rng.randrange(24):02d}:{rng.randrange(60):02d}"))
+    return dates
+
+
+def assert_same_fields(got, expected, context):
+    got = asdict(got)
+    expected = expected if isinstance(expected, dict) else asdict(expected)
+    for field, value in expected.items():
+        assert got[field] == value, f"{context}: {field} is {got[field]!r}, expected {value!r}"
+
+
+def assert_batch_matches_single_calls(dates, zone, use_table):
+    batch = solar_to_lunisolar_batch(dates, zone, use_table=use_table)
+    assert len(batch) == len(dates)
+    lunisolar_v2._converters.clear()
+    for (date_str, time_str), result in zip(dates, batch):
+        single = solar_to_lunisolar(date_str, time_str, zone, use_table=use_table)
+        assert_same_fields(result, single, f"{date_str} {time_str} {zone}")
+
+
+@pytest.mark.parametrize('zone', ZONES)
+def test_table_batch_matches_single_calls(zone):
+    dates = sample_dates(ZONES.index(zone), 200, date(1901, 6, 1), date(2099, 6, 30))
+    assert_batch_matches_single_calls(dates, zone, use_table=True)
+
+
+@pytest.mark.parametrize('zone', ZONES)
+def test_live_batch_matches_single_calls(kernel, zone):
+    # A few decades, so several dates share each anchor solstice
+    dates = sample_dates(ZONES.index(zone), 40, date(2015, 1, 1), date(2035, 12, 31))
+    assert_batch_matches_single_calls(dates, zone, use_table=False)
+
+
+def test_table_path_matches_baseline():
+    for case in load_baseline():
+        result = solar_to_lunisolar(case['date'], case['time'], case['timezone'], use_table=True)
+        assert_same_fields(result, case['expected'], f"{case['date']} {case['time']} {case['timezone']}")
+
+
+@pytest.mark.parametrize('zone', ZONES)
+def test_array_path_matches_baseline(zone):
+    cases = [case for case in load_baseline() if case['timezone'] == zone]
+    handler = TimezoneHandler(zone)
+    epoch = np.array([
+        int(handler.local_to_utc(handler.parse_local_datetime(case['date'], case['time'])).timestamp())
+        for case in cases
+    ])
+    arrays = solar_to_lunisolar_array(epoch, zone)
+    for field in LunisolarArrays.__dataclass_fields__:
+        expected = [case['expected'][field] for case in cases]
+        assert getattr(arrays, field).tolist() == expected, field
+
+
+def test_live_path_matches_baseline(kernel):
+    for case in load_baseline():
+        result = solar_to_lunisolar(case['date'], case['time'], case['timezone'], use_table=False)
+        assert_same_fields(result, case['expected'], f"{case['date']} {case['time']} {case['timezone']}")
+
+
+def month_periods_and_terms(first_year: int, last_year: int):
+    """Month periods and principal terms built from the committed JSON output."""
+    def instants(dataset):
+        for year in range(first_year, last_year + 1):
+            with open(os.path.join('output', 'json', dataset, f'{year}.json'), 'r', encoding='utf-8') as f:
+                yield json.load(f)
+    def utc(ts):
+        return datetime.fromtimestamp(ts, timezone.utc)
+    new_moons = [utc(ts) for chunk in instants('new_moons') for ts in chunk]
+    tz_service = TimezoneService()
+    # Even term indices (multiples of 30 degrees) are the principal terms
+    terms = [PrincipalTerm(utc(ts), tz_service.utc_to_cst_date(utc(ts)), idx // 2 + 1)
+             for chunk in instants('solar_terms') for ts, idx in chunk if idx % 2 == 0]
+    return MonthBuilder(tz_service).build_month_periods(new_moons), terms
+
+
+def test_term_tagging_matches_nested_scan():
+    periods, terms = month_periods_and_terms(1980, 2040)
+    reference, _ = month_periods_and_terms(1980, 2040)
+    # The nested term x period scan the sorted merge replaced
+    for term in terms:
+        for period in reference:
+            if period.start_cst_date <= term.cst_date < period.end_cst_date:
+                period.has_principal_term = True
+                break
+    index = PeriodIndex(periods)
+    TermIndexer().tag_principal_terms(index, terms)
+    assert [p.has_principal_term for p in periods] == [p.has_principal_term for p in reference]
+    assert not all(p.has_principal_term for p in periods)
+
+    for period in reference:
+        assert index.find(period.start_cst_date).index == period.index
+        assert index.find(period.end_cst_date - timedelta(days=1)).index == period.index
+    assert index.find(reference[0].start_cst_date - timedelta(days=1)) is None
+    assert index.find(reference[-1].end_cst_date) is None
+
+
+def test_quiet_is_deprecated():
+    with pytest.warns(DeprecationWarning, match='quiet'):
+        solar_to_lunisolar('2024-02-10', quiet=True)
+    with pytest.warns(DeprecationWarning, match='quiet'):
+        solar_to_lunisolar_batch([('2024-02-10', '12:00')], quiet=False)
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        solar_to_lunisolar('2024-02-10')
+        solar_to_lunisolar_batch([('2024-02-10', '12:00')])
@@ -0,0 +1,36 @@
+import manifest
+import moon_phases
+from manifest import GenerationManifest, calculator_version
+from moon_phases import find_moon_phases
+
+
+def write(json_dir, rel_path, text):
+    path = json_dir / rel_path
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+
+
+def test_calculator_version_follows_the_declared_versions(monkeypatch):
+    before = calculator_version(find_moon_phases)
+    monkeypatch.setattr(moon_phases, 'CALCULATOR_VERSION', moon_phases.CALCULATOR_VERSION + 1)
+    bumped = calculator_version(find_moon_phases)
+    monkeypatch.setattr(manifest, 'OUTPUT_FORMAT_VERSION', manifest.OUTPUT_FORMAT_VERSION + 1)
+    assert len({before, bumped, calculator_version(find_moon_phases)}) == 3
+
+
+def test_recorded_year_stays_fresh_until_version_or_file_changes(tmp_path):
+    json_dir = tmp_path / 'json'
+    write(json_dir, 'moon_phases/2025.json', '[]')
+    version = calculator_version(find_moon_phases)
+    recorded = GenerationManifest('0' * 64, path=str(tmp_path / 'manifest.json'), json_dir=str(json_dir))
+    recorded.record('moon_phases', 2025, 0, 100, version, {'moon_phases/2025.json': 0})
+    recorded.save()
+
+    loaded = GenerationManifest.load('0' * 64, str(tmp_path / 'manifest.json'), str(json_dir))
+    assert loaded.is_fresh('moon_phases', 2025, 10, 90, version)
+    assert not loaded.is_fresh('moon_phases', 2025, 0, 101, version)
+    assert not loaded.is_fresh('moon_phases', 2025, 0, 100, version + '.next')
+
+    write(json_dir, 'moon_phases/2025.json', '[1]')
+    loaded = GenerationManifest.load('0' * 64, str(tmp_path / 'manifest.json'), str(json_dir))
+    assert not loaded.is_fresh('moon_phases', 2025, 0, 100, version)
@@ -0,0 +1,25 @@
+"""Chunked moon illumination series."""
+
+from datetime import datetime, timezone
+import numpy as np
+import pytest
+from moon_illumination import illumination_sample_count, iter_moon_illumination_chunks
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+END = datetime(2024, 2, 29, 23, 59, 59, tzinfo=timezone.utc)
+
+
+def series(**kwargs):
+    chunks = list(iter_moon_illumination_chunks(START, END, **kwargs))
+    return {name: np.concatenate([chunk[name] for chunk in chunks]) for name in chunks[0]}, len(chunks)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 7, 100000])
+def test_chunk_size_does_not_change_the_series(kernel, chunk_size):
+    expected, _ = series()
+    got, count = series(chunk_size=chunk_size)
+    samples = illumination_sample_count(START, END)
+    assert len(got['timestamp']) == samples
+    assert count == -(-samples // min(chunk_size, samples))
+    np.testing.assert_array_equal(got['timestamp'], expected['timestamp'])
+    np.testing.assert_allclose(got['illumination_percentage'], expected['illumination_percentage'], rtol=0, atol=1e-9)
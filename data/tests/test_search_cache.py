@@ -0,0 +1,75 @@
+"""SearchCache span storage and merging."""
+
+from datetime import datetime, timedelta, timezone
+import numpy as np
+import pytest
+from search_cache import SearchCache, datetime_to_us
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+DAY_US = 86400 * 1_000_000
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    cache = SearchCache(cache_dir=str(tmp_path), enabled=True)
+    monkeypatch.setattr(cache, 'kernel_hash', lambda: '0' * 64)
+    return cache
+
+
+def roots(first_day: int, last_day: int, jitter_us: int = 0):
+    """One root every 3 days between two day offsets, as a search would find them."""
+    days = np.arange(first_day, last_day, 3)
+    times_us = datetime_to_us(START) + days * DAY_US + 12 * 3600 * 1_000_000 + jitter_us
+    return times_us.astype(np.int64), (days % 4).astype(np.int64)
+
+
+def store(cache, first_day, last_day, jitter_us=0):
+    cache.store('phases', START + timedelta(days=first_day), START + timedelta(days=last_day),
+                *roots(first_day, last_day, jitter_us), version=1)
+
+
+def test_lookup_slices_stored_span(cache):
+    store(cache, 0, 30)
+    times_us, values = cache.lookup('phases', START + timedelta(days=5), START + timedelta(days=20), version=1)
+    expected_times, expected_values = roots(6, 20)
+    np.testing.assert_array_equal(times_us, expected_times)
+    np.testing.assert_array_equal(values, expected_values)
+
+
+def test_overlapping_spans_keep_one_copy_of_each_root(cache):
+    store(cache, 0, 30)
+    # A second search over an overlapping range finds the same roots slightly apart
+    store(cache, 15, 60, jitter_us=150)
+    times_us, _ = cache.lookup('phases', START, START + timedelta(days=60), version=1)
+    assert len(times_us) == len(roots(0, 60)[0])
+    assert np.all(np.diff(times_us) > DAY_US)
+
+    # Storing the same overlapping spans again changes nothing
+    store(cache, 0, 30, jitter_us=-80)
+    store(cache, 15, 60, jitter_us=200)
+    again, _ = cache.lookup('phases', START, START + timedelta(days=60), version=1)
+    np.testing.assert_array_equal(again, times_us)
+
+
+def test_roots_near_a_span_edge_are_not_duplicated(cache):
+    edge_us = datetime_to_us(START + timedelta(days=30))
+    cache.store('phases', START, START + timedelta(days=30),
+                np.array([edge_us - DAY_US, edge_us - 200]), np.array([1, 2]), version=1)
+    # A search starting at the cached span's end finds its last root just after the edge
+    cache.store('phases', START + timedelta(days=30), START + timedelta(days=45),
+                np.array([edge_us + 100, edge_us + 5 * DAY_US]), np.array([2, 3]), version=1)
+    times_us, values = cache.lookup('phases', START, START + timedelta(days=45), version=1)
+    np.testing.assert_array_equal(times_us, [edge_us - DAY_US, edge_us - 200, edge_us + 5 * DAY_US])
+    np.testing.assert_array_equal(values, [1, 2, 3])
+
+
+def test_disabled_cache_misses(tmp_path):
+    cache = SearchCache(cache_dir=str(tmp_path), enabled=False)
+    cache.store('phases', START, START + timedelta(days=3), *roots(0, 3), version=1)
+    assert cache.lookup('phases', START, START + timedelta(days=3), version=1) is None
+
+
+def test_other_code_version_misses(cache):
+    store(cache, 0, 30)
+    assert cache.lookup('phases', START, START + timedelta(days=30), version=2) is None
+    assert cache.lookup('phases', START, START + timedelta(days=30), version=1) is not None
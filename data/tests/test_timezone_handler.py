@@ -0,0 +1,47 @@
+"""Vectorized UTC offsets against per-datetime conversion."""
+
+from datetime import datetime, timedelta, timezone
+import numpy as np
+import pytest
+from timezone_handler import TimezoneHandler
+
+# UTC instants of DST transitions: US spring forward, UK fall back, Sydney both
+TRANSITIONS = [
+    ('America/New_York', datetime(2024, 3, 10, 7, 0)),
+    ('America/New_York', datetime(1950, 9, 24, 6, 0)),
+    ('Europe/London', datetime(2024, 10, 27, 1, 0)),
+    ('Australia/Sydney', datetime(2024, 4, 6, 16, 0)),
+    ('Australia/Sydney', datetime(2024, 10, 5, 16, 0)),
+]
+
+
+def offsets_from_utc_to_local(handler, epoch):
+    return [
+        handler.utc_to_local(datetime.fromtimestamp(int(t), timezone.utc)).utcoffset() // timedelta(seconds=1)
+        for t in epoch
+    ]
+
+
+@pytest.mark.parametrize('zone, instant', TRANSITIONS)
+def test_offsets_match_utc_to_local_across_dst(zone, instant):
+    handler = TimezoneHandler(zone)
+    center = int(instant.replace(tzinfo=timezone.utc).timestamp())
+    epoch = center + np.arange(-7200, 7201, 60)
+    offsets = handler.utc_offsets(epoch)
+    assert offsets.tolist() == offsets_from_utc_to_local(handler, epoch)
+    assert len(set(offsets.tolist())) == 2
+
+
+@pytest.mark.parametrize('zone', ['UTC', 'Etc/GMT+5', 'Asia/Kolkata'])
+def test_offsets_match_utc_to_local_over_a_century(zone):
+    handler = TimezoneHandler(zone)
+    epoch = np.arange(-2208988800, 4102444800, 86400 * 97 + 3607)
+    assert handler.utc_offsets(epoch).tolist() == offsets_from_utc_to_local(handler, epoch)
+
+
+def test_non_pytz_timezone_is_rejected():
+    handler = TimezoneHandler('UTC')
+    handler.timezone = timezone(timedelta(hours=3))
+    handler.timezone_name = 'fixed +03:00'
+    with pytest.raises(TypeError):
+        handler.utc_offsets(np.array([0]))
@@ -1,96 +1,382 @@
 """Tidal data and lunar mansion calculation module.
 
 This module calculates gravitational tidal acceleration vectors from the Sun and Moon
-at a given location, along with lunar mansion positions at 4-minute intervals.
+at a given location, along with lunar mansion positions at 4-minute intervals
+(configurable). TidalSeries answers time-range queries at any cadence from
+cached per-day Chebyshev fits of the underlying vectors.
 
 Usage:
     python tidal_data.py --start-date YYYY-MM-DD --end-date YYYY-MM-DD [--lat LAT] [--lon LON]
+                         [--interval-minutes N] [--format csv|npy|col]
 
 Example:
     python tidal_data.py --start-date 2025-01-01 --end-date 2025-01-02
     python tidal_data.py --start-date 2025-01-01 --end-date 2025-01-02 --lat 40.7128 --lon -74.0060
+    python tidal_data.py --start-date 2025-01-01 --end-date 2025-12-31 --format col
 """
 
+import os
 import argparse
-from datetime import datetime, timedelta
-from typing import List, Tuple
+from datetime import datetime
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Tuple, Union
 import numpy as np
-from skyfield.api import utc, load, wgs84
-from config import (EPHEMERIS_FILE, TIDAL_INTERVAL_MINUTES, MANSION_COUNT, 
-                   MANSION_DEGREES, GM_MOON, GM_SUN, DEFAULT_LOCATION)
-from utils import setup_logging, write_csv_file
+from numpy.polynomial import chebyshev
+from skyfield.api import utc, wgs84
+from skyfield.constants import C
+from skyfield.framelib import ecliptic_J2000_frame, itrs
+from config import (TIDAL_INTERVAL_MINUTES, TIDAL_CHUNK_SIZE, TIDAL_FIT_DEGREE, TIDAL_FIT_CACHE_DAYS,
+                   GM_MOON, GM_SUN, DEFAULT_LOCATION, OUTPUT_DIR)
+from ephemeris import get_ephemeris, get_timescale, time_from_unix
+from lunar_mansions import mansion_index, moon_ecliptic_longitude
+from series_sinks import SINK_FORMATS, open_sink
+from utils import setup_logging
 
-def calculate_tidal_data(start_time: datetime, end_time: datetime, 
-                        location_data: Tuple[float, float]) -> List[str]:
-    """Calculate tidal acceleration and lunar mansion index at 4-minute intervals.
+SECONDS_PER_DAY = 86400
+
+# Output columns: (name, dtype, CSV format)
+TIDAL_COLUMNS = [
+    ('timestamp', 'f8', '%r'),
+    ('tidal_acceleration_x', 'f8', '%.12e'),
+    ('tidal_acceleration_y', 'f8', '%.12e'),
+    ('tidal_acceleration_z', 'f8', '%.12e'),
+    ('magnitude', 'f8', '%.12e'),
+    ('moon_ecliptic_longitude', 'f8', '%.6f'),
+    ('arabic_mansion_index', 'u1', '%d'),
+]
+
+def tidal_acceleration(d_body: np.ndarray, r_obs: np.ndarray, gm: float) -> np.ndarray:
+    """Calculate tidal acceleration of a celestial body at the observer.
+    
+    Args:
+        d_body: Geocentric body positions in meters, shape (3, N)
+        r_obs: Geocentric observer positions in meters, shape (3, N) or
+               (N_sites, 3, N) for several sites at once
+        gm: Gravitational parameter of the body (m³/s²)
+        
+    Returns:
+        Tidal acceleration vectors in m/s², shaped like r_obs
+    """
+    r_body = np.linalg.norm(d_body, axis=-2, keepdims=True)
+    d_obs_to_body = d_body - r_obs
+    r_obs_to_body = np.linalg.norm(d_obs_to_body, axis=-2, keepdims=True)
+    return gm * (d_obs_to_body / r_obs_to_body**3 - d_body / r_body**3)
+
+def calculate_tidal_chunk(t, earth, moon, sun, observer) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Calculate tidal acceleration and lunar mansion for an array of times.
+    
+    Args:
+        t: Skyfield Time array
+        earth: Earth ephemeris segment
+        moon: Moon ephemeris segment
+        sun: Sun ephemeris segment
+        observer: Earth + topocentric location
+        
+    Returns:
+        Tuple of (a_total (3, N), magnitude (N), ecliptic longitude in degrees (N),
+        mansion index 1-28 (N))
+    """
+    # Get positions for all times at once
+    observer_at = observer.at(t)
+    pos_earth_center = earth.at(t).position.m
+    pos_moon = moon.at(t).position.m
+    pos_sun = sun.at(t).position.m
+    
+    # Calculate relative positions
+    r_obs = observer_at.position.m - pos_earth_center
+    d_moon = pos_moon - pos_earth_center
+    d_sun = pos_sun - pos_earth_center
+    
+    # Calculate tidal accelerations
+    a_total = tidal_acceleration(d_moon, r_obs, GM_MOON) + tidal_acceleration(d_sun, r_obs, GM_SUN)
+    magnitude = np.linalg.norm(a_total, axis=0)
+    
+    # Calculate lunar mansion index
+    lon_deg = moon_ecliptic_longitude(observer_at, moon)
+    return a_total, magnitude, lon_deg, mansion_index(lon_deg)
+
+def calculate_tidal_batch(start_time: datetime, end_time: datetime,
+                          sites: Dict[str, Tuple[float, float]],
+                          chunk_size: int = TIDAL_CHUNK_SIZE,
+                          interval_minutes: float = TIDAL_INTERVAL_MINUTES) -> Dict[str, Dict[str, np.ndarray]]:
+    """Calculate tidal acceleration and lunar mansion for many sites at once.
+    
+    Earth, Moon and Sun are read from the ephemeris once per time step and the
+    Earth rotation matrices are computed once per chunk; every site's observer
+    offset and tidal math is then broadcast as (N_sites, N_times) arrays.
+    
+    The topocentric Moon for the mansion index is derived from the geocentric
+    astrometric Moon, the observer offset and a first-order light-time
+    correction instead of a per-site observe().
     
     Args:
         start_time: Start datetime for calculation
         end_time: End datetime for calculation
-        location_data: Tuple of (latitude, longitude)
+        sites: Mapping of site id to (latitude, longitude)
+        chunk_size: Number of samples evaluated per Time array
+        interval_minutes: Sampling interval (default: TIDAL_INTERVAL_MINUTES)
         
     Returns:
-        List of CSV-formatted strings for each interval
+        Dict keyed by site id of dicts of NumPy arrays keyed by the
+        TIDAL_COLUMNS names
     """
-    logger = setup_logging()
-    try:
+    site_ids = list(sites)
+    ts = get_timescale()
+    eph = get_ephemeris()
+    earth, moon, sun = eph['earth'], eph['moon'], eph['sun']
+    # Fixed ITRS position of every site, shape (N_sites, 3)
+    site_xyz = np.array([wgs84.latlon(lat, lon).itrs_xyz.m for lat, lon in sites.values()]).reshape(-1, 3)
+    to_ecliptic = ecliptic_J2000_frame.rotation_at(None)
+    
+    # An end before the start yields no samples, as it does for calculate_tidal_data
+    num_points = max(tidal_sample_count(start_time, end_time, interval_minutes), 0)
+    step_seconds = interval_minutes * 60
+    timestamps = start_time.timestamp() + np.arange(num_points) * step_seconds
+    columns = {name: np.empty((len(site_ids), num_points), dtype=dtype) for name, dtype, _ in TIDAL_COLUMNS}
+    columns['timestamp'][:] = timestamps
+    
+    for chunk_start in range(0, num_points, chunk_size):
+        chunk = slice(chunk_start, min(chunk_start + chunk_size, num_points))
+        t = time_from_unix(ts, timestamps[chunk])
+        
+        # Geocentric quantities, once for all sites
+        earth_at = earth.at(t)
+        pos_earth_center = earth_at.position.m
+        d_moon = moon.at(t).position.m - pos_earth_center
+        d_sun = sun.at(t).position.m - pos_earth_center
+        astrometric = earth_at.observe(moon)
+        moon_astrometric = astrometric.position.m
+        moon_velocity = astrometric.velocity.m_per_s + earth_at.velocity.m_per_s
+        moon_direction = moon_astrometric / np.linalg.norm(moon_astrometric, axis=0)
+        
+        # Observer offsets in GCRS for every site, shape (N_sites, 3, N)
+        r_obs = np.einsum('jin,sj->sin', itrs.rotation_at(t), site_xyz)
+        
+        a_total = tidal_acceleration(d_moon, r_obs, GM_MOON) + tidal_acceleration(d_sun, r_obs, GM_SUN)
+        # A site nearer the Moon sees it with less light-time; shift the retarded Moon to first order
+        light_time_gain = np.einsum('jn,sjn->sn', moon_direction, r_obs) / C
+        moon_topocentric = moon_astrometric + moon_velocity * light_time_gain[:, None, :] - r_obs
+        x, y, _ = np.einsum('ij,sjn->isn', to_ecliptic, moon_topocentric)
+        lon_deg = np.degrees(np.arctan2(y, x)) % 360.0
+        mansion = mansion_index(lon_deg)
+        
+        columns['tidal_acceleration_x'][:, chunk] = a_total[:, 0]
+        columns['tidal_acceleration_y'][:, chunk] = a_total[:, 1]
+        columns['tidal_acceleration_z'][:, chunk] = a_total[:, 2]
+        columns['magnitude'][:, chunk] = np.linalg.norm(a_total, axis=1)
+        columns['moon_ecliptic_longitude'][:, chunk] = lon_deg
+        columns['arabic_mansion_index'][:, chunk] = mansion
+    
+    return {site_id: {name: values[i] for name, values in columns.items()}
+            for i, site_id in enumerate(site_ids)}
+
+class TidalSeries:
+    """On-demand tidal acceleration and lunar mansion queries at any cadence.
+    
+    Geocentric Moon and Sun vectors, the observer offset and the topocentric
+    astrometric Moon vector are fitted once per UTC day with Chebyshev
+    polynomials. Queries evaluate the cached fits instead of the ephemeris,
+    so repeated fine-grained queries over the same days only cost a
+    polynomial evaluation.
+    
+    Usage:
+        series = TidalSeries((lat, lon))
+        data = series.query(t0, t1, step_seconds=30)
+        data['magnitude'], data['arabic_mansion_index']
+    """
+    
+    def __init__(self, location_data: Tuple[float, float], degree: int = TIDAL_FIT_DEGREE,
+                 cache_days: int = TIDAL_FIT_CACHE_DAYS):
+        """
+        Initialize the series for one location.
+        
+        Args:
+            location_data: Tuple of (latitude, longitude)
+            degree: Chebyshev degree of each per-day fit
+            cache_days: Maximum number of daily fits kept in memory
+        """
         lat, lon = location_data
-        ts = load.timescale()
-        eph = load(EPHEMERIS_FILE)
-        earth, moon, sun = eph['earth'], eph['moon'], eph['sun']
-        topo = wgs84.latlon(lat, lon)
-        observer = earth + topo
+        self.location_data = location_data
+        self.degree = degree
+        self.cache_days = cache_days
+        self.ts = get_timescale()
+        eph = get_ephemeris()
+        self.earth, self.moon, self.sun = eph['earth'], eph['moon'], eph['sun']
+        self.observer = self.earth + wgs84.latlon(lat, lon)
+        self._nodes = chebyshev.chebpts1(degree + 1)
+        self._fits: OrderedDict = OrderedDict()
+    
+    def _fit_day(self, day: int) -> np.ndarray:
+        """Chebyshev coefficients for one UTC day, shape (degree + 1, 12)."""
+        coefficients = self._fits.get(day)
+        if coefficients is not None:
+            self._fits.move_to_end(day)
+            return coefficients
         
-        time_diff_minutes = (end_time - start_time).total_seconds() / 60
-        num_4min_points = int(time_diff_minutes / TIDAL_INTERVAL_MINUTES) + 1
+        timestamps = (day + (self._nodes + 1) / 2) * SECONDS_PER_DAY
+        t = time_from_unix(self.ts, timestamps)
+        observer_at = self.observer.at(t)
+        pos_earth_center = self.earth.at(t).position.m
+        samples = np.concatenate([
+            self.moon.at(t).position.m - pos_earth_center,
+            self.sun.at(t).position.m - pos_earth_center,
+            observer_at.position.m - pos_earth_center,
+            observer_at.observe(self.moon).position.m,
+        ])
+        coefficients = chebyshev.chebfit(self._nodes, samples.T, self.degree)
         
-        rows = []
-        for i in range(num_4min_points):
-            current_time = start_time + timedelta(minutes=TIDAL_INTERVAL_MINUTES) * i
-            t = ts.from_datetime(current_time)
-            
-            # Get positions
-            pos_earth_center = earth.at(t).position.m
-            pos_observer = observer.at(t).position.m
-            pos_moon = moon.at(t).position.m
-            pos_sun = sun.at(t).position.m
-            
-            # Calculate relative positions
-            r_obs = pos_observer - pos_earth_center 
-            d_moon = pos_moon - pos_earth_center 
-            d_sun = pos_sun - pos_earth_center 
-            
-            def tidal_acc(d_body, gm):
-                """Calculate tidal acceleration for a celestial body."""
-                r_body = np.linalg.norm(d_body)
-                d_obs_to_body = d_body - r_obs
-                r_obs_to_body = np.linalg.norm(d_obs_to_body)
-                return gm * (d_obs_to_body / r_obs_to_body**3 - d_body / r_body**3)
-            
-            # Calculate tidal accelerations
-            a_moon = tidal_acc(d_moon, GM_MOON)
-            a_sun = tidal_acc(d_sun, GM_SUN)
-            a_total = a_moon + a_sun
-            magnitude = np.linalg.norm(a_total)
+        self._fits[day] = coefficients
+        if len(self._fits) > self.cache_days:
+            self._fits.popitem(last=False)
+        return coefficients
+    
+    def vectors(self, timestamps: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Interpolated vectors in meters for an array of Unix timestamps.
+        
+        Returns:
+            Tuple of (d_moon, d_sun, r_obs, topocentric astrometric Moon),
+            each of shape (3, N)
+        """
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        # Slice each day out of time-ordered samples instead of masking the whole array per day
+        order = None
+        if np.any(np.diff(timestamps) < 0):
+            order = np.argsort(timestamps, kind='stable')
+            timestamps = timestamps[order]
+        days = np.floor(timestamps / SECONDS_PER_DAY).astype(np.int64)
+        unique_days = np.unique(days)
+        starts = np.searchsorted(days, unique_days, side='left')
+        ends = np.searchsorted(days, unique_days, side='right')
+        result = np.empty((12, len(timestamps)))
+        for day, start, end in zip(unique_days.tolist(), starts.tolist(), ends.tolist()):
+            x = 2 * (timestamps[start:end] / SECONDS_PER_DAY - day) - 1
+            result[:, start:end] = chebyshev.chebval(x, self._fit_day(day))
+        if order is not None:
+            result[:, order] = result.copy()
+        return result[0:3], result[3:6], result[6:9], result[9:12]
+    
+    def at(self, timestamps: np.ndarray) -> Dict[str, np.ndarray]:
+        """Tidal acceleration and lunar mansion at arbitrary Unix timestamps.
+        
+        Args:
+            timestamps: Array of Unix timestamps (UTC)
             
-            # Calculate lunar mansion index
-            pos = observer.at(t).observe(moon)
-            lon_deg = pos.ecliptic_latlon()[1].degrees
-            mansion_index = int(lon_deg // MANSION_DEGREES) + 1
-            if mansion_index > MANSION_COUNT:
-                mansion_index = 1
+        Returns:
+            Dict of NumPy arrays keyed by the TIDAL_COLUMNS names
+        """
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        d_moon, d_sun, r_obs, moon_topocentric = self.vectors(timestamps)
+        a_total = tidal_acceleration(d_moon, r_obs, GM_MOON) + tidal_acceleration(d_sun, r_obs, GM_SUN)
+        
+        # Ecliptic longitude in the J2000 ecliptic frame, as ecliptic_latlon() reports it
+        x, y, _ = ecliptic_J2000_frame.rotation_at(None) @ moon_topocentric
+        lon_deg = np.degrees(np.arctan2(y, x)) % 360.0
+        mansion = mansion_index(lon_deg)
+        return {
+            'timestamp': timestamps,
+            'tidal_acceleration_x': a_total[0],
+            'tidal_acceleration_y': a_total[1],
+            'tidal_acceleration_z': a_total[2],
+            'magnitude': np.linalg.norm(a_total, axis=0),
+            'moon_ecliptic_longitude': lon_deg,
+            'arabic_mansion_index': mansion,
+        }
+    
+    def query(self, start: Union[datetime, float], end: Union[datetime, float],
+              step_seconds: float = TIDAL_INTERVAL_MINUTES * 60) -> Dict[str, np.ndarray]:
+        """Tidal acceleration and lunar mansion from start to end inclusive.
+        
+        Args:
+            start: Start as a timezone-aware datetime or Unix timestamp
+            end: End as a timezone-aware datetime or Unix timestamp
+            step_seconds: Sampling cadence in seconds
             
-            # Convert datetime to timestamp
-            timestamp = current_time.timestamp()
-            rows.append(f"{timestamp},{a_total[0]:.12e},{a_total[1]:.12e},{a_total[2]:.12e},{magnitude:.12e},{lon_deg:.6f},{mansion_index}\n")
+        Returns:
+            Dict of NumPy arrays keyed by the TIDAL_COLUMNS names
+        """
+        t0 = start.timestamp() if isinstance(start, datetime) else float(start)
+        t1 = end.timestamp() if isinstance(end, datetime) else float(end)
+        count = int((t1 - t0) // step_seconds) + 1 if t1 >= t0 else 0
+        return self.at(t0 + np.arange(count) * step_seconds)
+
+def tidal_sample_count(start_time: datetime, end_time: datetime,
+                       interval_minutes: float = TIDAL_INTERVAL_MINUTES) -> int:
+    """Number of samples between start_time and end_time inclusive at the given interval."""
+    time_diff_minutes = (end_time - start_time).total_seconds() / 60
+    return int(time_diff_minutes / interval_minutes) + 1
+
+def iter_tidal_chunks(start_time: datetime, end_time: datetime,
+                      location_data: Tuple[float, float],
+                      chunk_size: int = TIDAL_CHUNK_SIZE,
+                      interval_minutes: float = TIDAL_INTERVAL_MINUTES) -> Iterator[Dict[str, np.ndarray]]:
+    """Yield tidal acceleration and lunar mansion columns chunk by chunk.
+    
+    Samples are evaluated in chunks of one Skyfield Time array each, so memory
+    is bounded by chunk_size rather than by the date range.
+    
+    Args:
+        start_time: Start datetime for calculation
+        end_time: End datetime for calculation
+        location_data: Tuple of (latitude, longitude)
+        chunk_size: Number of samples evaluated per Time array
+        interval_minutes: Sampling interval (default: TIDAL_INTERVAL_MINUTES)
+        
+    Yields:
+        Dict of NumPy arrays keyed by the TIDAL_COLUMNS names
+    """
+    lat, lon = location_data
+    ts = get_timescale()
+    eph = get_ephemeris()
+    earth, moon, sun = eph['earth'], eph['moon'], eph['sun']
+    topo = wgs84.latlon(lat, lon)
+    observer = earth + topo
+    
+    num_points = tidal_sample_count(start_time, end_time, interval_minutes)
+    step_seconds = interval_minutes * 60
+    start_timestamp = start_time.timestamp()
+    
+    for chunk_start in range(0, num_points, chunk_size):
+        chunk_end = min(chunk_start + chunk_size, num_points)
+        timestamps = start_timestamp + np.arange(chunk_start, chunk_end) * step_seconds
+        t = time_from_unix(ts, timestamps)
+        a_total, magnitude, lon_deg, mansion = calculate_tidal_chunk(t, earth, moon, sun, observer)
+        yield {
+            'timestamp': timestamps,
+            'tidal_acceleration_x': a_total[0],
+            'tidal_acceleration_y': a_total[1],
+            'tidal_acceleration_z': a_total[2],
+            'magnitude': magnitude,
+            'moon_ecliptic_longitude': lon_deg,
+            'arabic_mansion_index': mansion,
+        }
+
+def calculate_tidal_data(start_time: datetime, end_time: datetime, 
+                        location_data: Tuple[float, float],
+                        chunk_size: int = TIDAL_CHUNK_SIZE,
+                        interval_minutes: float = TIDAL_INTERVAL_MINUTES) -> List[str]:
+    """Calculate tidal acceleration and lunar mansion index at regular intervals.
+    
+    Args:
+        start_time: Start datetime for calculation
+        end_time: End datetime for calculation
+        location_data: Tuple of (latitude, longitude)
+        chunk_size: Number of samples evaluated per Time array
+        interval_minutes: Sampling interval (default: TIDAL_INTERVAL_MINUTES)
         
+    Returns:
+        List of CSV-formatted strings for each interval
+    """
+    logger = setup_logging(__name__)
+    try:
+        row_format = ','.join(fmt for _, _, fmt in TIDAL_COLUMNS) + '\n'
+        rows = []
+        for chunk in iter_tidal_chunks(start_time, end_time, location_data, chunk_size, interval_minutes):
+            columns = [chunk[name].tolist() for name, _, _ in TIDAL_COLUMNS]
+            rows.extend(row_format % row for row in zip(*columns))
         return rows
     except Exception as e:
         logger.error(f"Error calculating tidal data: {e}")
         return []
-    finally:
-        if 'eph' in locals():
-            del eph
 
 def parse_args():
     """Parse command line arguments for tidal data calculation."""
@@ -103,48 +389,44 @@ def parse_args():
                        help=f'Latitude (default: {DEFAULT_LOCATION[0]})')
     parser.add_argument('--lon', type=float, default=DEFAULT_LOCATION[1],
                        help=f'Longitude (default: {DEFAULT_LOCATION[1]})')
+    parser.add_argument('--interval-minutes', type=float, default=TIDAL_INTERVAL_MINUTES,
+                       help=f'Sampling interval in minutes (default: {TIDAL_INTERVAL_MINUTES})')
+    parser.add_argument('--format', choices=SINK_FORMATS, default='csv',
+                       help='Output format (default: csv)')
     return parser.parse_args()
 
 def main():
     """Main function for tidal data calculation."""
-    logger = setup_logging()
+    logger = setup_logging(__name__)
     args = parse_args()
     
     logger.info("🌊 Tidal Data & Lunar Mansion Calculator")
     logger.info(f"Calculating tidal data from {args.start_date} to {args.end_date}")
     logger.info(f"Location: {args.lat:.6f}°N, {args.lon:.6f}°E")
-    logger.info(f"Interval: {TIDAL_INTERVAL_MINUTES} minutes")
+    logger.info(f"Interval: {args.interval_minutes:g} minutes")
     
     # Parse dates
     start_time = datetime.strptime(args.start_date, '%Y-%m-%d').replace(tzinfo=utc)
     end_time = datetime.strptime(args.end_date, '%Y-%m-%d').replace(hour=23, minute=59, second=59, tzinfo=utc)
     location_data = (args.lat, args.lon)
     
-    # Calculate tidal data
-    rows = calculate_tidal_data(start_time, end_time, location_data)
-    
-    if rows:
-        # Parse tidal data from CSV format to dictionary format
-        data = []
-        for row in rows:
-            parts = row.strip().split(',')
-            if len(parts) >= 7:
-                data.append({
-                    'timestamp': parts[0],
-                    'tidal_acceleration_x': parts[1],
-                    'tidal_acceleration_y': parts[2], 
-                    'tidal_acceleration_z': parts[3],
-                    'magnitude': parts[4],
-                    'moon_ecliptic_longitude': parts[5],
-                    'arabic_mansion_index': parts[6]
-                })
-        
-        # Write to CSV
-        count = write_csv_file('tidal_lunar_4min.csv', data, 
-                             ['timestamp', 'tidal_acceleration_x', 'tidal_acceleration_y', 'tidal_acceleration_z', 
-                              'magnitude', 'moon_ecliptic_longitude', 'arabic_mansion_index'])
+    # Stream chunks straight to the output file
+    path = os.path.join(OUTPUT_DIR, f"tidal_lunar_{args.interval_minutes:g}min.{args.format}")
+    try:
+        total = tidal_sample_count(start_time, end_time, args.interval_minutes)
+        attrs = {'lat': args.lat, 'lon': args.lon, 'interval_minutes': args.interval_minutes}
+        with open_sink(args.format, path, TIDAL_COLUMNS, total, attrs) as sink:
+            for chunk in iter_tidal_chunks(start_time, end_time, location_data,
+                                           interval_minutes=args.interval_minutes):
+                sink.write(chunk)
+        count = sink.count
+    except Exception as e:
+        logger.error(f"Error calculating tidal data: {e}")
+        count = 0
+    
+    if count:
         logger.info(f"✅ Successfully calculated {count:,} tidal data points")
-        logger.info(f"📄 Results saved to output/tidal_lunar_4min.csv")
+        logger.info(f"📄 Results saved to {path}")
     else:
         logger.warning("⚠️ No tidal data calculated for the specified date range")
 
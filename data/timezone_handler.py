@@ -8,9 +8,16 @@ to support IANA timezone names (e.g., 'Asia/Ho_Chi_Minh', 'America/New_York').
 """
 
 import logging
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Dict, Tuple
+import numpy as np
 import pytz
-from utils import setup_logging
+
+logger = logging.getLogger(__name__)
+
+# UTC offset transition tables shared by every handler of a timezone:
+# name -> (transition epochs, offsets in seconds)
+_OFFSET_TABLES: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
 
 class TimezoneHandler:
     """
@@ -25,12 +32,11 @@ class TimezoneHandler:
             timezone_name: A valid IANA timezone name (e.g., 'Asia/Ho_Chi_Minh').
                            Defaults to 'Asia/Shanghai' (CST, UTC+8).
         """
-        self.logger = setup_logging()
         try:
             self.timezone = pytz.timezone(timezone_name)
-            self.logger.info(f"Using timezone: {timezone_name}")
+            logger.debug("Using timezone: %s", timezone_name)
         except pytz.UnknownTimeZoneError:
-            self.logger.error(f"Unknown timezone: '{timezone_name}'. Defaulting to UTC.")
+            logger.error("Unknown timezone: '%s'. Defaulting to UTC.", timezone_name)
             self.timezone = pytz.utc
             timezone_name = 'UTC'
         self.timezone_name = timezone_name
@@ -68,6 +74,52 @@ class TimezoneHandler:
         
         return utc_datetime.astimezone(self.timezone)
 
+    def utc_offsets(self, epoch_seconds: np.ndarray) -> np.ndarray:
+        """
+        Look up the UTC offset for an array of UTC instants.
+        
+        Uses the timezone's transition table with a binary search, giving the
+        same offsets as utc_to_local() without building datetime objects.
+        
+        Args:
+            epoch_seconds: Array of Unix timestamps (UTC).
+            
+        Returns:
+            Array of UTC offsets in seconds (int64), same shape as the input.
+        """
+        epoch = np.asarray(epoch_seconds, dtype=np.int64)
+        transitions, offsets = self._get_offset_table()
+        index = np.searchsorted(transitions, epoch, side='right') - 1
+        return offsets[np.maximum(index, 0)]
+
+    def _get_offset_table(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Build (transition epochs, offsets in seconds) once per timezone.
+        
+        DST-aware pytz zones are read from pytz's compiled transition list,
+        the same data its astimezone() bisects; pytz has no public accessor for
+        it. Zones without transitions (pytz.utc, Etc/GMT+N) are a single fixed
+        offset.
+        
+        Raises:
+            TypeError: If the timezone is not a pytz timezone.
+        """
+        table = _OFFSET_TABLES.get(self.timezone_name)
+        if table is None:
+            epoch = datetime(1970, 1, 1)
+            second = timedelta(seconds=1)
+            if isinstance(self.timezone, pytz.tzinfo.DstTzInfo):
+                transitions = np.array([(t - epoch) // second for t in self.timezone._utc_transition_times],
+                                       dtype=np.int64)
+                offsets = np.array([info[0] // second for info in self.timezone._transition_info], dtype=np.int64)
+            elif isinstance(self.timezone, (pytz.tzinfo.StaticTzInfo, type(pytz.utc))):
+                transitions = np.array([np.iinfo(np.int64).min], dtype=np.int64)
+                offsets = np.array([self.timezone.utcoffset(None) // second], dtype=np.int64)
+            else:
+                raise TypeError(f"No UTC offset table for {type(self.timezone).__name__}; "
+                                "expected a pytz timezone")
+            table = _OFFSET_TABLES[self.timezone_name] = (transitions, offsets)
+        return table
+
     def parse_local_datetime(self, date_str: str, time_str: str = "12:00") -> datetime:
         """
         Parse date and time strings into a timezone-aware local datetime.
@@ -84,7 +136,7 @@ class TimezoneHandler:
             # Localize the parsed datetime to the handler's timezone
             return self.timezone.localize(naive_dt)
         except ValueError:
-            self.logger.error(f"Invalid date/time format: '{date_str} {time_str}'")
+            logger.error("Invalid date/time format: '%s %s'", date_str, time_str)
             raise
 
     @staticmethod
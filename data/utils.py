@@ -5,31 +5,43 @@ import csv
 import sys
 import json
 import logging
-from typing import List, Dict, Any
+import tempfile
+from typing import List, Dict, Any, Optional
 from config import OUTPUT_DIR
 
-def setup_logging() -> logging.Logger:
+_logging_configured = False
+
+def setup_logging(name: Optional[str] = None) -> logging.Logger:
     """Setup logging configuration.
     
+    Handlers are configured on the first call only, so modules can call this
+    at import time or per function without reconfiguring anything.
+    
+    Args:
+        name: Logger name, normally the caller's __name__ (default: root logger)
+        
     Returns:
-        Configured logger instance
+        Logger for name
     """
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
-    # Ensure StreamHandler uses UTF-8 encoding
-    for handler in logging.getLogger().handlers:
-        if isinstance(handler, logging.StreamHandler):
-            try:
-                handler.setStream(sys.stdout)
-                handler.stream.reconfigure(encoding='utf-8')
-            except Exception:
-                pass
-    return logging.getLogger(__name__)
+    global _logging_configured
+    if not _logging_configured:
+        logging.basicConfig(
+            level=logging.INFO,
+            format='%(asctime)s - %(levelname)s - %(message)s',
+            handlers=[
+                logging.StreamHandler(sys.stdout)
+            ]
+        )
+        # Ensure StreamHandler uses UTF-8 encoding
+        for handler in logging.getLogger().handlers:
+            if isinstance(handler, logging.StreamHandler):
+                try:
+                    handler.setStream(sys.stdout)
+                    handler.stream.reconfigure(encoding='utf-8')
+                except Exception:
+                    pass
+        _logging_configured = True
+    return logging.getLogger(name)
 
 def write_csv_file(filename: str, data: List[Dict[str, Any]], headers: List[str]) -> int:
     """Write data to CSV file with proper directory creation and error handling.
@@ -58,7 +70,8 @@ def write_static_json(file_path: str, data: Any) -> int:
     """Write optimized static JSON data.
 
     This function ensures the parent directory exists and writes the provided
-    data to a JSON file using compact separators to reduce file size.
+    data to a JSON file using compact separators to reduce file size. The file
+    is replaced atomically via a temporary file in the same directory.
 
     Args:
         file_path: Full path (including filename) for the JSON output
@@ -69,9 +82,19 @@ def write_static_json(file_path: str, data: Any) -> int:
     """
     try:
         parent_dir = os.path.dirname(file_path)
-        os.makedirs(parent_dir, exist_ok=True)
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        if parent_dir:
+            os.makedirs(parent_dir, exist_ok=True)
+        # Write to a temp file and rename so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=parent_dir or '.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
         if isinstance(data, list):
             return len(data)
         return 1
@@ -79,6 +102,20 @@ def write_static_json(file_path: str, data: Any) -> int:
         print(f"Error writing {file_path}: {e}")
         return 0
 
+def read_year_chunks(directory: str):
+    """Yield the parsed contents of <year>.json files in year order.
+    
+    Args:
+        directory: Directory of per-year chunks written by write_static_json
+        
+    Yields:
+        Parsed JSON data of each chunk
+    """
+    names = [name for name in os.listdir(directory) if name.endswith('.json') and name[:-5].isdigit()]
+    for name in sorted(names, key=lambda n: int(n[:-5])):
+        with open(os.path.join(directory, name), 'r', encoding='utf-8') as f:
+            yield json.load(f)
+
 def parse_date_args():
     """Parse common date arguments for individual modules.
     